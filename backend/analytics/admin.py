@@ -1,3 +1,9 @@
 from django.contrib import admin
+from .models import UserSkillStat
 
-# Register your models here.
+
+@admin.register(UserSkillStat)
+class UserSkillStatAdmin(admin.ModelAdmin):
+    list_display = ['id', 'user', 'skill_tag', 'attempts', 'ewma', 'last_practiced_at']
+    search_fields = ['user__email', 'skill_tag']
+    readonly_fields = ['id', 'updated_at']
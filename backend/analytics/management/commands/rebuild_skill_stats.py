@@ -0,0 +1,46 @@
+"""
+Management command to rebuild the per-user skill rollup (UserSkillStat).
+
+The rollup is updated when a session finishes; rebuild it after a deploy
+that introduces it, or after changing SKILL_STAT_EWMA_ALPHA.
+"""
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from interviews.models import InterviewSession
+from analytics.services.skill_stats import rebuild_user_skill_stats
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = 'Rebuild per-user skill mastery stats from completed session reports'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--user',
+            type=str,
+            default=None,
+            help='Email of a single user to rebuild (default: every user with a completed session)'
+        )
+    
+    def handle(self, *args, **options):
+        if options['user']:
+            try:
+                user_ids = [User.objects.get(email=options['user']).id]
+            except User.DoesNotExist:
+                raise CommandError(f"User {options['user']} not found")
+        else:
+            user_ids = list(
+                InterviewSession.objects.filter(status='completed')
+                .values_list('user_id', flat=True)
+                .distinct()
+                .order_by('user_id')
+            )
+        
+        users = 0
+        skills = 0
+        for user_id in user_ids:
+            skills += len(rebuild_user_skill_stats(user_id))
+            users += 1
+        
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt {skills} skill stats for {users} users'))
@@ -0,0 +1,38 @@
+# Generated by Django 4.2.30 on 2026-10-19 09:14
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserSkillStat',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('skill_tag', models.CharField(max_length=255)),
+                ('attempts', models.PositiveIntegerField(default=0, help_text='Completed sessions that practiced the skill')),
+                ('score_sum', models.FloatField(default=0.0, help_text='Sum of the per-session skill scores')),
+                ('ewma', models.FloatField(default=0.0, help_text='Exponentially weighted moving average of the per-session skill scores')),
+                ('last_practiced_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='skill_stats', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'User Skill Stat',
+                'verbose_name_plural': 'User Skill Stats',
+                'db_table': 'user_skill_stats',
+                'ordering': ['skill_tag'],
+                'unique_together': {('user', 'skill_tag')},
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-19 09:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userskillstat',
+            name='scores_json',
+            field=models.JSONField(default=list, help_text='Per-session skill scores, oldest session first'),
+        ),
+    ]
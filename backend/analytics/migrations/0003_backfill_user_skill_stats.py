@@ -0,0 +1,47 @@
+from django.conf import settings
+from django.db import migrations
+
+from analytics.services.skill_series import build_skill_series, skill_series_rows
+
+
+def backfill_skill_stats(apps, schema_editor):
+    """Build the skill rollup of every user from their completed sessions."""
+    UserSkillStat = apps.get_model('analytics', 'UserSkillStat')
+    InterviewAnswer = apps.get_model('interviews', 'InterviewAnswer')
+    InterviewSession = apps.get_model('interviews', 'InterviewSession')
+    alpha = getattr(settings, 'SKILL_STAT_EWMA_ALPHA', 0.3)
+    
+    user_ids = InterviewSession.objects.filter(status='completed').values_list(
+        'user_id', flat=True
+    ).order_by().distinct()
+    
+    for user_id in user_ids:
+        series = build_skill_series(skill_series_rows(InterviewAnswer.objects, user_id).iterator())
+        stats = []
+        for skill_tag, skill in series.items():
+            ewma = skill.scores[0]
+            for score in skill.scores[1:]:
+                ewma = alpha * score + (1 - alpha) * ewma
+            stats.append(UserSkillStat(
+                user_id=user_id,
+                skill_tag=skill_tag,
+                attempts=skill.attempts,
+                score_sum=sum(skill.scores),
+                ewma=ewma,
+                scores_json=skill.scores,
+                last_practiced_at=max(filter(None, skill.practiced_at), default=None),
+            ))
+        UserSkillStat.objects.filter(user_id=user_id).delete()
+        UserSkillStat.objects.bulk_create(stats)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0002_userskillstat_scores_json'),
+        ('interviews', '0013_session_history_index'),
+    ]
+    
+    operations = [
+        migrations.RunPython(backfill_skill_stats, migrations.RunPython.noop),
+    ]
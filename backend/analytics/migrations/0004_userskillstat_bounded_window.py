@@ -0,0 +1,50 @@
+# Generated by Django 4.2.30 on 2026-10-19 10:02
+
+from django.db import migrations, models
+
+from analytics.services.skill_series import IMPROVEMENT_WINDOW
+
+
+def fill_windows(apps, schema_editor):
+    """Derive the running sums and the recent window from the full score lists."""
+    UserSkillStat = apps.get_model('analytics', 'UserSkillStat')
+    
+    stats = list(UserSkillStat.objects.all())
+    for stat in stats:
+        scores = stat.scores_json
+        stat.weighted_sum = sum(score * (i + 1) for i, score in enumerate(reversed(scores)))
+        stat.first_window_sum = sum(scores[:IMPROVEMENT_WINDOW])
+        stat.recent_scores_json = scores[-2 * IMPROVEMENT_WINDOW:]
+    UserSkillStat.objects.bulk_update(
+        stats, ['weighted_sum', 'first_window_sum', 'recent_scores_json'], batch_size=500
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0003_backfill_user_skill_stats'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userskillstat',
+            name='first_window_sum',
+            field=models.FloatField(default=0.0, help_text='Sum of the first IMPROVEMENT_WINDOW session scores'),
+        ),
+        migrations.AddField(
+            model_name='userskillstat',
+            name='recent_scores_json',
+            field=models.JSONField(default=list, help_text='Last 2 * IMPROVEMENT_WINDOW session scores, oldest first'),
+        ),
+        migrations.AddField(
+            model_name='userskillstat',
+            name='weighted_sum',
+            field=models.FloatField(default=0.0, help_text='Sum of the session scores weighted 1, 2, 3, ... from the newest session (rolling score)'),
+        ),
+        migrations.RunPython(fill_windows, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='userskillstat',
+            name='scores_json',
+        ),
+    ]
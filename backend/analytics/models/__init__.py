@@ -0,0 +1,3 @@
+from .user_skill_stat import UserSkillStat
+
+__all__ = ['UserSkillStat']
@@ -0,0 +1,55 @@
+from django.conf import settings
+from django.db import models
+import uuid
+
+
+class UserSkillStat(models.Model):
+    """Running per-user mastery of a skill tag, updated when a session finishes."""
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='skill_stats'
+    )
+    skill_tag = models.CharField(max_length=255)
+    attempts = models.PositiveIntegerField(
+        default=0,
+        help_text="Completed sessions that practiced the skill"
+    )
+    score_sum = models.FloatField(
+        default=0.0,
+        help_text="Sum of the per-session skill scores"
+    )
+    ewma = models.FloatField(
+        default=0.0,
+        help_text="Exponentially weighted moving average of the per-session skill scores"
+    )
+    weighted_sum = models.FloatField(
+        default=0.0,
+        help_text="Sum of the session scores weighted 1, 2, 3, ... from the newest session (rolling score)"
+    )
+    first_window_sum = models.FloatField(
+        default=0.0,
+        help_text="Sum of the first IMPROVEMENT_WINDOW session scores"
+    )
+    recent_scores_json = models.JSONField(
+        default=list,
+        help_text="Last 2 * IMPROVEMENT_WINDOW session scores, oldest first"
+    )
+    last_practiced_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        db_table = 'user_skill_stats'
+        verbose_name = 'User Skill Stat'
+        verbose_name_plural = 'User Skill Stats'
+        unique_together = ['user', 'skill_tag']
+        ordering = ['skill_tag']
+    
+    def __str__(self):
+        return f"{self.skill_tag} for {self.user_id}"
+    
+    @property
+    def mastery(self) -> float:
+        """Plain average of the per-session skill scores."""
+        return round(self.score_sum / self.attempts, 2) if self.attempts else 0.0
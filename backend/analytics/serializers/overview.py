@@ -23,4 +23,5 @@ class OverviewStatsSerializer(serializers.Serializer):
             child=serializers.CharField()
         )
     )
-
+    followup_handling_score = serializers.FloatField()
+    pressure_score = serializers.FloatField()
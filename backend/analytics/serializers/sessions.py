@@ -1,16 +1,28 @@
 from rest_framework import serializers
-import uuid
-from interviews.serializers import InterviewSessionSerializer
 
 
 class SessionHistorySerializer(serializers.Serializer):
-    """Serializer for session history."""
+    """
+    Lean serializer for session history rows.
+    
+    Reads the dictionaries of session_history.get_session_page (one query
+    per page) instead of model instances with nested serializers.
+    """
     id = serializers.UUIDField()
-    role_selected = serializers.DictField()
+    role = serializers.CharField(source='role_selected__name', allow_null=True)
     type = serializers.CharField()
     level = serializers.CharField()
-    overall_score = serializers.IntegerField(allow_null=True)
+    score = serializers.IntegerField(source='overall_score', allow_null=True)
+    date = serializers.SerializerMethodField()
     started_at = serializers.DateTimeField()
-    ended_at = serializers.DateTimeField(allow_null=True)
-    progress = serializers.DictField(allow_null=True)
+    progress = serializers.SerializerMethodField()
 
+    def get_date(self, obj):
+        """When the session ended (or started, if it never recorded an end)."""
+        return serializers.DateTimeField().to_representation(obj['ended_at'] or obj['started_at'])
+
+    def get_progress(self, obj):
+        return {
+            'answered': obj['answered_count'],
+            'total_questions': obj['question_count'],
+        }
@@ -5,6 +5,7 @@ class SkillStatsSerializer(serializers.Serializer):
     """Serializer for skill-level analytics."""
     tag = serializers.CharField()
     rolling_score = serializers.FloatField()
+    ewma = serializers.FloatField()
     attempts = serializers.IntegerField()
     last_practiced_at = serializers.DateTimeField()
     trend = serializers.CharField()
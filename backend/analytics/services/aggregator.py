@@ -1,14 +1,15 @@
 from typing import Dict, List
 from django.contrib.auth import get_user_model
-from interviews.models import InterviewSession
-from interviews.services.report import generate_report
+from django.db.models import Avg, Count, Q
+from interviews.models import InterviewSession, InterviewAnswer
+from .skill_stats import get_user_skill_stats
 
 User = get_user_model()
 
 
 def get_session_stats(user) -> Dict:
     """
-    Returns session-level stats for a user.
+    Returns session-level stats for a user, from one aggregate query.
     
     Args:
         user: User instance
@@ -16,20 +17,18 @@ def get_session_stats(user) -> Dict:
     Returns:
         Dictionary with total_sessions, completed_sessions, average_score
     """
-    all_sessions = InterviewSession.objects.filter(user=user)
-    completed_sessions = all_sessions.filter(status='completed')
-    
-    total_sessions = all_sessions.count()
-    completed_count = completed_sessions.count()
+    stats = InterviewSession.objects.filter(user=user).aggregate(
+        total_sessions=Count('id'),
+        completed_sessions=Count('id', filter=Q(status='completed')),
+        average_score=Avg('overall_score', filter=Q(status='completed')),
+    )
     
-    # Calculate average score from completed sessions
-    scores = [s.overall_score for s in completed_sessions if s.overall_score is not None]
-    average_score = round(sum(scores) / len(scores), 2) if scores else 0.0
+    average_score = stats['average_score']
     
     return {
-        'total_sessions': total_sessions,
-        'completed_sessions': completed_count,
-        'average_score': average_score,
+        'total_sessions': stats['total_sessions'],
+        'completed_sessions': stats['completed_sessions'],
+        'average_score': round(average_score, 2) if average_score is not None else 0.0,
     }
 
 
@@ -57,44 +56,22 @@ def get_skill_map_stats(user) -> Dict:
     """
     Returns skill coverage and mastery data.
     
+    Read from the UserSkillStat rollup maintained when sessions finish.
+    
     Args:
         user: User instance
         
     Returns:
         Dictionary with skill coverage and mastery information
     """
-    completed_sessions = InterviewSession.objects.filter(
-        user=user,
-        status='completed'
-    )
-    
-    # Collect all skill tags from all sessions
-    all_skills = {}
-    
-    for session in completed_sessions:
-        report = generate_report(str(session.id))
-        if report and 'skill_breakdown' in report:
-            skill_breakdown = report['skill_breakdown']
-            for skill_tag, score in skill_breakdown.items():
-                if skill_tag not in all_skills:
-                    all_skills[skill_tag] = {
-                        'scores': [],
-                        'sessions': [],
-                    }
-                all_skills[skill_tag]['scores'].append(score)
-                all_skills[skill_tag]['sessions'].append(session)
-    
-    # Calculate mastery (rolling average) for each skill
-    skill_mastery = {}
-    for skill_tag, data in all_skills.items():
-        if data['scores']:
-            # Simple average for now (can be weighted by recency later)
-            mastery = round(sum(data['scores']) / len(data['scores']), 2)
-            skill_mastery[skill_tag] = {
-                'mastery': mastery,
-                'attempts': len(data['scores']),
-                'last_practiced': max([s.ended_at or s.started_at for s in data['sessions']]),
-            }
+    skill_mastery = {
+        stat.skill_tag: {
+            'mastery': stat.mastery,
+            'attempts': stat.attempts,
+            'last_practiced': stat.last_practiced_at,
+        }
+        for stat in get_user_skill_stats(user)
+    }
     
     return {
         'skill_mastery': skill_mastery,
@@ -104,7 +81,10 @@ def get_skill_map_stats(user) -> Dict:
 
 def get_interview_realism_stats(user) -> Dict:
     """
-    Returns follow-up and pressure scores (optional for MVP).
+    Returns follow-up and pressure scores.
+    
+    Answers to follow-up and hard questions of all completed sessions are
+    read in one joined query.
     
     Args:
         user: User instance
@@ -112,50 +92,27 @@ def get_interview_realism_stats(user) -> Dict:
     Returns:
         Dictionary with follow-up handling and pressure scores
     """
-    completed_sessions = InterviewSession.objects.filter(
-        user=user,
-        status='completed'
-    )
+    rows = InterviewAnswer.objects.filter(
+        Q(question__is_followup=True) | Q(question__difficulty='hard'),
+        question__session__user=user,
+        question__session__status='completed'
+    ).values_list('question__is_followup', 'question__difficulty', 'scores_json')
     
     followup_scores = []
     pressure_scores = []
     
-    for session in completed_sessions:
-        # Get answers with follow-up questions
-        from interviews.models import InterviewAnswer, InterviewQuestion
-        
-        followup_questions = InterviewQuestion.objects.filter(
-            session=session,
-            is_followup=True
-        )
+    for is_followup, difficulty, scores in rows:
+        scores = scores or {}
         
-        for question in followup_questions:
-            try:
-                answer = question.answer
-                scores = answer.scores_json or {}
-                if scores:
-                    avg_score = sum(scores.values()) / len(scores)
-                    followup_scores.append(avg_score)
-            except InterviewAnswer.DoesNotExist:
-                pass
+        # Average score of answers to follow-up questions
+        if is_followup and scores:
+            followup_scores.append(sum(scores.values()) / len(scores))
         
-        # Get answers to hard questions (pressure)
-        hard_questions = InterviewQuestion.objects.filter(
-            session=session,
-            difficulty='hard'
-        )
-        
-        for question in hard_questions:
-            try:
-                answer = question.answer
-                scores = answer.scores_json or {}
-                if 'depth' in scores:
-                    pressure_scores.append(scores['depth'])
-            except InterviewAnswer.DoesNotExist:
-                pass
+        # Depth of answers to hard questions (pressure)
+        if difficulty == 'hard' and 'depth' in scores:
+            pressure_scores.append(scores['depth'])
     
     return {
         'followup_handling_score': round(sum(followup_scores) / len(followup_scores), 2) if followup_scores else 0.0,
         'pressure_score': round(sum(pressure_scores) / len(pressure_scores), 2) if pressure_scores else 0.0,
     }
-
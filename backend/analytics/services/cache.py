@@ -0,0 +1,95 @@
+"""
+Per-user analytics version and response cache.
+
+Analytics responses only change when the user's sessions or answers do. Each
+user has a version number in the cache, bumped after a session is created,
+an answer is submitted or a session finishes; cached responses are keyed by
+it, so a bump invalidates all of them without deleting anything.
+
+The version is a millisecond timestamp of the last change, so it also gives
+the Last-Modified time, and a version lost to eviction restarts above every
+earlier one. The cache must be shared by every process that bumps or reads
+versions (web workers, Celery workers, management commands), which the
+Redis default of CACHES is; a locmem cache only suits a single process.
+
+Keys also carry ANALYTICS_PAYLOAD_VERSION: bump it whenever the shape or
+meaning of a cached payload changes, so a deploy never serves payloads
+cached by the previous code.
+"""
+import time
+from typing import Any, Callable
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+# Schema version of the cached payloads (part of every payload key and ETag)
+ANALYTICS_PAYLOAD_VERSION = 2
+
+
+def get_analytics_version(user_id) -> int:
+    """
+    Current analytics version of a user.
+    
+    Args:
+        user_id: User id
+    
+    Returns:
+        Version number (milliseconds since the epoch of the last change)
+    """
+    key = _version_key(user_id)
+    version = cache.get(key)
+    if version is None:
+        version = _now_ms()
+        if not cache.add(key, version, timeout=None):
+            version = cache.get(key, version)
+    return version
+
+
+def bump_analytics_version(user_id) -> int:
+    """
+    Invalidate a user's cached analytics.
+    
+    Args:
+        user_id: User id
+    
+    Returns:
+        The new version
+    """
+    key = _version_key(user_id)
+    version = max(_now_ms(), (cache.get(key) or 0) + 1)
+    cache.set(key, version, timeout=None)
+    return version
+
+
+def schedule_analytics_bump(user_id):
+    """Bump the version once the current transaction commits, so readers never cache uncommitted data."""
+    transaction.on_commit(lambda: bump_analytics_version(user_id))
+
+
+def get_or_build(user_id, name: str, version: int, build: Callable[[], Any]) -> Any:
+    """
+    Cached analytics payload for a version, built on a miss.
+    
+    Args:
+        user_id: User id
+        name: Payload name (e.g. 'overview')
+        version: Analytics version the payload belongs to
+        build: Callable computing the payload
+    
+    Returns:
+        The payload
+    """
+    key = f'analytics:v{ANALYTICS_PAYLOAD_VERSION}:{name}:{user_id}:{version}'
+    payload = cache.get(key)
+    if payload is None:
+        payload = build()
+        cache.set(key, payload, getattr(settings, 'ANALYTICS_CACHE_SECONDS', 86400))
+    return payload
+
+
+def _version_key(user_id) -> str:
+    return f'analytics-version:{user_id}'
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
@@ -1,114 +1,87 @@
-from typing import Dict, List
+from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 from django.contrib.auth import get_user_model
+from django.db.models import Avg, DateField, QuerySet
+from django.db.models.functions import Coalesce, TruncDate, TruncWeek
 from interviews.models import InterviewSession
-from interviews.services.report import generate_report
+from .skill_stats import get_skill_analytics
 
 User = get_user_model()
 
 
-def calculate_score_trend(sessions: List[InterviewSession]) -> List[Dict]:
+TREND_BUCKETS = {
+    'day': TruncDate,
+    'week': TruncWeek,
+}
+
+
+def calculate_score_trend(sessions: QuerySet, bucket: Optional[str] = None) -> List[Dict]:
     """
     Calculate score trend over time for line chart data.
     
     Args:
-        sessions: List of InterviewSession instances (should be ordered by date)
+        sessions: InterviewSession queryset (should be ordered by date)
+        bucket: None for one point per session, or 'day'/'week' for the
+            average score per period (grouped in the database)
         
     Returns:
         List of dictionaries with date and score: [{"date": "YYYY-MM-DD", "score": int}, ...]
     """
-    trend_data = []
+    scored = sessions.filter(overall_score__isnull=False)
     
-    for session in sessions:
-        if session.overall_score is not None:
+    if bucket is None:
+        trend_data = []
+        for ended_at, started_at, score in scored.values_list('ended_at', 'started_at', 'overall_score'):
             # Use ended_at if available, otherwise started_at
-            date = session.ended_at or session.started_at
+            date = ended_at or started_at
             trend_data.append({
                 'date': date.strftime('%Y-%m-%d'),
-                'score': session.overall_score,
+                'score': score,
             })
+        return trend_data
     
-    return trend_data
+    truncate = TREND_BUCKETS[bucket]
+    periods = scored.annotate(
+        period=truncate(Coalesce('ended_at', 'started_at'), output_field=DateField())
+    ).values('period').annotate(score=Avg('overall_score')).order_by('period')
+    
+    return [
+        {
+            'date': row['period'].strftime('%Y-%m-%d'),
+            'score': round(row['score'], 2),
+        }
+        for row in periods
+    ]
 
 
-def calculate_category_trend(sessions: List[InterviewSession]) -> Dict:
+def calculate_category_trend(sessions: QuerySet) -> Dict:
     """
     Calculate average scores by interview type.
     
     Args:
-        sessions: List of InterviewSession instances
+        sessions: InterviewSession queryset
         
     Returns:
         Dictionary with average scores by type: {"hr": float, "technical": float, "case": float, "mixed": float}
     """
-    category_scores = {
-        'hr': [],
-        'technical': [],
-        'case': [],
-        'mixed': [],
+    category_trend = {
+        'hr': 0.0,
+        'technical': 0.0,
+        'case': 0.0,
+        'mixed': 0.0,
     }
     
-    for session in sessions:
-        if session.overall_score is not None:
-            session_type = session.type
-            if session_type in category_scores:
-                category_scores[session_type].append(session.overall_score)
+    averages = sessions.filter(
+        overall_score__isnull=False,
+        type__in=list(category_trend)
+    ).values('type').annotate(average=Avg('overall_score')).order_by()
     
-    category_trend = {}
-    for category, scores in category_scores.items():
-        if scores:
-            category_trend[category] = round(sum(scores) / len(scores), 2)
-        else:
-            category_trend[category] = 0.0
+    for row in averages:
+        category_trend[row['type']] = round(row['average'], 2)
     
     return category_trend
 
 
-def calculate_skill_mastery(user, skill_tag: str) -> float:
-    """
-    Calculate rolling average score for a skill (weighted by recency).
-    
-    Args:
-        user: User instance
-        skill_tag: Skill tag string (e.g., "communication.star")
-        
-    Returns:
-        Rolling average score (0-5 scale)
-    """
-    completed_sessions = InterviewSession.objects.filter(
-        user=user,
-        status='completed'
-    ).order_by('-ended_at', '-started_at')
-    
-    skill_scores = []
-    
-    for session in completed_sessions:
-        report = generate_report(str(session.id))
-        if report and 'skill_breakdown' in report:
-            skill_breakdown = report['skill_breakdown']
-            if skill_tag in skill_breakdown:
-                skill_scores.append(skill_breakdown[skill_tag])
-    
-    if not skill_scores:
-        return 0.0
-    
-    # Weight recent scores more heavily
-    if len(skill_scores) == 1:
-        return round(skill_scores[0], 2)
-    
-    # Simple weighted average: recent scores get higher weight
-    weights = []
-    for i in range(len(skill_scores)):
-        # More recent = higher weight (linear weighting)
-        weight = (i + 1) / len(skill_scores)
-        weights.append(weight)
-    
-    weighted_sum = sum(score * weight for score, weight in zip(skill_scores, weights))
-    total_weight = sum(weights)
-    
-    return round(weighted_sum / total_weight, 2) if total_weight > 0 else 0.0
-
-
 def identify_next_skill(user) -> Dict:
     """
     Identify skill with highest impact, lowest score.
@@ -137,69 +110,27 @@ def identify_next_skill(user) -> Dict:
     }
 
 
-def calculate_skill_improvement(user, skill_tag: str) -> float:
-    """
-    Calculate improvement percentage over time for a skill.
-    
-    Args:
-        user: User instance
-        skill_tag: Skill tag string
-        
-    Returns:
-        Improvement percentage (can be negative if declining)
-    """
-    completed_sessions = InterviewSession.objects.filter(
-        user=user,
-        status='completed'
-    ).order_by('ended_at', 'started_at')
-    
-    skill_scores = []
-    
-    for session in completed_sessions:
-        report = generate_report(str(session.id))
-        if report and 'skill_breakdown' in report:
-            skill_breakdown = report['skill_breakdown']
-            if skill_tag in skill_breakdown:
-                skill_scores.append(skill_breakdown[skill_tag])
-    
-    if len(skill_scores) < 2:
-        return 0.0
-    
-    # Compare first half vs second half
-    mid_point = len(skill_scores) // 2
-    first_half_avg = sum(skill_scores[:mid_point]) / len(skill_scores[:mid_point])
-    second_half_avg = sum(skill_scores[mid_point:]) / len(skill_scores[mid_point:])
-    
-    if first_half_avg == 0:
-        return 0.0
-    
-    improvement = ((second_half_avg - first_half_avg) / first_half_avg) * 100
-    return round(improvement, 2)
-
-
-def get_top_improving_skills(user, limit: int = 5) -> List[Dict]:
+def get_top_improving_skills(user, limit: int = 5, skills: List[Dict] = None) -> List[Dict]:
     """
     Get top skills showing improvement.
     
     Args:
         user: User instance
         limit: Number of skills to return
+        skills: Optional get_skill_analytics result already read for the user
         
     Returns:
         List of dictionaries with skill and improvement percentage
     """
-    from .aggregator import get_skill_map_stats
-    
-    skill_map = get_skill_map_stats(user)
-    skill_mastery = skill_map.get('skill_mastery', {})
+    if skills is None:
+        skills = get_skill_analytics(user)
     
     improvements = []
-    for skill_tag in skill_mastery.keys():
-        improvement = calculate_skill_improvement(user, skill_tag)
-        if improvement > 0:  # Only include improving skills
+    for skill in skills:
+        if skill['improvement'] > 0:  # Only include improving skills
             improvements.append({
-                'skill': skill_tag,
-                'improvement': improvement,
+                'skill': skill['tag'],
+                'improvement': skill['improvement'],
             })
     
     # Sort by improvement (descending) and return top N
@@ -207,51 +138,26 @@ def get_top_improving_skills(user, limit: int = 5) -> List[Dict]:
     return improvements[:limit]
 
 
-def get_top_weak_skills(user, limit: int = 5) -> List[Dict]:
+def get_top_weak_skills(user, limit: int = 5, skills: List[Dict] = None) -> List[Dict]:
     """
     Get top skills with lowest scores.
     
     Args:
         user: User instance
         limit: Number of skills to return
+        skills: Optional get_skill_analytics result already read for the user
         
     Returns:
         List of dictionaries with skill and score
     """
-    from .aggregator import get_skill_map_stats
-    
-    skill_map = get_skill_map_stats(user)
-    skill_mastery = skill_map.get('skill_mastery', {})
+    if skills is None:
+        skills = get_skill_analytics(user)
     
-    weak_skills = []
-    for skill_tag, data in skill_mastery.items():
-        weak_skills.append({
-            'skill': skill_tag,
-            'score': data['mastery'],
-        })
+    weak_skills = [
+        {'skill': skill['tag'], 'score': skill['mastery']}
+        for skill in skills
+    ]
     
     # Sort by score (ascending) and return top N
     weak_skills.sort(key=lambda x: x['score'])
     return weak_skills[:limit]
-
-
-def calculate_skill_trend(user, skill_tag: str) -> str:
-    """
-    Determine if a skill is improving, declining, or stable.
-    
-    Args:
-        user: User instance
-        skill_tag: Skill tag string
-        
-    Returns:
-        "improving", "declining", or "stable"
-    """
-    improvement = calculate_skill_improvement(user, skill_tag)
-    
-    if improvement > 5:  # More than 5% improvement
-        return "improving"
-    elif improvement < -5:  # More than 5% decline
-        return "declining"
-    else:
-        return "stable"
-
@@ -0,0 +1,107 @@
+"""
+Keyset-paginated session history.
+
+Pages are ordered by (started_at, id) descending and continue from an
+opaque cursor holding the last row's key, so a deep page costs the same as
+the first one (served by session_user_history_idx). Rows are read with
+.values() for the lean history serializer. The total count is only
+computed on request and cached under the user's analytics version.
+"""
+import base64
+import binascii
+import uuid
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from django.db.models import Q, QuerySet
+from interviews.models import InterviewSession
+from .cache import get_analytics_version, get_or_build
+
+HISTORY_FIELDS = [
+    'id', 'role_selected__name', 'type', 'level', 'overall_score',
+    'started_at', 'ended_at', 'question_count', 'answered_count',
+]
+
+
+class InvalidCursor(ValueError):
+    """The cursor was not produced by encode_cursor."""
+
+
+def completed_sessions(user, interview_type: Optional[str] = None) -> QuerySet:
+    """A user's completed sessions, optionally of one interview type."""
+    queryset = InterviewSession.objects.filter(user=user, status='completed')
+    if interview_type:
+        queryset = queryset.filter(type=interview_type)
+    return queryset
+
+
+def get_session_page(queryset: QuerySet, limit: int, cursor: Optional[str] = None) -> Tuple[List[Dict], Optional[str]]:
+    """
+    One page of sessions, newest first.
+    
+    Args:
+        queryset: InterviewSession queryset to paginate
+        limit: Page size
+        cursor: next_cursor of the previous page, or None for the first page
+    
+    Returns:
+        (rows, next_cursor); next_cursor is None on the last page
+    
+    Raises:
+        InvalidCursor: If the cursor cannot be decoded
+    """
+    if cursor:
+        started_at, session_id = decode_cursor(cursor)
+        queryset = queryset.filter(
+            Q(started_at__lt=started_at) |
+            Q(started_at=started_at, id__lt=session_id)
+        )
+    
+    # One extra row tells whether another page follows
+    rows = list(queryset.order_by('-started_at', '-id').values(*HISTORY_FIELDS)[:limit + 1])
+    
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1]['started_at'], rows[-1]['id'])
+    
+    return rows, next_cursor
+
+
+def get_session_count(user, interview_type: Optional[str] = None) -> int:
+    """
+    Number of completed sessions, cached until the user's analytics change.
+    
+    Args:
+        user: User instance
+        interview_type: Optional interview type filter
+    
+    Returns:
+        Session count
+    """
+    return get_or_build(
+        user.id,
+        f'session-count-{interview_type or "all"}',
+        get_analytics_version(user.id),
+        lambda: completed_sessions(user, interview_type).count()
+    )
+
+
+def encode_cursor(started_at: datetime, session_id) -> str:
+    """Opaque cursor for the position after a row."""
+    raw = f'{started_at.isoformat()}|{session_id}'
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    """
+    Key of the row a cursor points after.
+    
+    Raises:
+        InvalidCursor: If the cursor cannot be decoded
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        started_at, session_id = raw.split('|')
+        return datetime.fromisoformat(started_at), uuid.UUID(session_id)
+    except (binascii.Error, UnicodeError, ValueError):
+        raise InvalidCursor(cursor)
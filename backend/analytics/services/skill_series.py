@@ -0,0 +1,184 @@
+"""
+Per-skill score series of a user, loaded in one pass.
+
+One query reads every answer of the user's completed sessions in
+chronological session order. Answers are averaged per skill tag within each
+session exactly as the session report does (report.SkillAccumulator), giving
+each skill a series of per-session scores. Mastery, the recency-weighted
+rolling score, the half-split improvement and the trend of a skill are
+computed from its series. The formulas only need running sums and the
+scores at both ends of the series, so the skill rollup (skill_stats) keeps
+those instead of the whole series and gives the same results.
+"""
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Iterable, List, Tuple
+from interviews.models import InterviewAnswer
+from interviews.services.report import SkillAccumulator
+
+# Improvement (percent) above which a skill is improving, below minus which declining
+TREND_THRESHOLD = 5
+
+# Improvement compares at most this many sessions at each end of the series
+IMPROVEMENT_WINDOW = 10
+
+
+def weighted_rolling_score(weighted_sum: float, attempts: int) -> float:
+    """
+    Rolling score from the weighted sum of a series.
+    
+    Walking the sessions newest first, the i-th (from 0) has weight
+    (i + 1) / attempts, so the weights add up to (attempts + 1) / 2.
+    
+    Args:
+        weighted_sum: Sum of score * (i + 1) over the sessions, newest first
+        attempts: Number of sessions
+    
+    Returns:
+        Weighted average rounded to 2 decimals
+    """
+    if not attempts:
+        return 0.0
+    return round(2 * weighted_sum / (attempts * (attempts + 1)), 2)
+
+
+def improvement_windows(attempts: int) -> Tuple[int, int]:
+    """Sizes of the first and last windows improvement compares (0 if it needs none)."""
+    if attempts < 2:
+        return 0, 0
+    mid_point = attempts // 2
+    return min(mid_point, IMPROVEMENT_WINDOW), min(attempts - mid_point, IMPROVEMENT_WINDOW)
+
+
+def window_improvement(first_sum: float, first_count: int, last_sum: float, last_count: int) -> float:
+    """Percentage change from the average of the first window to the last one."""
+    if not first_count or not last_count:
+        return 0.0
+    
+    first_avg = first_sum / first_count
+    if first_avg == 0:
+        return 0.0
+    
+    return round((last_sum / last_count - first_avg) / first_avg * 100, 2)
+
+
+def improvement_trend(improvement: float) -> str:
+    """Classify an improvement as improving, declining, or stable."""
+    if improvement > TREND_THRESHOLD:
+        return "improving"
+    elif improvement < -TREND_THRESHOLD:
+        return "declining"
+    return "stable"
+
+
+@dataclass
+class SkillSeries:
+    """Per-session scores of one skill tag, oldest session first."""
+    tag: str
+    scores: List[float] = field(default_factory=list)
+    practiced_at: List[datetime] = field(default_factory=list)
+    
+    @property
+    def attempts(self) -> int:
+        return len(self.scores)
+    
+    @property
+    def last_practiced(self) -> datetime:
+        return max(self.practiced_at)
+    
+    def mastery(self) -> float:
+        """Plain average of the session scores."""
+        return round(sum(self.scores) / len(self.scores), 2) if self.scores else 0.0
+    
+    def rolling_score(self) -> float:
+        """Linearly weighted average, walking the sessions newest first."""
+        weighted_sum = sum(score * (i + 1) for i, score in enumerate(reversed(self.scores)))
+        return weighted_rolling_score(weighted_sum, len(self.scores))
+    
+    def improvement(self) -> float:
+        """
+        Percentage change from the first half of the sessions to the second half.
+        
+        Each half is capped at the IMPROVEMENT_WINDOW sessions at its end of
+        the series, so a long history compares its first and latest sessions.
+        """
+        first_count, last_count = improvement_windows(len(self.scores))
+        return window_improvement(
+            sum(self.scores[:first_count]), first_count,
+            sum(self.scores[len(self.scores) - last_count:]), last_count
+        )
+    
+    def trend(self) -> str:
+        """Classify the skill as improving, declining, or stable from its improvement."""
+        return improvement_trend(self.improvement())
+
+
+def load_skill_series(user_id) -> Dict[str, SkillSeries]:
+    """
+    Build the score series of every skill a user practiced, from one query.
+    
+    Args:
+        user_id: User id
+    
+    Returns:
+        Dictionary mapping skill tag to SkillSeries
+    """
+    return build_skill_series(skill_series_rows(InterviewAnswer.objects, user_id).iterator())
+
+
+def skill_series_rows(answers, user_id):
+    """
+    Answer rows of a user's completed sessions, in chronological session order.
+    
+    Args:
+        answers: InterviewAnswer manager (the historical model in migrations)
+        user_id: User id
+    
+    Returns:
+        values_list queryset of (session id, ended_at, started_at, skill tags, scores)
+    """
+    return answers.filter(
+        question__session__user_id=user_id,
+        question__session__status='completed'
+    ).order_by(
+        'question__session__ended_at', 'question__session__started_at', 'question__session_id'
+    ).values_list(
+        'question__session_id', 'question__session__ended_at', 'question__session__started_at',
+        'skill_tags_json', 'scores_json'
+    )
+
+
+def build_skill_series(rows: Iterable[Tuple]) -> Dict[str, SkillSeries]:
+    """
+    Group answer rows into per-skill series, averaging each session like its report.
+    
+    Args:
+        rows: (session id, ended_at, started_at, skill tags, scores) tuples,
+            grouped by session in chronological order
+    
+    Returns:
+        Dictionary mapping skill tag to SkillSeries
+    """
+    series: Dict[str, SkillSeries] = {}
+    current_session = None
+    practiced_at = None
+    skills = SkillAccumulator()
+    
+    for session_id, ended_at, started_at, skill_tags, scores in rows:
+        if session_id != current_session:
+            _add_session(series, skills, practiced_at)
+            current_session = session_id
+            practiced_at = ended_at or started_at
+            skills = SkillAccumulator()
+        skills.add(skill_tags or [], scores or {})
+    _add_session(series, skills, practiced_at)
+    
+    return series
+
+
+def _add_session(series: Dict[str, SkillSeries], skills: SkillAccumulator, practiced_at):
+    for skill_tag, score in skills.result().items():
+        if skill_tag not in series:
+            series[skill_tag] = SkillSeries(tag=skill_tag)
+        series[skill_tag].scores.append(score)
+        series[skill_tag].practiced_at.append(practiced_at)
@@ -0,0 +1,198 @@
+"""
+Per-user skill mastery rollup (UserSkillStat).
+
+Each completed session contributes its report's per-skill score once. The
+rows are updated in the transaction that finishes a session, so the skill
+analytics read a handful of indexed rows instead of rebuilding every report
+of the user. A row holds running sums and a bounded window of the latest
+scores, so it stays the same size however many sessions the user finishes.
+rebuild_user_skill_stats recomputes them from the answers (the first
+finished session of a user, management command rebuild_skill_stats, and
+after rescoring).
+"""
+from typing import Dict, Iterable, List
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from interviews.models import InterviewSession
+from ..models import UserSkillStat
+from .cache import schedule_analytics_bump
+from .skill_series import (
+    IMPROVEMENT_WINDOW,
+    improvement_trend,
+    improvement_windows,
+    load_skill_series,
+    weighted_rolling_score,
+    window_improvement,
+)
+
+
+def record_session_skills(session: InterviewSession, skill_breakdown: Dict[str, float]) -> None:
+    """
+    Add a finished session's skill scores to the user's rollup.
+    
+    Call inside the transaction that completes the session. A user without
+    rollup rows gets the whole rollup rebuilt from their completed sessions.
+    
+    Args:
+        session: Completed InterviewSession
+        skill_breakdown: Average score per skill tag (SessionReport.skill_breakdown_json)
+    """
+    if not skill_breakdown:
+        return
+    
+    practiced_at = session.ended_at or session.started_at
+    alpha = _ewma_alpha()
+    
+    existing = {
+        stat.skill_tag: stat
+        for stat in UserSkillStat.objects.select_for_update().filter(
+            user_id=session.user_id,
+            skill_tag__in=list(skill_breakdown)
+        )
+    }
+    
+    if not existing and not UserSkillStat.objects.filter(user_id=session.user_id).exists():
+        # First rollup rows of the user: include the sessions finished before
+        # it existed (this one is already saved as completed)
+        rebuild_user_skill_stats(session.user_id)
+        return
+    
+    new_stats = []
+    for skill_tag, score in skill_breakdown.items():
+        stat = existing.get(skill_tag)
+        if stat is None:
+            stat = UserSkillStat(user_id=session.user_id, skill_tag=skill_tag)
+            new_stats.append(stat)
+        _apply_score(stat, score, practiced_at, alpha)
+    
+    if existing:
+        # bulk_update skips auto_now
+        now = timezone.now()
+        for stat in existing.values():
+            stat.updated_at = now
+        UserSkillStat.objects.bulk_update(
+            list(existing.values()),
+            [
+                'attempts', 'score_sum', 'ewma', 'weighted_sum', 'first_window_sum',
+                'recent_scores_json', 'last_practiced_at', 'updated_at'
+            ]
+        )
+    UserSkillStat.objects.bulk_create(new_stats)
+
+
+def rebuild_user_skill_stats(user_id) -> List[UserSkillStat]:
+    """
+    Recompute a user's rollup from the answers of their completed sessions.
+    
+    Args:
+        user_id: User id
+    
+    Returns:
+        The new UserSkillStat rows, ordered by skill tag
+    """
+    alpha = _ewma_alpha()
+    
+    stats = {}
+    for skill_tag, series in load_skill_series(user_id).items():
+        stats[skill_tag] = UserSkillStat(user_id=user_id, skill_tag=skill_tag)
+        for score, practiced_at in zip(series.scores, series.practiced_at):
+            _apply_score(stats[skill_tag], score, practiced_at, alpha)
+    
+    with transaction.atomic():
+        UserSkillStat.objects.filter(user_id=user_id).delete()
+        UserSkillStat.objects.bulk_create(stats.values())
+        schedule_analytics_bump(user_id)
+    
+    return sorted(stats.values(), key=lambda stat: stat.skill_tag)
+
+
+def rebuild_skill_stats_for_sessions(session_ids: Iterable) -> int:
+    """
+    Rebuild the rollups of the users owning some sessions (e.g. after rescoring).
+    
+    Args:
+        session_ids: InterviewSession ids
+    
+    Returns:
+        Number of users rebuilt
+    """
+    user_ids = set(
+        InterviewSession.objects.filter(id__in=list(session_ids))
+        .values_list('user_id', flat=True)
+    )
+    for user_id in user_ids:
+        rebuild_user_skill_stats(user_id)
+    return len(user_ids)
+
+
+def get_user_skill_stats(user) -> List[UserSkillStat]:
+    """
+    Read a user's rollup rows.
+    
+    Reads never write: the rows are built when a session finishes (and by
+    the backfill migration for sessions finished before the rollup existed).
+    
+    Args:
+        user: User instance
+    
+    Returns:
+        UserSkillStat rows, ordered by skill tag
+    """
+    return list(UserSkillStat.objects.filter(user=user))
+
+
+def get_skill_analytics(user) -> List[Dict]:
+    """
+    Mastery, rolling score, EWMA, improvement and trend of every skill of a user.
+    
+    Args:
+        user: User instance
+    
+    Returns:
+        List of dictionaries with tag, mastery, rolling_score, ewma,
+        improvement, trend, attempts and last_practiced_at
+    """
+    skills = []
+    for stat in get_user_skill_stats(user):
+        improvement = _improvement(stat)
+        skills.append({
+            'tag': stat.skill_tag,
+            'mastery': stat.mastery,
+            'rolling_score': weighted_rolling_score(stat.weighted_sum, stat.attempts),
+            'ewma': round(stat.ewma, 2),
+            'improvement': improvement,
+            'trend': improvement_trend(improvement),
+            'attempts': stat.attempts,
+            'last_practiced_at': stat.last_practiced_at,
+        })
+    return skills
+
+
+def _improvement(stat: UserSkillStat) -> float:
+    """SkillSeries.improvement from the rollup row."""
+    first_count, last_count = improvement_windows(stat.attempts)
+    recent = stat.recent_scores_json
+    if stat.attempts > len(recent):
+        # The first window is no longer in the recent scores
+        first_sum = stat.first_window_sum
+    else:
+        first_sum = sum(recent[:first_count])
+    return window_improvement(first_sum, first_count, sum(recent[len(recent) - last_count:]), last_count)
+
+
+def _apply_score(stat: UserSkillStat, score: float, practiced_at, alpha: float):
+    stat.ewma = score if stat.attempts == 0 else alpha * score + (1 - alpha) * stat.ewma
+    # Every earlier session moves one step further from the newest
+    stat.weighted_sum += stat.score_sum + score
+    if stat.attempts < IMPROVEMENT_WINDOW:
+        stat.first_window_sum += score
+    stat.recent_scores_json = [*stat.recent_scores_json, score][-2 * IMPROVEMENT_WINDOW:]
+    stat.attempts += 1
+    stat.score_sum += score
+    if practiced_at and (stat.last_practiced_at is None or practiced_at > stat.last_practiced_at):
+        stat.last_practiced_at = practiced_at
+
+
+def _ewma_alpha() -> float:
+    return getattr(settings, 'SKILL_STAT_EWMA_ALPHA', 0.3)
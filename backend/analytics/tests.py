@@ -1,5 +1,7 @@
-from django.test import TestCase
+from io import StringIO
+from django.test import TestCase, TransactionTestCase, override_settings
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from rest_framework.test import APIClient
 from rest_framework import status
 from interviews.models import InterviewSession, InterviewQuestion, InterviewAnswer
@@ -232,7 +234,7 @@ class AnalyticsSessionsTests(TestCase):
     
     def test_get_sessions(self):
         """Test getting session history."""
-        response = self.client.get('/api/analytics/sessions')
+        response = self.client.get('/api/analytics/sessions', {'include_count': 1})
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertIn('results', response.data)
@@ -256,6 +258,76 @@ class AnalyticsSessionsTests(TestCase):
         results = response.data['results']
         # All results should be technical type
         self.assertTrue(all(s['type'] == 'technical' for s in results))
+    
+    def _create_history(self, count):
+        # Pairs share a started_at, so the id breaks ties
+        base = timezone.now() - timedelta(days=count)
+        InterviewSession.objects.bulk_create([
+            InterviewSession(
+                user=self.user,
+                role_selected=self.role,
+                level='mid',
+                type='technical',
+                status='completed',
+                overall_score=60,
+                started_at=base + timedelta(days=i // 2)
+            )
+            for i in range(count)
+        ])
+    
+    def test_keyset_pagination(self):
+        """Pages follow next_cursor, newest first, without gaps or repeats."""
+        self._create_history(23)
+        expected = list(
+            InterviewSession.objects.filter(user=self.user, status='completed')
+            .order_by('-started_at', '-id').values_list('id', flat=True)
+        )
+        
+        seen = []
+        cursor = None
+        while True:
+            params = {'limit': 10}
+            if cursor:
+                params['cursor'] = cursor
+            # One query per page, however deep
+            with self.assertNumQueries(1):
+                response = self.client.get('/api/analytics/sessions', params)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertNotIn('count', response.data)
+            seen.extend(row['id'] for row in response.data['results'])
+            cursor = response.data['next_cursor']
+            if cursor is None:
+                break
+        
+        self.assertEqual([str(session_id) for session_id in expected], seen)
+    
+    def test_count_on_request_is_cached(self):
+        """include_count adds the total, cached until analytics change."""
+        self._create_history(5)
+        
+        response = self.client.get('/api/analytics/sessions', {'include_count': 1, 'limit': 2})
+        self.assertEqual(response.data['count'], 7)
+        self.assertEqual(len(response.data['results']), 2)
+        
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/analytics/sessions', {'include_count': 1, 'limit': 2})
+        self.assertEqual(response.data['count'], 7)
+    
+    def test_lean_rows(self):
+        """Rows carry the flat history fields only."""
+        response = self.client.get('/api/analytics/sessions')
+        session = response.data['results'][0]
+        
+        self.assertEqual(
+            set(session),
+            {'id', 'role', 'type', 'level', 'score', 'date', 'started_at', 'progress'}
+        )
+        self.assertEqual(session['role'], 'Backend Engineer')
+    
+    def test_invalid_cursor(self):
+        """A cursor that does not decode is rejected."""
+        response = self.client.get('/api/analytics/sessions', {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
 
 class AnalyticsServiceTests(TestCase):
@@ -319,3 +391,568 @@ class AnalyticsServiceTests(TestCase):
         self.assertIn('hr', trend)
         self.assertIn('case', trend)
         self.assertIn('mixed', trend)
+    
+    def test_session_stats_single_query(self):
+        """Counts and the average score come from one aggregate query."""
+        from analytics.services.aggregator import get_session_stats
+        
+        InterviewSession.objects.create(
+            user=self.user, role_selected=self.role, level='mid', type='hr',
+            status='completed', overall_score=81
+        )
+        InterviewSession.objects.create(
+            user=self.user, role_selected=self.role, level='mid', type='hr', status='in_progress'
+        )
+        
+        with self.assertNumQueries(1):
+            stats = get_session_stats(self.user)
+        
+        self.assertEqual(stats, {'total_sessions': 3, 'completed_sessions': 2, 'average_score': 75.5})
+    
+    def test_trends_grouped_in_database(self):
+        """Category averages and day/week buckets are computed with GROUP BY."""
+        from analytics.services.calculator import calculate_category_trend, calculate_score_trend
+        
+        monday = timezone.now().replace(year=2026, month=10, day=5, hour=12)
+        self.session.ended_at = monday
+        self.session.save()
+        for day, score, session_type in [(0, 90, 'technical'), (1, 60, 'hr'), (8, 50, 'hr')]:
+            InterviewSession.objects.create(
+                user=self.user, role_selected=self.role, level='mid', type=session_type,
+                status='completed', overall_score=score, ended_at=monday + timedelta(days=day)
+            )
+        sessions = InterviewSession.objects.filter(user=self.user, status='completed').order_by('ended_at')
+        
+        with self.assertNumQueries(1):
+            category_trend = calculate_category_trend(sessions)
+        self.assertEqual(category_trend, {'hr': 55.0, 'technical': 80.0, 'case': 0.0, 'mixed': 0.0})
+        
+        self.assertEqual(len(calculate_score_trend(sessions)), 4)
+        self.assertEqual(calculate_score_trend(sessions, bucket='day'), [
+            {'date': '2026-10-05', 'score': 80.0},
+            {'date': '2026-10-06', 'score': 60.0},
+            {'date': '2026-10-13', 'score': 50.0},
+        ])
+        self.assertEqual(calculate_score_trend(sessions, bucket='week'), [
+            {'date': '2026-10-05', 'score': 73.33},
+            {'date': '2026-10-12', 'score': 50.0},
+        ])
+    
+    def test_realism_stats_single_query(self):
+        """Follow-up and pressure scores come from one joined query."""
+        from analytics.services.aggregator import get_interview_realism_stats
+        
+        question = InterviewQuestion.objects.create(
+            session=self.session, order=1, question_text='Why?', category='technical',
+            difficulty='hard', skill_tags_json=[]
+        )
+        InterviewAnswer.objects.create(
+            question=question, answer_text='Because', time_seconds=30,
+            scores_json={'structure': 4, 'depth': 2}, feedback_json={}
+        )
+        followup = InterviewQuestion.objects.create(
+            session=self.session, order=2, question_text='Can you elaborate?', category='technical',
+            difficulty='medium', skill_tags_json=[], is_followup=True, parent_question=question
+        )
+        InterviewAnswer.objects.create(
+            question=followup, answer_text='Yes', time_seconds=30,
+            scores_json={'structure': 3, 'depth': 4}, feedback_json={}
+        )
+        # Unanswered hard question and an unfinished session are ignored
+        InterviewQuestion.objects.create(
+            session=self.session, order=3, question_text='And?', category='technical',
+            difficulty='hard', skill_tags_json=[]
+        )
+        
+        with self.assertNumQueries(1):
+            stats = get_interview_realism_stats(self.user)
+        
+        self.assertEqual(stats, {'followup_handling_score': 3.5, 'pressure_score': 2.0})
+        
+        client = APIClient()
+        client.force_authenticate(user=self.user)
+        response = client.get('/api/analytics/overview')
+        self.assertEqual(response.data['followup_handling_score'], 3.5)
+        self.assertEqual(response.data['pressure_score'], 2.0)
+    
+    def test_overview_bucket_param(self):
+        """The overview accepts bucket=day|week and rejects other values."""
+        client = APIClient()
+        client.force_authenticate(user=self.user)
+        
+        response = client.get('/api/analytics/overview', {'bucket': 'week'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        
+        response = client.get('/api/analytics/overview', {'bucket': 'month'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class UserSkillStatTests(TestCase):
+    """Test the per-user skill rollup maintained when sessions finish."""
+    
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            password='testpass123',
+        )
+        self.client.force_authenticate(user=self.user)
+        
+        self.role = RoleCatalog.objects.create(
+            name='Backend Engineer',
+            category='backend',
+            description='Backend development role',
+            keywords_json=['python', 'django'],
+            level_keywords_json={'junior': ['python'], 'mid': ['django'], 'senior': ['architecture']}
+        )
+    
+    def _answered_session(self, score):
+        session = InterviewSession.objects.create(
+            user=self.user,
+            role_selected=self.role,
+            level='mid',
+            type='technical',
+            status='in_progress'
+        )
+        question = InterviewQuestion.objects.create(
+            session=session,
+            order=1,
+            question_text='What is Django?',
+            category='technical',
+            difficulty='medium',
+            skill_tags_json=['backend.django.auth']
+        )
+        InterviewAnswer.objects.create(
+            question=question,
+            answer_text='Django is a web framework.',
+            time_seconds=120,
+            scores_json={dimension: score for dimension in ['structure', 'relevance', 'technical_accuracy', 'depth', 'communication']},
+            feedback_json={'strengths': [], 'weaknesses': []},
+            skill_tags_json=['backend.django.auth']
+        )
+        return session
+    
+    @override_settings(SKILL_STAT_EWMA_ALPHA=0.5)
+    def test_finish_updates_rollup(self):
+        """Each finished session is folded into the user's skill stat."""
+        from analytics.models import UserSkillStat
+        
+        for score in [2, 4]:
+            session = self._answered_session(score)
+            response = self.client.patch(f'/api/interviews/{session.id}/finish')
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+        
+        stat = UserSkillStat.objects.get(user=self.user, skill_tag='backend.django.auth')
+        self.assertEqual(stat.attempts, 2)
+        self.assertEqual(stat.mastery, 3.0)
+        self.assertEqual(stat.ewma, 3.0)
+        self.assertIsNotNone(stat.last_practiced_at)
+        
+        session = self._answered_session(5)
+        self.client.patch(f'/api/interviews/{session.id}/finish')
+        stat.refresh_from_db()
+        self.assertEqual(stat.attempts, 3)
+        self.assertEqual(stat.ewma, 4.0)
+        self.assertEqual(stat.recent_scores_json, [2.0, 4.0, 5.0])
+        self.assertEqual(stat.weighted_sum, 5.0 + 4.0 * 2 + 2.0 * 3)
+    
+    @override_settings(SKILL_STAT_EWMA_ALPHA=0.5)
+    def test_skills_view_keeps_rolling_score_and_trend(self):
+        """rolling_score and trend keep their meaning; the EWMA is a separate field."""
+        from analytics.services.skill_series import load_skill_series
+        
+        for score in [2, 4, 5]:
+            session = self._answered_session(score)
+            self.client.patch(f'/api/interviews/{session.id}/finish')
+        
+        response = self.client.get('/api/analytics/skills')
+        skill = response.data['skills'][0]
+        series = load_skill_series(self.user.id)['backend.django.auth']
+        self.assertEqual(skill['rolling_score'], series.rolling_score())
+        self.assertEqual(skill['rolling_score'], 3.17)
+        self.assertEqual(skill['trend'], series.trend())
+        self.assertEqual(skill['ewma'], 4.0)
+        self.assertEqual(skill['attempts'], 3)
+    
+    def test_skills_view_is_a_single_read(self):
+        """Reading skill analytics does not depend on the number of sessions."""
+        for score in [2, 3, 4, 5]:
+            session = self._answered_session(score)
+            self.client.patch(f'/api/interviews/{session.id}/finish')
+        
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/analytics/skills')
+        self.assertEqual(len(response.data['skills']), 1)
+    
+    def test_reads_do_not_build_the_rollup(self):
+        """Reading skill analytics never writes; the rollup is built on finish."""
+        from analytics.models import UserSkillStat
+        
+        session = self._answered_session(3)
+        session.status = 'completed'
+        session.ended_at = timezone.now()
+        session.save()
+        
+        response = self.client.get('/api/analytics/skills')
+        self.assertEqual(response.data['skills'], [])
+        self.assertFalse(UserSkillStat.objects.filter(user=self.user).exists())
+    
+    def test_first_finish_includes_earlier_sessions(self):
+        """Finishing a session before any analytics read keeps the older history."""
+        from analytics.models import UserSkillStat
+        
+        old_session = self._answered_session(2)
+        old_session.status = 'completed'
+        old_session.ended_at = timezone.now() - timedelta(days=1)
+        old_session.save()
+        
+        session = self._answered_session(4)
+        self.client.patch(f'/api/interviews/{session.id}/finish')
+        
+        stat = UserSkillStat.objects.get(user=self.user, skill_tag='backend.django.auth')
+        self.assertEqual(stat.attempts, 2)
+        self.assertEqual(stat.mastery, 3.0)
+        self.assertEqual(stat.recent_scores_json, [2.0, 4.0])
+    
+    def test_long_history_matches_series(self):
+        """Past the improvement windows the bounded rollup still matches the full series."""
+        from analytics.services.skill_series import IMPROVEMENT_WINDOW, load_skill_series
+        from analytics.services.skill_stats import get_skill_analytics, rebuild_user_skill_stats
+        from analytics.models import UserSkillStat
+        
+        sessions = 2 * IMPROVEMENT_WINDOW + 3
+        for i in range(sessions):
+            session = self._answered_session(i % 5 + (i > IMPROVEMENT_WINDOW))
+            session.status = 'completed'
+            session.ended_at = timezone.now() - timedelta(days=sessions - i)
+            session.save()
+        rebuild_user_skill_stats(self.user.id)
+        
+        # One more session through the incremental path
+        self.client.patch(f'/api/interviews/{self._answered_session(1).id}/finish')
+        
+        stat = UserSkillStat.objects.get(user=self.user)
+        self.assertEqual(stat.attempts, sessions + 1)
+        self.assertEqual(len(stat.recent_scores_json), 2 * IMPROVEMENT_WINDOW)
+        
+        series = load_skill_series(self.user.id)['backend.django.auth']
+        skill = get_skill_analytics(self.user)[0]
+        self.assertEqual(skill['mastery'], series.mastery())
+        self.assertEqual(skill['rolling_score'], series.rolling_score())
+        self.assertEqual(skill['improvement'], series.improvement())
+        self.assertEqual(skill['trend'], series.trend())
+    
+    def test_rebuild_command(self):
+        """rebuild_skill_stats recomputes the rollup from session reports."""
+        from django.core.management import call_command
+        from analytics.models import UserSkillStat
+        
+        for score in [2, 4]:
+            session = self._answered_session(score)
+            self.client.patch(f'/api/interviews/{session.id}/finish')
+        UserSkillStat.objects.filter(user=self.user).update(attempts=99, score_sum=0)
+        
+        call_command('rebuild_skill_stats', user=self.user.email, stdout=StringIO())
+        
+        stat = UserSkillStat.objects.get(user=self.user)
+        self.assertEqual(stat.attempts, 2)
+        self.assertEqual(stat.mastery, 3.0)
+
+
+class SkillStatMigrationTests(TransactionTestCase):
+    """Test the skill rollup data migrations."""
+    
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            password='testpass123',
+        )
+        self.role = RoleCatalog.objects.create(
+            name='Backend Engineer',
+            category='backend',
+            description='Backend development role',
+            keywords_json=['python', 'django'],
+            level_keywords_json={'junior': ['python'], 'mid': ['django'], 'senior': ['architecture']}
+        )
+    
+    def _migrate(self, target):
+        from django.db import connection
+        from django.db.migrations.executor import MigrationExecutor
+        
+        executor = MigrationExecutor(connection)
+        if target is None:
+            target = executor.loader.graph.leaf_nodes()
+        executor.migrate(target)
+        return executor.loader.project_state(target).apps
+    
+    def test_backfill_and_window_migrations(self):
+        """0003 builds the rollup of users with completed sessions, 0004 bounds it."""
+        from importlib import import_module
+        from analytics.models import UserSkillStat
+        
+        old_apps = self._migrate([('analytics', '0003_backfill_user_skill_stats')])
+        try:
+            for days_ago, score in [(2, 2), (1, 4)]:
+                session = InterviewSession.objects.create(
+                    user=self.user,
+                    role_selected=self.role,
+                    level='mid',
+                    type='technical',
+                    status='completed',
+                    ended_at=timezone.now() - timedelta(days=days_ago)
+                )
+                question = InterviewQuestion.objects.create(
+                    session=session,
+                    order=1,
+                    question_text='What is Django?',
+                    category='technical',
+                    difficulty='medium',
+                    skill_tags_json=['backend.django.auth']
+                )
+                InterviewAnswer.objects.create(
+                    question=question,
+                    answer_text='Django is a web framework.',
+                    time_seconds=120,
+                    scores_json={'structure': score, 'relevance': score},
+                    feedback_json={},
+                    skill_tags_json=['backend.django.auth']
+                )
+            
+            migration = import_module('analytics.migrations.0003_backfill_user_skill_stats')
+            migration.backfill_skill_stats(old_apps, None)
+            self.assertEqual(
+                old_apps.get_model('analytics', 'UserSkillStat').objects.get().scores_json,
+                [2.0, 4.0]
+            )
+        finally:
+            self._migrate(None)
+        
+        stat = UserSkillStat.objects.get(user=self.user)
+        self.assertEqual(stat.attempts, 2)
+        self.assertEqual(stat.mastery, 3.0)
+        self.assertEqual(stat.recent_scores_json, [2.0, 4.0])
+        self.assertEqual(stat.first_window_sum, 6.0)
+        self.assertEqual(stat.weighted_sum, 4.0 + 2.0 * 2)
+        self.assertEqual(stat.last_practiced_at, session.ended_at)
+
+
+class SkillSeriesTests(TestCase):
+    """Test the one-pass per-skill series engine."""
+    
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            password='testpass123',
+        )
+        self.role = RoleCatalog.objects.create(
+            name='Backend Engineer',
+            category='backend',
+            description='Backend development role',
+            keywords_json=['python', 'django'],
+            level_keywords_json={'junior': ['python'], 'mid': ['django'], 'senior': ['architecture']}
+        )
+        
+        # Oldest first: django scores 2, 3, 5; sql only practiced twice
+        self.sessions = []
+        for days_ago, django_score, sql_score in [(30, 2, 4), (20, 3, None), (10, 5, 3)]:
+            session = InterviewSession.objects.create(
+                user=self.user,
+                role_selected=self.role,
+                level='mid',
+                type='technical',
+                status='completed',
+                started_at=timezone.now() - timedelta(days=days_ago),
+                ended_at=timezone.now() - timedelta(days=days_ago)
+            )
+            self._answer(session, 1, ['backend.django'], django_score)
+            if sql_score is not None:
+                self._answer(session, 2, ['backend.sql', 'backend.django'], sql_score)
+            self.sessions.append(session)
+        
+        # The sessions are created completed, so build the rollup the finish
+        # endpoint would have built
+        from analytics.services.skill_stats import rebuild_user_skill_stats
+        rebuild_user_skill_stats(self.user.id)
+    
+    def _answer(self, session, order, skill_tags, score):
+        question = InterviewQuestion.objects.create(
+            session=session,
+            order=order,
+            question_text='Question',
+            category='technical',
+            difficulty='medium',
+            skill_tags_json=skill_tags
+        )
+        InterviewAnswer.objects.create(
+            question=question,
+            answer_text='Answer',
+            time_seconds=60,
+            scores_json={'structure': score, 'relevance': score},
+            feedback_json={},
+            skill_tags_json=skill_tags
+        )
+    
+    def test_series_match_report_breakdowns(self):
+        """Per-session scores equal the session reports' skill breakdowns."""
+        from analytics.services.skill_series import load_skill_series
+        from interviews.services.report import get_session_reports
+        
+        with self.assertNumQueries(1):
+            series = load_skill_series(self.user.id)
+        
+        reports = get_session_reports(self.sessions)
+        for tag, skill in series.items():
+            expected = [
+                reports[session.id].skill_breakdown_json[tag]
+                for session in self.sessions
+                if tag in reports[session.id].skill_breakdown_json
+            ]
+            self.assertEqual(skill.scores, expected)
+    
+    def test_all_skills_in_one_pass(self):
+        """Mastery, rolling score, improvement and trend of every skill, from the rollup."""
+        from analytics.services.skill_stats import get_skill_analytics
+        
+        skills = {skill['tag']: skill for skill in get_skill_analytics(self.user)}
+        
+        # django: 3.0, 3.0, 4.0 (averaged with the sql answers)
+        django = skills['backend.django']
+        self.assertEqual(django['attempts'], 3)
+        self.assertEqual(django['mastery'], 3.33)
+        self.assertEqual(django['rolling_score'], 3.17)
+        self.assertEqual(django['improvement'], 16.67)
+        self.assertEqual(django['trend'], 'improving')
+        self.assertEqual(django['last_practiced_at'], self.sessions[-1].ended_at)
+        
+        sql = skills['backend.sql']
+        self.assertEqual(sql['attempts'], 2)
+        self.assertEqual(sql['improvement'], -25.0)
+        self.assertEqual(sql['trend'], 'declining')
+    
+    def test_endpoints_share_the_skill_analytics(self):
+        """The skills list and the overview's top skills use the same definitions."""
+        client = APIClient()
+        client.force_authenticate(user=self.user)
+        
+        skills = {skill['tag']: skill for skill in client.get('/api/analytics/skills').data['skills']}
+        self.assertEqual(skills['backend.django']['rolling_score'], 3.17)
+        self.assertEqual(skills['backend.django']['trend'], 'improving')
+        self.assertEqual(skills['backend.sql']['trend'], 'declining')
+        
+        overview = client.get('/api/analytics/overview').data
+        self.assertEqual(
+            overview['top_improving_skills'],
+            [{'skill': 'backend.django', 'improvement': '16.67'}]
+        )
+        self.assertEqual(overview['top_weak_skills'][0], {'skill': 'backend.django', 'score': '3.33'})
+
+
+class AnalyticsCacheTests(TestCase):
+    """Test the per-user versioned analytics cache and conditional GETs."""
+    
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            password='testpass123',
+        )
+        self.client.force_authenticate(user=self.user)
+        
+        self.role = RoleCatalog.objects.create(
+            name='Backend Engineer',
+            category='backend',
+            description='Backend development role',
+            keywords_json=['python', 'django'],
+            level_keywords_json={'junior': ['python'], 'mid': ['django'], 'senior': ['architecture']}
+        )
+        self.session = InterviewSession.objects.create(
+            user=self.user,
+            role_selected=self.role,
+            level='mid',
+            type='technical',
+            status='in_progress'
+        )
+        question = InterviewQuestion.objects.create(
+            session=self.session,
+            order=1,
+            question_text='What is Django?',
+            category='technical',
+            difficulty='medium',
+            skill_tags_json=['backend.django.auth']
+        )
+        InterviewAnswer.objects.create(
+            question=question,
+            answer_text='Django is a web framework.',
+            time_seconds=120,
+            scores_json={'structure': 3, 'relevance': 4},
+            feedback_json={},
+            skill_tags_json=['backend.django.auth']
+        )
+    
+    def test_repeated_loads_are_cached(self):
+        """A second load is served from the cache without queries."""
+        for url in ['/api/analytics/overview', '/api/analytics/skills']:
+            first = self.client.get(url)
+            with self.assertNumQueries(0):
+                second = self.client.get(url)
+            self.assertEqual(second.data, first.data)
+            self.assertEqual(second['ETag'], first['ETag'])
+            self.assertIn('Last-Modified', second)
+    
+    def test_conditional_get(self):
+        """Matching If-None-Match or If-Modified-Since gets a 304."""
+        response = self.client.get('/api/analytics/overview')
+        
+        response = self.client.get('/api/analytics/overview', HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        
+        response = self.client.get('/api/analytics/overview', HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        
+        response = self.client.get('/api/analytics/overview', HTTP_IF_NONE_MATCH='"overview-1"')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+    
+    def test_payload_version_is_part_of_the_key(self):
+        """Payloads cached under another payload schema version are not served."""
+        from unittest.mock import patch
+        from analytics.services import cache as analytics_cache
+        
+        old = analytics_cache.get_or_build(self.user.id, 'overview', 1, lambda: {'shape': 'old'})
+        with patch.object(analytics_cache, 'ANALYTICS_PAYLOAD_VERSION', analytics_cache.ANALYTICS_PAYLOAD_VERSION + 1):
+            new = analytics_cache.get_or_build(self.user.id, 'overview', 1, lambda: {'shape': 'new'})
+        
+        self.assertEqual(old, {'shape': 'old'})
+        self.assertEqual(new, {'shape': 'new'})
+        
+        response = self.client.get('/api/analytics/overview')
+        self.assertIn(f'-v{analytics_cache.ANALYTICS_PAYLOAD_VERSION}-', response['ETag'])
+    
+    def test_finishing_a_session_invalidates(self):
+        """Finishing a session bumps the version, so fresh data is served."""
+        before = self.client.get('/api/analytics/overview')
+        self.assertEqual(before.data['overall_score'], 0.0)
+        skills = self.client.get('/api/analytics/skills')
+        self.assertEqual(skills.data['skills'], [])
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.patch(f'/api/interviews/{self.session.id}/finish')
+        
+        after = self.client.get('/api/analytics/overview', HTTP_IF_NONE_MATCH=before['ETag'])
+        self.assertEqual(after.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(after['ETag'], before['ETag'])
+        self.assertGreater(after.data['overall_score'], 0)
+        skills = self.client.get('/api/analytics/skills')
+        self.assertEqual(skills.data['skills'][0]['tag'], 'backend.django.auth')
+    
+    def test_version_bump_on_commit_only(self):
+        """The version changes only once the transaction commits."""
+        from analytics.services.cache import get_analytics_version, schedule_analytics_bump
+        
+        version = get_analytics_version(self.user.id)
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            schedule_analytics_bump(self.user.id)
+        self.assertEqual(get_analytics_version(self.user.id), version)
+        
+        callbacks[0]()
+        self.assertGreater(get_analytics_version(self.user.id), version)
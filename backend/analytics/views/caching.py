@@ -0,0 +1,49 @@
+from django.utils.http import http_date, parse_etags, parse_http_date_safe
+from rest_framework import status
+from rest_framework.response import Response
+from ..services.cache import ANALYTICS_PAYLOAD_VERSION, get_analytics_version, get_or_build
+
+
+class AnalyticsCacheMixin:
+    """
+    Serve an analytics payload from the per-user versioned cache.
+    
+    ETag and Last-Modified come from the user's analytics version, so
+    repeated dashboard loads get a 304 without computing anything.
+    """
+    cache_name = None
+    
+    def get_cache_name(self) -> str:
+        """Cache and ETag name of the payload (vary it with query params that change it)."""
+        return self.cache_name
+    
+    def build_payload(self):
+        """Compute the response payload (a plain dict)."""
+        raise NotImplementedError
+    
+    def cached_response(self, request):
+        user_id = request.user.id
+        name = self.get_cache_name()
+        version = get_analytics_version(user_id)
+        etag = f'"{name}-v{ANALYTICS_PAYLOAD_VERSION}-{version}"'
+        last_modified = version // 1000
+        
+        if self._not_modified(request, etag, last_modified):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = Response(get_or_build(user_id, name, version, self.build_payload))
+        
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(last_modified)
+        # Let browsers revalidate on every dashboard load
+        response['Cache-Control'] = 'private, no-cache'
+        return response
+    
+    @staticmethod
+    def _not_modified(request, etag: str, last_modified: int) -> bool:
+        if_none_match = request.headers.get('If-None-Match')
+        if if_none_match:
+            return etag in parse_etags(if_none_match)
+        
+        since = parse_http_date_safe(request.headers.get('If-Modified-Since', ''))
+        return since is not None and last_modified <= since
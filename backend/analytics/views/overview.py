@@ -2,22 +2,30 @@ from rest_framework import generics, status
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from ..serializers import OverviewStatsSerializer
-from ..services.aggregator import get_session_stats, get_progress_stats
+from .caching import AnalyticsCacheMixin
+from ..services.aggregator import get_session_stats, get_progress_stats, get_interview_realism_stats
 from ..services.calculator import (
+    TREND_BUCKETS,
     calculate_score_trend,
     calculate_category_trend,
     get_top_improving_skills,
     get_top_weak_skills,
 )
+from ..services.skill_stats import get_skill_analytics
 
 
-class AnalyticsOverviewView(generics.RetrieveAPIView):
+class AnalyticsOverviewView(AnalyticsCacheMixin, generics.RetrieveAPIView):
     """
     GET /api/analytics/overview
     Returns dashboard overview stats for authenticated user.
+    
+    Query params:
+        bucket: 'day' or 'week' to average score_trend per period
+            (default: one point per session)
     """
     permission_classes = [IsAuthenticated]
     serializer_class = OverviewStatsSerializer
+    cache_name = 'overview'
 
     def get_object(self):
         """Return overview stats for the authenticated user."""
@@ -31,12 +39,16 @@ class AnalyticsOverviewView(generics.RetrieveAPIView):
         sessions = progress_stats.get('sessions', [])
         
         # Calculate trends
-        score_trend = calculate_score_trend(sessions)
+        score_trend = calculate_score_trend(sessions, bucket=self.request.query_params.get('bucket'))
         category_trend = calculate_category_trend(sessions)
         
-        # Get top skills
-        top_improving = get_top_improving_skills(user, limit=5)
-        top_weak = get_top_weak_skills(user, limit=5)
+        # Get top skills from one read of the skill rollup
+        skills = get_skill_analytics(user)
+        top_improving = get_top_improving_skills(user, limit=5, skills=skills)
+        top_weak = get_top_weak_skills(user, limit=5, skills=skills)
+        
+        # Follow-up handling and pressure scores (one joined query)
+        realism = get_interview_realism_stats(user)
         
         # Build overview data
         overview_data = {
@@ -46,13 +58,28 @@ class AnalyticsOverviewView(generics.RetrieveAPIView):
             'category_trend': category_trend,
             'top_improving_skills': top_improving,
             'top_weak_skills': top_weak,
+            'followup_handling_score': realism['followup_handling_score'],
+            'pressure_score': realism['pressure_score'],
         }
         
         return overview_data
 
+    def build_payload(self):
+        """Serialized overview for the cache."""
+        return dict(self.get_serializer(self.get_object()).data)
+
+    def get_cache_name(self):
+        """Each trend bucketing is cached separately."""
+        bucket = self.request.query_params.get('bucket')
+        return f'{self.cache_name}-{bucket}' if bucket else self.cache_name
+
     def retrieve(self, request, *args, **kwargs):
-        """Override retrieve to return serialized data."""
-        overview_data = self.get_object()
-        serializer = self.get_serializer(overview_data)
-        return Response(serializer.data)
+        """Override retrieve to serve the cached, conditional response."""
+        bucket = request.query_params.get('bucket')
+        if bucket is not None and bucket not in TREND_BUCKETS:
+            return Response(
+                {'error': f"bucket must be one of: {', '.join(TREND_BUCKETS)}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        return self.cached_response(request)
 
@@ -1,51 +1,62 @@
-from rest_framework import generics
+from rest_framework import generics, status
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.filters import OrderingFilter
-from interviews.models import InterviewSession
 from ..serializers import SessionHistorySerializer
+from ..services.session_history import (
+    InvalidCursor,
+    completed_sessions,
+    get_session_count,
+    get_session_page,
+)
+
+DEFAULT_PAGE_SIZE = 10
+MAX_PAGE_SIZE = 100
 
 
 class AnalyticsSessionsView(generics.ListAPIView):
     """
     GET /api/analytics/sessions
-    Returns paginated session history with filters.
-    Query params: limit, offset, type (filter by interview type)
+    Returns completed session history, newest first, with keyset pagination.
+    Query params: limit (page size, max 100), cursor (next_cursor of the
+    previous page), type (filter by interview type), include_count=1 (add
+    the total count)
     """
     permission_classes = [IsAuthenticated]
     serializer_class = SessionHistorySerializer
-    filter_backends = [OrderingFilter]
-    ordering_fields = ['started_at', 'ended_at', 'overall_score']
-    ordering = ['-started_at']
 
     def get_queryset(self):
         """Return completed sessions for the authenticated user."""
-        queryset = InterviewSession.objects.filter(
-            user=self.request.user,
-            status='completed'
-        ).select_related('role_selected')
-        
-        # Manual filtering by type if provided
-        interview_type = self.request.query_params.get('type', None)
-        if interview_type:
-            queryset = queryset.filter(type=interview_type)
-        
-        return queryset
+        return completed_sessions(self.request.user, self.request.query_params.get('type'))
 
     def list(self, request, *args, **kwargs):
-        """Override list to format response with count."""
-        queryset = self.filter_queryset(self.get_queryset())
+        """Override list to return one keyset page."""
+        try:
+            limit = int(request.query_params.get('limit', DEFAULT_PAGE_SIZE))
+        except ValueError:
+            return Response(
+                {'error': 'limit must be an integer'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        limit = min(max(limit, 1), MAX_PAGE_SIZE)
         
-        # Get limit from query params
-        limit = int(request.query_params.get('limit', 10))
-        queryset = queryset[:limit]
+        try:
+            rows, next_cursor = get_session_page(
+                self.get_queryset(),
+                limit,
+                request.query_params.get('cursor')
+            )
+        except InvalidCursor:
+            return Response(
+                {'error': 'Invalid cursor'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
         
-        # Use InterviewSessionSerializer for full data
-        from interviews.serializers import InterviewSessionSerializer
-        serializer = InterviewSessionSerializer(queryset, many=True)
+        data = {
+            'results': self.get_serializer(rows, many=True).data,
+            'next_cursor': next_cursor,
+        }
+        # Counting grows with the history, so it is opt-in (and cached)
+        if request.query_params.get('include_count') in ('1', 'true'):
+            data['count'] = get_session_count(request.user, request.query_params.get('type'))
         
-        return Response({
-            'results': serializer.data,
-            'count': queryset.count(),
-        })
-
+        return Response(data)
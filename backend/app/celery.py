@@ -0,0 +1,15 @@
+"""
+Celery application for background work (question generation, etc.).
+
+Configuration is read from Django settings using the ``CELERY_`` prefix.
+"""
+
+import os
+
+from celery import Celery
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'app.settings')
+
+app = Celery('app')
+app.config_from_object('django.conf:settings', namespace='CELERY')
+app.autodiscover_tasks()
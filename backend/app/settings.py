@@ -11,6 +11,7 @@ https://docs.djangoproject.com/en/4.2/ref/settings/
 """
 
 import os
+import sys
 from pathlib import Path
 from datetime import timedelta
 import environ
@@ -236,6 +237,18 @@ CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = 'UTC'
+# Run tasks in-process when no worker is available (local development)
+CELERY_TASK_ALWAYS_EAGER = env.bool('CELERY_TASK_ALWAYS_EAGER', default=False)
+CELERY_BEAT_SCHEDULE = {
+    'refill-popular-question-pools': {
+        'task': 'interviews.tasks.refill_popular_question_pools',
+        'schedule': timedelta(minutes=15),
+    },
+    'abandon-stale-sessions': {
+        'task': 'interviews.tasks.abandon_stale_sessions',
+        'schedule': timedelta(hours=1),
+    },
+}
 
 # File Storage (for production with S3)
 USE_S3 = env.bool('USE_S3', default=False)
@@ -265,3 +278,70 @@ OPENAI_MODEL = env('OPENAI_MODEL', default='gpt-4')
 # Anthropic Configuration
 ANTHROPIC_API_KEY = env('ANTHROPIC_API_KEY', default=None)
 ANTHROPIC_MODEL = env('ANTHROPIC_MODEL', default='claude-3-sonnet-20240229')
+
+# Cache backend: defaults to the Redis instance of Celery, so web workers,
+# Celery workers and management commands share one cache (the analytics
+# versions are bumped from all of them). locmemcache:// is per process: only
+# for a single-process development server.
+CACHES = {
+    'default': env.cache_url('CACHE_URL', default=env('REDIS_URL', default='redis://localhost:6379/0')),
+}
+
+# The test runner is a single process: keep the suite independent of Redis
+if sys.argv[1:2] == ['test']:
+    CACHES = {
+        'default': env.cache_url_config('locmemcache://'),
+    }
+
+# Question bank: how long per-(role category, level, type) pools stay cached in memory
+QUESTION_POOL_CACHE_SECONDS = env.int('QUESTION_POOL_CACHE_SECONDS', default=300)
+
+# Warm pool of pre-generated LLM question sets per (role, level, type)
+QUESTION_POOL_TARGET_SIZE = env.int('QUESTION_POOL_TARGET_SIZE', default=5)
+QUESTION_POOL_LOW_WATER = env.int('QUESTION_POOL_LOW_WATER', default=2)
+QUESTION_POOL_PERSONALIZED_COUNT = env.int('QUESTION_POOL_PERSONALIZED_COUNT', default=3)
+QUESTION_POOL_POPULAR_LIMIT = env.int('QUESTION_POOL_POPULAR_LIMIT', default=10)
+QUESTION_POOL_POPULAR_DAYS = env.int('QUESTION_POOL_POPULAR_DAYS', default=30)
+
+# Server-sent events for questions generated in the background
+QUESTION_STREAM_POLL_SECONDS = env.float('QUESTION_STREAM_POLL_SECONDS', default=0.5)
+QUESTION_STREAM_TIMEOUT_SECONDS = env.int('QUESTION_STREAM_TIMEOUT_SECONDS', default=120)
+# Open streams across all workers; further requests get 503 and poll instead
+QUESTION_STREAM_MAX_CONCURRENT = env.int('QUESTION_STREAM_MAX_CONCURRENT', default=20)
+QUESTION_STREAM_RETRY_SECONDS = env.int('QUESTION_STREAM_RETRY_SECONDS', default=3)
+
+# Per-request latency budget for answer scoring; model-based scorers that do
+# not fit are skipped (see interviews.services.scoring_registry)
+SCORING_LATENCY_BUDGET_MS = env.int('SCORING_LATENCY_BUDGET_MS', default=200)
+
+# Answer grading: 'heuristic' scores synchronously only; 'llm' returns the
+# heuristic scores at once and regrades answers with the LLM in the background,
+# batching the answers of a session that arrive within the delay
+ANSWER_GRADING_MODE = env('ANSWER_GRADING_MODE', default='heuristic')
+ANSWER_GRADING_BATCH_DELAY_SECONDS = env.int('ANSWER_GRADING_BATCH_DELAY_SECONDS', default=30)
+ANSWER_GRADING_BATCH_SIZE = env.int('ANSWER_GRADING_BATCH_SIZE', default=10)
+
+# Interview history export: rows fetched per server-side cursor round trip
+EXPORT_CHUNK_SIZE = env.int('EXPORT_CHUNK_SIZE', default=2000)
+
+# Follow-up questions inserted after weak answers (see interviews.services.followup);
+# FOLLOWUP_LLM_REFINEMENT rewords the templated probe with the LLM in the background
+FOLLOWUP_QUESTIONS_ENABLED = env.bool('FOLLOWUP_QUESTIONS_ENABLED', default=True)
+FOLLOWUP_SCORE_THRESHOLD = env.float('FOLLOWUP_SCORE_THRESHOLD', default=3)
+FOLLOWUP_MAX_PER_SESSION = env.int('FOLLOWUP_MAX_PER_SESSION', default=3)
+FOLLOWUP_LLM_REFINEMENT = env.bool('FOLLOWUP_LLM_REFINEMENT', default=False)
+
+# Live interview WebSocket (app/asgi.py): seconds a new connection has to send its token
+LIVE_INTERVIEW_AUTH_TIMEOUT_SECONDS = env.int('LIVE_INTERVIEW_AUTH_TIMEOUT_SECONDS', default=10)
+
+# Sessions still created/generating/in_progress with no answer for this long
+# are marked 'abandoned' by the hourly sweeper (interviews.services.sweeper)
+STALE_SESSION_IDLE_HOURS = env.int('STALE_SESSION_IDLE_HOURS', default=24)
+STALE_SESSION_SWEEP_CHUNK_SIZE = env.int('STALE_SESSION_SWEEP_CHUNK_SIZE', default=500)
+
+# Weight of the latest session in the per-user skill EWMA (analytics.UserSkillStat)
+SKILL_STAT_EWMA_ALPHA = env.float('SKILL_STAT_EWMA_ALPHA', default=0.3)
+
+# Analytics responses are cached per user and version (analytics.services.cache);
+# a bump makes old entries unreachable, this only bounds how long they linger
+ANALYTICS_CACHE_SECONDS = env.int('ANALYTICS_CACHE_SECONDS', default=86400)
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import InterviewSession, InterviewQuestion, InterviewAnswer
+from .models import InterviewSession, InterviewQuestion, InterviewAnswer, QuestionBank, PregeneratedQuestionSet, SessionReport
 
 
 @admin.register(InterviewSession)
@@ -22,8 +22,32 @@ class InterviewQuestionAdmin(admin.ModelAdmin):
 
 @admin.register(InterviewAnswer)
 class InterviewAnswerAdmin(admin.ModelAdmin):
-    list_display = ['id', 'question', 'time_seconds', 'submitted_at']
-    list_filter = ['submitted_at']
+    list_display = ['id', 'question', 'time_seconds', 'grading_status', 'rubric_version', 'submitted_at']
+    list_filter = ['grading_status', 'rubric_version', 'submitted_at']
     search_fields = ['answer_text', 'question__session__user__email']
     readonly_fields = ['id', 'submitted_at', 'created_at']
     date_hierarchy = 'submitted_at'
+
+
+@admin.register(QuestionBank)
+class QuestionBankAdmin(admin.ModelAdmin):
+    list_display = ['question_text', 'category', 'role_category', 'difficulty', 'skill_tag', 'position', 'is_active']
+    list_filter = ['category', 'role_category', 'difficulty', 'is_active']
+    search_fields = ['question_text', 'skill_tag']
+    readonly_fields = ['id', 'created_at', 'updated_at']
+
+
+@admin.register(PregeneratedQuestionSet)
+class PregeneratedQuestionSetAdmin(admin.ModelAdmin):
+    list_display = ['id', 'role', 'level', 'type', 'created_at']
+    list_filter = ['level', 'type', 'created_at']
+    search_fields = ['role__name']
+    readonly_fields = ['id', 'created_at']
+
+
+@admin.register(SessionReport)
+class SessionReportAdmin(admin.ModelAdmin):
+    list_display = ['id', 'session', 'rubric_version', 'answered_count', 'updated_at']
+    list_filter = ['rubric_version', 'updated_at']
+    search_fields = ['session__user__email']
+    readonly_fields = ['id', 'created_at', 'updated_at']
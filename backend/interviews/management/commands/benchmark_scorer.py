@@ -0,0 +1,195 @@
+"""
+Management command to benchmark answer scoring.
+
+Checks score_answer against the golden fixture (answers with their
+expected scores) and times it on generated answers of several lengths.
+After an intended rubric change, bump RUBRIC_VERSION and rewrite the
+fixture with --update-golden.
+"""
+import json
+import random
+import time
+from pathlib import Path
+from django.core.management.base import BaseCommand, CommandError
+from interviews.models import InterviewQuestion
+from interviews.services import scorer
+from interviews.services.scoring_registry import get_scorer_timings, reset_scorer_timings
+
+
+GOLDEN_FIXTURE = Path(__file__).resolve().parents[2] / 'fixtures' / 'scorer_golden.json'
+
+
+SAMPLE_WORDS = [
+    'first', 'we', 'designed', 'the', 'rest', 'api', 'because', 'each', 'endpoint', 'returned',
+    'a', 'large', 'response', 'however', 'the', 'database', 'query', 'needed', 'an', 'index',
+    'for', 'example', 'jwt', 'token', 'authentication', 'then', 'the', 'result', 'was', 'faster',
+    'i', 'think', 'maybe', 'tradeoff', 'component', 'state', 'promise', 'clearly', 'situation',
+    'finally', 'moreover', 'system', 'design', 'cache', 'latency', 'service', 'team', 'deploy',
+]
+
+
+def load_golden(path: Path = GOLDEN_FIXTURE):
+    """
+    Read the golden fixture.
+    
+    Returns:
+        (rubric_version, [(answer_text, question, expected_scores)])
+    """
+    with open(path) as f:
+        data = json.load(f)
+    questions = [InterviewQuestion(**fields) for fields in data['questions']]
+    # Each answer has one expected score dict per question, in order
+    cases = [
+        (case['answer_text'], question, scores)
+        for case in data['answers']
+        for question, scores in zip(questions, case['scores'])
+    ]
+    return data['rubric_version'], cases
+
+
+def golden_mismatches(path: Path = GOLDEN_FIXTURE):
+    """Golden cases whose current scores differ from the expected ones."""
+    _, cases = load_golden(path)
+    return [
+        (answer_text, question, expected)
+        for answer_text, question, expected in cases
+        if scorer.score_answer(answer_text, question) != expected
+    ]
+
+
+class Command(BaseCommand):
+    help = 'Check answer scoring against the golden fixture and time it'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sizes',
+            type=int,
+            nargs='+',
+            default=[100, 500, 1000, 5000],
+            help='Answer lengths in words'
+        )
+        parser.add_argument(
+            '--answers',
+            type=int,
+            default=20,
+            help='Generated answers per size'
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=5,
+            help='Timing repetitions per size'
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=0,
+            help='Random seed for generated answers'
+        )
+        parser.add_argument(
+            '--update-golden',
+            action='store_true',
+            help='Rewrite the expected scores in the golden fixture with the current scorer'
+        )
+    
+    def handle(self, *args, **options):
+        if options['update_golden']:
+            self._update_golden()
+            return
+        
+        rubric_version, _ = load_golden()
+        if rubric_version != scorer.RUBRIC_VERSION:
+            raise CommandError(
+                f'Golden fixture is for rubric version {rubric_version}, the scorer is at '
+                f'{scorer.RUBRIC_VERSION}; rewrite it with --update-golden'
+            )
+        mismatches = golden_mismatches()
+        if mismatches:
+            raise CommandError(f'Scores differ from the golden fixture for {len(mismatches)} answers')
+        self.stdout.write(self.style.SUCCESS('Scores match the golden fixture'))
+        
+        rng = random.Random(options['seed'])
+        questions = [
+            InterviewQuestion(
+                question_text='How would you design a REST API endpoint with JWT authentication?',
+                category='technical',
+                difficulty='medium',
+                skill_tags_json=['backend.api.rest', 'backend.auth', 'backend.database']
+            ),
+            InterviewQuestion(
+                question_text='Tell me about a situation where you resolved a conflict in your team.',
+                category='behavioral',
+                difficulty='medium',
+                skill_tags_json=['communication']
+            ),
+        ]
+        
+        reset_scorer_timings()
+        self.stdout.write(f"\n{'words':>7} {'ms/answer':>10} {'words/ms':>9}")
+        
+        for size in options['sizes']:
+            answers = [self._generate_answer(rng, size) for _ in range(options['answers'])]
+            ms = self._time(scorer.score_answer, answers, questions, options['repeat'])
+            words_per_ms = size / ms if ms else 0
+            self.stdout.write(f'{size:>7} {ms:>10.3f} {words_per_ms:>9.0f}')
+        
+        self._write_plugin_timings()
+    
+    def _update_golden(self):
+        """Recompute the expected scores of every golden answer."""
+        with open(GOLDEN_FIXTURE) as f:
+            data = json.load(f)
+        questions = [InterviewQuestion(**fields) for fields in data['questions']]
+        for case in data['answers']:
+            case['scores'] = [scorer.score_answer(case['answer_text'], question) for question in questions]
+        data['rubric_version'] = scorer.RUBRIC_VERSION
+        
+        with open(GOLDEN_FIXTURE, 'w') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+            f.write('\n')
+        self.stdout.write(self.style.SUCCESS(f"Rewrote {len(data['answers'])} golden answers"))
+    
+    def _write_plugin_timings(self):
+        """Per-dimension share of scoring time across the whole run."""
+        timings = get_scorer_timings()
+        total_ms = sum(timing['total_ms'] for timing in timings.values()) or 1
+        
+        self.stdout.write(f"\n{'dimension':<20} {'cost':<6} {'runs':>6} {'mean ms':>8} {'share':>6}")
+        for name, timing in timings.items():
+            share = timing['total_ms'] / total_ms * 100
+            self.stdout.write(
+                f"{name:<20} {timing['cost']:<6} {timing['count']:>6} {timing['mean_ms']:>8.3f} {share:>5.1f}%"
+            )
+
+    def _generate_answer(self, rng, size):
+        # Mostly filler from a larger vocabulary, like a real answer
+        filler = self._filler_vocabulary(rng)
+        words = [
+            rng.choice(SAMPLE_WORDS) if rng.random() < 0.2 else rng.choice(filler)
+            for _ in range(size)
+        ]
+        # End a sentence every 12-20 words
+        position = rng.randint(12, 20)
+        while position < size:
+            words[position - 1] += rng.choice('.!?')
+            position += rng.randint(12, 20)
+        return ' '.join(words).capitalize()
+    
+    def _filler_vocabulary(self, rng, size=2000):
+        if not hasattr(self, '_filler'):
+            letters = 'abcdefghijklmnopqrstuvwxyz'
+            self._filler = [
+                ''.join(rng.choice(letters) for _ in range(rng.randint(2, 10)))
+                for _ in range(size)
+            ]
+        return self._filler
+
+    def _time(self, score_answer, answers, questions, repeat):
+        """Average milliseconds per answer scored."""
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for answer in answers:
+                for question in questions:
+                    score_answer(answer, question)
+        elapsed = time.perf_counter() - start
+        return elapsed * 1000 / (repeat * len(answers) * len(questions))
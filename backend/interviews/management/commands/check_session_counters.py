@@ -0,0 +1,55 @@
+"""
+Management command to check the denormalized session progress counters.
+"""
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Count, F, Q
+from interviews.models import InterviewSession
+
+
+class Command(BaseCommand):
+    help = 'Compare question_count/answered_count with the actual rows and optionally fix them'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--fix',
+            action='store_true',
+            help='Rewrite the counters of inconsistent sessions'
+        )
+    
+    def handle(self, *args, **options):
+        mismatched = list(
+            InterviewSession.objects.annotate(
+                actual_questions=Count('questions', distinct=True),
+                actual_answered=Count('questions', filter=Q(questions__answer__isnull=False), distinct=True),
+            ).exclude(
+                question_count=F('actual_questions'),
+                answered_count=F('actual_answered'),
+            ).values('id', 'question_count', 'actual_questions', 'answered_count', 'actual_answered')
+        )
+        
+        for row in mismatched:
+            self.stdout.write(
+                f"{row['id']}: questions {row['question_count']} (actual {row['actual_questions']}), "
+                f"answered {row['answered_count']} (actual {row['actual_answered']})"
+            )
+        
+        if not mismatched:
+            self.stdout.write(self.style.SUCCESS('All session counters are consistent'))
+            return
+        
+        if not options['fix']:
+            raise CommandError(f'{len(mismatched)} sessions have inconsistent counters (run with --fix)')
+        
+        InterviewSession.objects.bulk_update(
+            [
+                InterviewSession(
+                    id=row['id'],
+                    question_count=row['actual_questions'],
+                    answered_count=row['actual_answered']
+                )
+                for row in mismatched
+            ],
+            ['question_count', 'answered_count'],
+            batch_size=500
+        )
+        self.stdout.write(self.style.SUCCESS(f'Fixed counters of {len(mismatched)} sessions'))
@@ -0,0 +1,42 @@
+"""
+Management command to rescore answers after the scoring rubric changes.
+"""
+from django.core.management.base import BaseCommand
+from interviews.services.rescore import rescore_answers
+from interviews.services.scorer import RUBRIC_VERSION
+
+
+class Command(BaseCommand):
+    help = 'Rescore answers scored with an older rubric and recompute session overall scores'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=500,
+            help='Answers per chunk (each chunk is committed separately)'
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=None,
+            help='Scoring processes (default: CPU count, 1 to score inline)'
+        )
+    
+    def handle(self, *args, **options):
+        self.stdout.write(f'Rescoring answers with rubric version {RUBRIC_VERSION}...')
+        
+        def progress(processed, total, elapsed):
+            rate = processed / elapsed if elapsed else 0
+            self.stdout.write(f'  {processed}/{total} answers ({rate:.0f} rows/s)')
+        
+        result = rescore_answers(
+            chunk_size=options['chunk_size'],
+            workers=options['workers'],
+            progress=progress
+        )
+        
+        self.stdout.write(self.style.SUCCESS(
+            f"Rescored {result['processed']} answers in {result['seconds']}s "
+            f"({result['rows_per_second']} rows/s)"
+        ))
@@ -0,0 +1,43 @@
+"""
+Management command to mark idle unfinished sessions as abandoned.
+
+Runs hourly as the abandon_stale_sessions Celery beat task; use the command
+for a one-off sweep or to preview it with --dry-run.
+"""
+from django.core.management.base import BaseCommand
+from interviews.services.sweeper import abandon_stale_sessions
+
+
+class Command(BaseCommand):
+    help = "Mark sessions idle for longer than the threshold as 'abandoned'"
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--idle-hours',
+            type=int,
+            default=None,
+            help='Hours since the latest answer (default STALE_SESSION_IDLE_HOURS)'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=None,
+            help='Sessions per UPDATE (default STALE_SESSION_SWEEP_CHUNK_SIZE)'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only count the stale sessions'
+        )
+    
+    def handle(self, *args, **options):
+        count = abandon_stale_sessions(
+            idle_hours=options['idle_hours'],
+            chunk_size=options['chunk_size'],
+            dry_run=options['dry_run']
+        )
+        
+        if options['dry_run']:
+            self.stdout.write(f'{count} stale sessions would be abandoned')
+        else:
+            self.stdout.write(self.style.SUCCESS(f'Abandoned {count} stale sessions'))
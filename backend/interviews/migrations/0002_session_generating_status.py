@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-19 08:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interviews', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='interviewsession',
+            name='status',
+            field=models.CharField(choices=[('created', 'Created'), ('generating', 'Generating Questions'), ('in_progress', 'In Progress'), ('completed', 'Completed'), ('abandoned', 'Abandoned')], default='created', max_length=20),
+        ),
+    ]
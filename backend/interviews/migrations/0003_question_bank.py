@@ -0,0 +1,38 @@
+# Generated by Django 4.2.30 on 2026-10-19 08:37
+
+from django.db import migrations, models
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interviews', '0002_session_generating_status'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='QuestionBank',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('question_text', models.TextField()),
+                ('category', models.CharField(choices=[('hr', 'HR'), ('technical', 'Technical'), ('case', 'Case Study'), ('behavioral', 'Behavioral')], max_length=20)),
+                ('role_category', models.CharField(blank=True, default='', help_text='RoleCatalog category this question targets; blank for all roles', max_length=20)),
+                ('difficulty', models.CharField(choices=[('easy', 'Easy'), ('medium', 'Medium'), ('hard', 'Hard')], max_length=10)),
+                ('level_difficulty_json', models.JSONField(blank=True, default=dict, help_text="Per-level difficulty overrides, e.g. {'junior': 'easy'}")),
+                ('skill_tag', models.CharField(help_text='Primary skill tag assessed by this question', max_length=100)),
+                ('skill_tags_json', models.JSONField(default=list, help_text='List of skill tags assessed by this question')),
+                ('position', models.PositiveIntegerField(default=0, help_text='Selection priority (lowest first)')),
+                ('is_active', models.BooleanField(default=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Question Bank Entry',
+                'verbose_name_plural': 'Question Bank',
+                'db_table': 'question_bank',
+                'ordering': ['category', 'role_category', 'position'],
+                'indexes': [models.Index(fields=['category', 'role_category', 'difficulty', 'skill_tag'], name='question_bank_lookup_idx')],
+            },
+        ),
+    ]
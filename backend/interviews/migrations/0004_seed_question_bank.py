@@ -0,0 +1,45 @@
+import json
+from pathlib import Path
+
+from django.db import migrations
+
+FIXTURE_PATH = Path(__file__).resolve().parent.parent / 'fixtures' / 'question_bank.json'
+
+
+def seed_question_bank(apps, schema_editor):
+    QuestionBank = apps.get_model('interviews', 'QuestionBank')
+    with open(FIXTURE_PATH) as fixture:
+        entries = json.load(fixture)
+    
+    # Only use fields known to this migration state, so later additions to
+    # the fixture don't break replaying the migration.
+    field_names = {field.name for field in QuestionBank._meta.get_fields()}
+    QuestionBank.objects.bulk_create(
+        [
+            QuestionBank(
+                pk=entry['pk'],
+                **{name: value for name, value in entry['fields'].items() if name in field_names}
+            )
+            for entry in entries
+        ],
+        ignore_conflicts=True
+    )
+
+
+def unseed_question_bank(apps, schema_editor):
+    QuestionBank = apps.get_model('interviews', 'QuestionBank')
+    with open(FIXTURE_PATH) as fixture:
+        entries = json.load(fixture)
+    
+    QuestionBank.objects.filter(pk__in=[entry['pk'] for entry in entries]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interviews', '0003_question_bank'),
+    ]
+
+    operations = [
+        migrations.RunPython(seed_question_bank, unseed_question_bank),
+    ]
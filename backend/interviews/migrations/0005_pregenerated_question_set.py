@@ -0,0 +1,34 @@
+# Generated by Django 4.2.30 on 2026-10-19 08:39
+
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('roles', '0001_initial'),
+        ('interviews', '0004_seed_question_bank'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PregeneratedQuestionSet',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('level', models.CharField(choices=[('junior', 'Junior'), ('mid', 'Mid-level'), ('senior', 'Senior')], max_length=10)),
+                ('type', models.CharField(choices=[('hr', 'HR'), ('technical', 'Technical'), ('case', 'Case Study'), ('mixed', 'Mixed')], max_length=20)),
+                ('questions_json', models.JSONField(default=list, help_text='Generated questions: question_text, category, difficulty, skill_tags')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('role', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='pregenerated_question_sets', to='roles.rolecatalog')),
+            ],
+            options={
+                'verbose_name': 'Pre-generated Question Set',
+                'verbose_name_plural': 'Pre-generated Question Sets',
+                'db_table': 'pregenerated_question_sets',
+                'ordering': ['created_at'],
+                'indexes': [models.Index(fields=['role', 'level', 'type', 'created_at'], name='pregen_question_set_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-19 08:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interviews', '0005_pregenerated_question_set'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='interviewanswer',
+            name='rubric_version',
+            field=models.PositiveIntegerField(db_index=True, default=1, help_text='scorer.RUBRIC_VERSION the scores were computed with'),
+        ),
+    ]
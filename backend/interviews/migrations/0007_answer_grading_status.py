@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-19 08:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interviews', '0006_answer_rubric_version'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='interviewanswer',
+            name='grading_status',
+            field=models.CharField(choices=[('heuristic', 'Heuristic'), ('pending', 'LLM Grading Pending'), ('graded', 'LLM Graded'), ('failed', 'LLM Grading Failed')], default='heuristic', help_text='Whether scores come from the heuristic scorer or LLM grading', max_length=20),
+        ),
+    ]
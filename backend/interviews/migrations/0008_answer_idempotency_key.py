@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-19 08:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interviews', '0007_answer_grading_status'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='interviewanswer',
+            name='idempotency_key',
+            field=models.CharField(blank=True, help_text='Idempotency-Key header of the submission, so client retries get the original answer', max_length=255, null=True),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-10-19 08:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interviews', '0008_answer_idempotency_key'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='interviewsession',
+            name='answered_count',
+            field=models.PositiveIntegerField(default=0, help_text='Number of answered questions, kept in sync with F() updates'),
+        ),
+        migrations.AddField(
+            model_name='interviewsession',
+            name='question_count',
+            field=models.PositiveIntegerField(default=0, help_text='Number of questions, kept in sync with F() updates'),
+        ),
+    ]
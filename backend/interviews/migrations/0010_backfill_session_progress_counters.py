@@ -0,0 +1,31 @@
+from django.db import migrations
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_counters(apps, schema_editor):
+    """Set question_count and answered_count from the existing rows in one UPDATE."""
+    InterviewSession = apps.get_model('interviews', 'InterviewSession')
+    InterviewQuestion = apps.get_model('interviews', 'InterviewQuestion')
+    
+    questions = InterviewQuestion.objects.filter(session=OuterRef('pk')).order_by()
+    question_count = questions.values('session').annotate(count=Count('id')).values('count')
+    answered_count = questions.filter(answer__isnull=False).values('session').annotate(
+        count=Count('id')
+    ).values('count')
+    
+    InterviewSession.objects.update(
+        question_count=Coalesce(Subquery(question_count), 0),
+        answered_count=Coalesce(Subquery(answered_count), 0),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interviews', '0009_session_progress_counters'),
+    ]
+    
+    operations = [
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 4.2.30 on 2026-10-19 08:58
+
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interviews', '0010_backfill_session_progress_counters'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SessionReport',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('rubric_breakdown_json', models.JSONField(default=dict, help_text='Average score per rubric dimension')),
+                ('skill_breakdown_json', models.JSONField(default=dict, help_text='Average score per skill tag')),
+                ('strengths_json', models.JSONField(default=list, help_text='Top strengths from answer feedback')),
+                ('weaknesses_json', models.JSONField(default=list, help_text='Top weaknesses from answer feedback')),
+                ('rubric_version', models.PositiveIntegerField(default=1, help_text='scorer.RUBRIC_VERSION when the report was built')),
+                ('answered_count', models.PositiveIntegerField(default=0, help_text='Session answered_count when the report was built')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('session', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='report', to='interviews.interviewsession')),
+            ],
+            options={
+                'verbose_name': 'Session Report',
+                'verbose_name_plural': 'Session Reports',
+                'db_table': 'session_reports',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
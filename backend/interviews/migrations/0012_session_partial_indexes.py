@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-19 09:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interviews', '0011_session_report'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='interviewsession',
+            index=models.Index(condition=models.Q(('status__in', ['created', 'generating', 'in_progress'])), fields=['user', 'status'], name='session_user_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='interviewsession',
+            index=models.Index(condition=models.Q(('status', 'completed')), fields=['user', 'ended_at'], name='session_user_completed_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-19 09:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interviews', '0012_session_partial_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='interviewsession',
+            index=models.Index(condition=models.Q(('status', 'completed')), fields=['user', '-started_at', '-id'], name='session_user_history_idx'),
+        ),
+    ]
@@ -1,6 +1,15 @@
 from .interview_session import InterviewSession
 from .interview_question import InterviewQuestion
 from .interview_answer import InterviewAnswer
+from .question_bank import QuestionBank
+from .pregenerated_question_set import PregeneratedQuestionSet
+from .session_report import SessionReport
 
-__all__ = ['InterviewSession', 'InterviewQuestion', 'InterviewAnswer']
-
+__all__ = [
+    'InterviewSession',
+    'InterviewQuestion',
+    'InterviewAnswer',
+    'QuestionBank',
+    'PregeneratedQuestionSet',
+    'SessionReport',
+]
@@ -3,6 +3,13 @@ import uuid
 
 
 class InterviewAnswer(models.Model):
+    GRADING_STATUS_CHOICES = [
+        ('heuristic', 'Heuristic'),
+        ('pending', 'LLM Grading Pending'),
+        ('graded', 'LLM Graded'),
+        ('failed', 'LLM Grading Failed'),
+    ]
+    
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     question = models.OneToOneField(
         'interviews.InterviewQuestion',
@@ -24,6 +31,23 @@ class InterviewAnswer(models.Model):
         default=list,
         help_text="Skills assessed in this answer"
     )
+    grading_status = models.CharField(
+        max_length=20,
+        choices=GRADING_STATUS_CHOICES,
+        default='heuristic',
+        help_text="Whether scores come from the heuristic scorer or LLM grading"
+    )
+    idempotency_key = models.CharField(
+        max_length=255,
+        null=True,
+        blank=True,
+        help_text="Idempotency-Key header of the submission, so client retries get the original answer"
+    )
+    rubric_version = models.PositiveIntegerField(
+        default=1,
+        db_index=True,
+        help_text="scorer.RUBRIC_VERSION the scores were computed with"
+    )
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
@@ -23,8 +23,12 @@ class InterviewSession(models.Model):
         ('mixed', 'Mixed'),
     ]
     
+    # Statuses of sessions that can still be answered
+    ACTIVE_STATUSES = ['created', 'generating', 'in_progress']
+    
     STATUS_CHOICES = [
         ('created', 'Created'),
+        ('generating', 'Generating Questions'),
         ('in_progress', 'In Progress'),
         ('completed', 'Completed'),
         ('abandoned', 'Abandoned'),
@@ -53,6 +57,8 @@ class InterviewSession(models.Model):
     type = models.CharField(max_length=20, choices=TYPE_CHOICES)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='created')
     overall_score = models.IntegerField(null=True, blank=True, help_text="Score from 0-100")
+    question_count = models.PositiveIntegerField(default=0, help_text="Number of questions, kept in sync with F() updates")
+    answered_count = models.PositiveIntegerField(default=0, help_text="Number of answered questions, kept in sync with F() updates")
     started_at = models.DateTimeField(auto_now_add=True)
     ended_at = models.DateTimeField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -63,6 +69,25 @@ class InterviewSession(models.Model):
         verbose_name = 'Interview Session'
         verbose_name_plural = 'Interview Sessions'
         ordering = ['-created_at']
+        indexes = [
+            # Partial indexes: per-user dashboards only scan live or finished sessions
+            models.Index(
+                fields=['user', 'status'],
+                name='session_user_active_idx',
+                condition=models.Q(status__in=['created', 'generating', 'in_progress'])
+            ),
+            models.Index(
+                fields=['user', 'ended_at'],
+                name='session_user_completed_idx',
+                condition=models.Q(status='completed')
+            ),
+            # Keyset pagination of the session history (analytics sessions view)
+            models.Index(
+                fields=['user', '-started_at', '-id'],
+                name='session_user_history_idx',
+                condition=models.Q(status='completed')
+            ),
+        ]
 
     def __str__(self):
         return f"{self.user.email} - {self.role_selected.name} ({self.type})"
@@ -0,0 +1,44 @@
+from django.db import models
+import uuid
+
+
+class PregeneratedQuestionSet(models.Model):
+    """A generic LLM question set kept warm for a (role, level, type) combination."""
+    LEVEL_CHOICES = [
+        ('junior', 'Junior'),
+        ('mid', 'Mid-level'),
+        ('senior', 'Senior'),
+    ]
+    
+    TYPE_CHOICES = [
+        ('hr', 'HR'),
+        ('technical', 'Technical'),
+        ('case', 'Case Study'),
+        ('mixed', 'Mixed'),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    role = models.ForeignKey(
+        'roles.RoleCatalog',
+        on_delete=models.CASCADE,
+        related_name='pregenerated_question_sets'
+    )
+    level = models.CharField(max_length=10, choices=LEVEL_CHOICES)
+    type = models.CharField(max_length=20, choices=TYPE_CHOICES)
+    questions_json = models.JSONField(
+        default=list,
+        help_text="Generated questions: question_text, category, difficulty, skill_tags"
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'pregenerated_question_sets'
+        verbose_name = 'Pre-generated Question Set'
+        verbose_name_plural = 'Pre-generated Question Sets'
+        ordering = ['created_at']
+        indexes = [
+            models.Index(fields=['role', 'level', 'type', 'created_at'], name='pregen_question_set_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.role.name} ({self.level}, {self.type}) - {len(self.questions_json)} questions"
@@ -0,0 +1,57 @@
+from django.db import models
+import uuid
+
+
+class QuestionBank(models.Model):
+    CATEGORY_CHOICES = [
+        ('hr', 'HR'),
+        ('technical', 'Technical'),
+        ('case', 'Case Study'),
+        ('behavioral', 'Behavioral'),
+    ]
+    
+    DIFFICULTY_CHOICES = [
+        ('easy', 'Easy'),
+        ('medium', 'Medium'),
+        ('hard', 'Hard'),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    question_text = models.TextField()
+    category = models.CharField(max_length=20, choices=CATEGORY_CHOICES)
+    role_category = models.CharField(
+        max_length=20,
+        blank=True,
+        default='',
+        help_text="RoleCatalog category this question targets; blank for all roles"
+    )
+    difficulty = models.CharField(max_length=10, choices=DIFFICULTY_CHOICES)
+    level_difficulty_json = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text="Per-level difficulty overrides, e.g. {'junior': 'easy'}"
+    )
+    skill_tag = models.CharField(max_length=100, help_text="Primary skill tag assessed by this question")
+    skill_tags_json = models.JSONField(
+        default=list,
+        help_text="List of skill tags assessed by this question"
+    )
+    position = models.PositiveIntegerField(default=0, help_text="Selection priority (lowest first)")
+    is_active = models.BooleanField(default=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'question_bank'
+        verbose_name = 'Question Bank Entry'
+        verbose_name_plural = 'Question Bank'
+        ordering = ['category', 'role_category', 'position']
+        indexes = [
+            models.Index(
+                fields=['category', 'role_category', 'difficulty', 'skill_tag'],
+                name='question_bank_lookup_idx'
+            ),
+        ]
+
+    def __str__(self):
+        return f"[{self.category}] {self.question_text[:50]}"
@@ -0,0 +1,41 @@
+from django.db import models
+import uuid
+
+
+class SessionReport(models.Model):
+    """Report aggregates of a completed session, written when it finishes."""
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    session = models.OneToOneField(
+        'interviews.InterviewSession',
+        on_delete=models.CASCADE,
+        related_name='report'
+    )
+    rubric_breakdown_json = models.JSONField(
+        default=dict,
+        help_text="Average score per rubric dimension"
+    )
+    skill_breakdown_json = models.JSONField(
+        default=dict,
+        help_text="Average score per skill tag"
+    )
+    strengths_json = models.JSONField(default=list, help_text="Top strengths from answer feedback")
+    weaknesses_json = models.JSONField(default=list, help_text="Top weaknesses from answer feedback")
+    rubric_version = models.PositiveIntegerField(
+        default=1,
+        help_text="scorer.RUBRIC_VERSION when the report was built"
+    )
+    answered_count = models.PositiveIntegerField(
+        default=0,
+        help_text="Session answered_count when the report was built"
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'session_reports'
+        verbose_name = 'Session Report'
+        verbose_name_plural = 'Session Reports'
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"Report for {self.session_id}"
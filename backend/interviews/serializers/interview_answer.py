@@ -17,7 +17,7 @@ class InterviewAnswerResponseSerializer(serializers.ModelSerializer):
         model = InterviewAnswer
         fields = [
             'id', 'question', 'answer_text', 'scores_json',
-            'feedback_json', 'skill_tags_json', 'submitted_at', 'time_seconds'
+            'feedback_json', 'skill_tags_json', 'grading_status', 'submitted_at', 'time_seconds'
         ]
         read_only_fields = ['id', 'submitted_at']
     
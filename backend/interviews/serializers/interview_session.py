@@ -17,9 +17,9 @@ class InterviewSessionSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'user', 'created_at', 'updated_at']
     
     def get_progress(self, obj):
-        """Calculate interview progress."""
-        total_questions = obj.questions.count()
-        answered_questions = obj.questions.filter(answer__isnull=False).count()
+        """Calculate interview progress from the session's counters."""
+        total_questions = obj.question_count
+        answered_questions = obj.answered_count
         
         return {
             'current_question': answered_questions + 1 if answered_questions < total_questions else total_questions,
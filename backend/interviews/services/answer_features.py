@@ -0,0 +1,59 @@
+"""
+Features of an answer shared by all scoring dimensions.
+
+The dimension scorers in scorer.py used to lowercase, split and scan the
+answer on their own, so a long answer was tokenized about six times. An
+AnswerFeatures object does that work once per answer.
+"""
+import re
+from typing import Iterable, Set
+
+
+_WORD_RE = re.compile(r'\b\w+\b')
+
+
+class AnswerFeatures:
+    """
+    Tokenization of one answer, computed once.
+    
+    Indicator phrases are plain substring checks on the lowercased answer
+    (so 'how' matches 'however'), the same as the scorers did before. Each
+    scorer asks about its own phrases once, so precomputing the matches for
+    every rubric phrase costs more than it saves at any answer length.
+    
+    Attributes:
+        text: Original answer text
+        lower: Lowercased answer text
+        word_count: Number of whitespace-separated words
+        words: Set of distinct lowercase \\w+ tokens
+        sentence_count: Number of '.', '!' and '?' characters
+    """
+    
+    def __init__(self, answer_text: str):
+        self.text = answer_text
+        self.lower = answer_text.lower()
+        tokens = self.lower.split()
+        self.word_count = len(tokens)
+        self.sentence_count = answer_text.count('.') + answer_text.count('!') + answer_text.count('?')
+        
+        # \w+ tokens never span whitespace, so tokenizing the distinct
+        # words gives the same set as tokenizing the whole answer. A word
+        # made only of \w characters (str.isalnum, or '_') is its own token.
+        distinct = set(tokens)
+        self.words = {token for token in distinct if token.isalnum()}
+        self.words.update(_WORD_RE.findall(
+            '\n'.join(token for token in distinct if not token.isalnum())
+        ))
+    
+    def count(self, phrases: Iterable[str]) -> int:
+        """Number of the given phrases found in the answer."""
+        return sum(1 for phrase in phrases if phrase in self.lower)
+    
+    def has_any(self, phrases: Iterable[str]) -> bool:
+        """True if any of the given phrases is found in the answer."""
+        return any(phrase in self.lower for phrase in phrases)
+
+
+def question_words(question_text: str) -> Set[str]:
+    """Distinct lowercase \\w+ tokens of a question."""
+    return set(_WORD_RE.findall(question_text.lower()))
@@ -0,0 +1,127 @@
+"""
+Recording a submitted answer.
+
+Shared by the REST answers endpoint and the live interview WebSocket
+(interviews.websocket): score the answer, insert it together with the
+session's answered_count, schedule LLM grading and ask a follow-up.
+"""
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.dispatch import receiver
+from django.test.signals import setting_changed
+from analytics.services.cache import schedule_analytics_bump
+from ..models import InterviewSession, InterviewQuestion, InterviewAnswer
+from .scorer import RUBRIC_VERSION, score_answer_with_budget
+from .scoring_registry import ScoringResult
+from .feedback import generate_feedback
+from .llm_grader import is_llm_grading_enabled, schedule_answer_grading
+from .followup import is_followup_enabled, ask_followup
+
+
+class DuplicateAnswerError(Exception):
+    """The question already has an answer from a different submission."""
+
+
+@lru_cache(maxsize=None)
+def get_scoring_budget_ms() -> Optional[float]:
+    """SCORING_LATENCY_BUDGET_MS, read once per process."""
+    return getattr(settings, 'SCORING_LATENCY_BUDGET_MS', None)
+
+
+@receiver(setting_changed)
+def _reset_scoring_budget(setting, **kwargs):
+    if setting == 'SCORING_LATENCY_BUDGET_MS':
+        get_scoring_budget_ms.cache_clear()
+
+
+@dataclass
+class AnswerSubmission:
+    answer: InterviewAnswer
+    scoring: Optional[ScoringResult] = None
+    followup: Optional[InterviewQuestion] = None
+    replayed: bool = False
+
+
+def submit_answer(
+    question: InterviewQuestion,
+    answer_text: str,
+    time_seconds: int = 0,
+    idempotency_key: Optional[str] = None
+) -> AnswerSubmission:
+    """
+    Score and save an answer to a question.
+    
+    Args:
+        question: InterviewQuestion with its session loaded
+        answer_text: The candidate's answer
+        time_seconds: Time taken to answer
+        idempotency_key: Idempotency-Key of the submission, if any
+    
+    Returns:
+        AnswerSubmission; `replayed` is True when a retry with the same
+        idempotency key returned the original answer (with the follow-up
+        that submission asked)
+    
+    Raises:
+        DuplicateAnswerError: If the question was already answered
+    """
+    # Score the answer, skipping model-based scorers that do not fit the budget
+    scoring = score_answer_with_budget(
+        answer_text,
+        question,
+        budget_ms=get_scoring_budget_ms()
+    )
+    scores = scoring.scores
+    
+    # Generate feedback
+    feedback = generate_feedback(answer_text, scores, question)
+    
+    # Get skill tags from question
+    skill_tags = question.skill_tags_json or []
+    
+    # Heuristic scores are returned now; LLM grading replaces them later
+    llm_grading = is_llm_grading_enabled()
+    
+    # Create answer; the OneToOne constraint on question rejects duplicates
+    try:
+        with transaction.atomic():
+            answer = InterviewAnswer.objects.create(
+                question=question,
+                answer_text=answer_text,
+                time_seconds=time_seconds,
+                scores_json=scores,
+                feedback_json=feedback,
+                skill_tags_json=skill_tags,
+                grading_status='pending' if llm_grading else 'heuristic',
+                rubric_version=RUBRIC_VERSION,
+                idempotency_key=idempotency_key
+            )
+            InterviewSession.objects.filter(id=question.session_id).update(
+                answered_count=F('answered_count') + 1
+            )
+    except IntegrityError:
+        # A retry of the same submission gets the original answer back
+        existing = InterviewAnswer.objects.filter(question=question).first()
+        if idempotency_key and existing and existing.idempotency_key == idempotency_key:
+            existing.question = question
+            # Same response as the original: this run's scoring and the
+            # follow-up the original submission inserted, if any
+            followup = question.followup_questions.order_by('created_at').first()
+            return AnswerSubmission(answer=existing, scoring=scoring, followup=followup, replayed=True)
+        raise DuplicateAnswerError()
+    
+    schedule_analytics_bump(question.session.user_id)
+    
+    if llm_grading:
+        schedule_answer_grading(question.session_id)
+    
+    # Probe a weak answer with a follow-up inserted right after this question
+    followup = None
+    if is_followup_enabled():
+        followup = ask_followup(question, answer_text, scores)
+    
+    return AnswerSubmission(answer=answer, scoring=scoring, followup=followup)
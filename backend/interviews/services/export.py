@@ -0,0 +1,144 @@
+"""
+Streaming export of a user's interview history.
+
+Sessions, questions and answers are read with one LEFT JOIN query walked
+through a server-side cursor (QuerySet.iterator), and every row is encoded
+and handed to the response as soon as it is read, so memory use does not
+grow with the size of the history.
+"""
+import csv
+import json
+import zlib
+from typing import Dict, Iterable, Iterator
+from django.conf import settings
+from rest_framework.utils.encoders import JSONEncoder
+from ..models import InterviewSession
+from .report import RUBRIC_DIMENSIONS
+
+
+# Columns of the LEFT JOIN over session -> question -> answer
+SESSION_COLUMNS = {
+    'session_id': 'id',
+    'role': 'role_selected__name',
+    'level': 'level',
+    'type': 'type',
+    'status': 'status',
+    'overall_score': 'overall_score',
+    'started_at': 'started_at',
+    'ended_at': 'ended_at',
+    'question_order': 'questions__order',
+    'question_text': 'questions__question_text',
+    'category': 'questions__category',
+    'difficulty': 'questions__difficulty',
+    'is_followup': 'questions__is_followup',
+    'skill_tags': 'questions__skill_tags_json',
+    'answer_text': 'questions__answer__answer_text',
+    'time_seconds': 'questions__answer__time_seconds',
+    'submitted_at': 'questions__answer__submitted_at',
+    'grading_status': 'questions__answer__grading_status',
+    'scores': 'questions__answer__scores_json',
+    'feedback': 'questions__answer__feedback_json',
+}
+
+# Output columns: the join columns with scores split per rubric dimension
+EXPORT_FIELDS = [
+    column for column in SESSION_COLUMNS if column not in ('scores', 'feedback')
+] + [f'score_{dimension}' for dimension in RUBRIC_DIMENSIONS] + ['feedback']
+
+# Rows joined into one chunk of the response body
+ROWS_PER_CHUNK = 100
+
+# Largest cursor chunk a client may ask for; bounds the rows held in memory
+MAX_EXPORT_CHUNK = 10000
+
+
+def iter_export_rows(user, chunk_size: int = None) -> Iterator[Dict]:
+    """
+    Yield one flat row per (session, question) of a user's history.
+    
+    Sessions without questions produce a single row with empty question and
+    answer columns; unanswered questions have empty answer columns.
+    
+    Args:
+        user: User instance
+        chunk_size: Rows fetched per cursor round trip (default EXPORT_CHUNK_SIZE)
+    
+    Yields:
+        Dictionaries keyed by EXPORT_FIELDS
+    """
+    if chunk_size is None:
+        chunk_size = getattr(settings, 'EXPORT_CHUNK_SIZE', 2000)
+    
+    rows = InterviewSession.objects.filter(user=user).order_by(
+        'created_at', 'id', 'questions__order'
+    ).values_list(*SESSION_COLUMNS.values()).iterator(chunk_size=chunk_size)
+    
+    columns = list(SESSION_COLUMNS)
+    for values in rows:
+        row = dict(zip(columns, values))
+        scores = row.pop('scores') or {}
+        feedback = row.pop('feedback')
+        for dimension in RUBRIC_DIMENSIONS:
+            row[f'score_{dimension}'] = scores.get(dimension)
+        row['session_id'] = str(row['session_id'])
+        row['feedback'] = feedback
+        yield row
+
+
+def export_csv(rows: Iterable[Dict]) -> Iterator[str]:
+    """
+    Encode export rows as CSV, header first.
+    
+    List and dict values (skill tags, feedback) are written as JSON.
+    """
+    buffer = _LineBuffer()
+    writer = csv.writer(buffer)
+    
+    def encode(row):
+        return writer.writerow([_csv_value(row[field]) for field in EXPORT_FIELDS])
+    
+    yield writer.writerow(EXPORT_FIELDS)
+    yield from _join_chunks(encode(row) for row in rows)
+
+
+def export_ndjson(rows: Iterable[Dict]) -> Iterator[str]:
+    """Encode export rows as newline-delimited JSON, one object per line."""
+    encoder = JSONEncoder(ensure_ascii=False)
+    yield from _join_chunks(encoder.encode(row) + '\n' for row in rows)
+
+
+def gzip_stream(chunks: Iterable[str]) -> Iterator[bytes]:
+    """Compress a stream of text chunks into a gzip stream on the fly."""
+    compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode('utf-8'))
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+class _LineBuffer:
+    """File-like object whose write() returns the line instead of storing it."""
+    
+    def write(self, value):
+        return value
+
+
+def _csv_value(value):
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, ensure_ascii=False)
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return value
+
+
+def _join_chunks(lines: Iterable[str]) -> Iterator[str]:
+    """Group lines so the response is not written one row at a time."""
+    chunk = []
+    for line in lines:
+        chunk.append(line)
+        if len(chunk) >= ROWS_PER_CHUNK:
+            yield ''.join(chunk)
+            chunk = []
+    if chunk:
+        yield ''.join(chunk)
@@ -0,0 +1,263 @@
+"""
+Follow-up questions asked right after a weak answer.
+
+When an answer is submitted, a local heuristic picks a templated probe for
+the weakest rubric dimension, or for skill keywords the answer never
+mentions. It only looks at the answer text and the scores the scorer has
+already computed, so it adds well under 10 ms to the request. The probe is
+inserted directly after the answered question: generated questions are
+QUESTION_ORDER_STEP apart, so the follow-up takes the midpoint between the
+question and the next one and no other question is renumbered.
+
+With FOLLOWUP_LLM_REFINEMENT enabled, a Celery task then rewrites the
+templated wording with the LLM, as long as the follow-up is still unanswered.
+"""
+import re
+from typing import Dict, List, Optional
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Min, Q
+from django.utils import timezone
+from ..models import InterviewQuestion, InterviewSession
+from .generator import QUESTION_ORDER_STEP
+from .report import RUBRIC_DIMENSIONS
+
+
+# Templated probes per weak rubric dimension; {topic} is the question's skill
+# keywords, or the keywords the answer missed
+DIMENSION_PROBES = {
+    'structure': (
+        "Could you walk me through that again step by step: what was the "
+        "situation, what did you do, and what was the outcome?"
+    ),
+    'relevance': "Coming back to the question, how does your answer apply to {topic}?",
+    'technical_accuracy': "Can you be more precise about how {topic} works under the hood?",
+    'depth': (
+        "What trade-offs did you consider around {topic}, and what would "
+        "change at a larger scale?"
+    ),
+    'communication': "Could you summarize your answer in two or three sentences?",
+}
+
+KEYWORD_PROBE = "You did not mention {topic}. How would it come into play here?"
+
+# Skill tag segments that are not meaningful keywords on their own
+GENERIC_TAG_PARTS = {'general', 'backend', 'frontend', 'fullstack', 'communication'}
+
+# Session statuses during which the question generator may still append questions
+GENERATION_STATUSES = ['created', 'generating']
+
+_WORD_RE = re.compile(r'\b\w+\b')
+
+
+def is_followup_enabled() -> bool:
+    return getattr(settings, 'FOLLOWUP_QUESTIONS_ENABLED', True)
+
+
+def select_followup(question: InterviewQuestion, answer_text: str, scores: Dict) -> Optional[Dict]:
+    """
+    Pick a templated follow-up for an answer, if it needs one.
+    
+    Args:
+        question: The answered InterviewQuestion
+        answer_text: The candidate's answer
+        scores: Rubric scores of the answer
+    
+    Returns:
+        Question dict (question_text, category, difficulty, skill_tags, reason),
+        or None when the answer is strong enough or the question is itself a
+        follow-up
+    """
+    if question.is_followup:
+        return None
+    
+    keywords = skill_keywords(question.skill_tags_json or [])
+    answer_words = set(_WORD_RE.findall(answer_text.lower()))
+    missing = [keyword for keyword in keywords if keyword not in answer_words]
+    topic = ', '.join(missing or keywords) or 'this'
+    
+    threshold = getattr(settings, 'FOLLOWUP_SCORE_THRESHOLD', 3)
+    weakest = min(RUBRIC_DIMENSIONS, key=lambda dimension: scores.get(dimension, 0))
+    
+    if scores.get(weakest, 0) < threshold:
+        reason = weakest
+        text = DIMENSION_PROBES[weakest].format(topic=topic)
+    elif missing:
+        reason = 'missing_keywords'
+        text = KEYWORD_PROBE.format(topic=topic)
+    else:
+        return None
+    
+    return {
+        'question_text': text,
+        'category': question.category,
+        'difficulty': question.difficulty,
+        'skill_tags': list(question.skill_tags_json or []),
+        'reason': reason,
+    }
+
+
+def skill_keywords(skill_tags: List[str]) -> List[str]:
+    """Specific parts of skill tags, e.g. 'backend.django.auth' -> ['django', 'auth']."""
+    keywords = []
+    for tag in skill_tags:
+        for part in tag.lower().split('.'):
+            if part and part not in GENERIC_TAG_PARTS and part not in keywords:
+                keywords.append(part)
+    return keywords
+
+
+def create_followup(question: InterviewQuestion, followup: Dict) -> Optional[InterviewQuestion]:
+    """
+    Insert a follow-up directly after its parent question.
+    
+    One aggregate query finds the next question's order and the session's
+    follow-up count; the follow-up takes the midpoint order.
+    
+    Args:
+        question: The parent InterviewQuestion
+        followup: Question dict from select_followup
+    
+    Returns:
+        The created InterviewQuestion, or None when the session has reached
+        FOLLOWUP_MAX_PER_SESSION, its questions are still being generated, or
+        there is no free order after the parent
+    """
+    session_id = question.session_id
+    stats = InterviewQuestion.objects.filter(session_id=session_id).aggregate(
+        next_order=Min('order', filter=Q(order__gt=question.order)),
+        followups=Count('id', filter=Q(is_followup=True))
+    )
+    
+    if stats['followups'] >= getattr(settings, 'FOLLOWUP_MAX_PER_SESSION', 3):
+        return None
+    
+    if stats['next_order'] is None:
+        order = question.order + QUESTION_ORDER_STEP
+    else:
+        order = (question.order + stats['next_order']) // 2
+        if order == question.order:
+            # Consecutive orders (e.g. sessions created before sparse ordering)
+            return None
+    
+    try:
+        with transaction.atomic():
+            # Background generation appends questions after the current last
+            # order, so no follow-up is inserted until it has finished
+            if not InterviewSession.objects.filter(id=session_id).exclude(
+                status__in=GENERATION_STATUSES
+            ).update(question_count=F('question_count') + 1):
+                return None
+            created = InterviewQuestion.objects.create(
+                session_id=session_id,
+                order=order,
+                question_text=followup['question_text'],
+                category=followup['category'],
+                difficulty=followup['difficulty'],
+                skill_tags_json=followup['skill_tags'],
+                is_followup=True,
+                parent_question=question
+            )
+    except IntegrityError:
+        # Another follow-up took the same order concurrently
+        return None
+    
+    if getattr(settings, 'FOLLOWUP_LLM_REFINEMENT', False):
+        schedule_followup_refinement(created.id)
+    
+    return created
+
+
+def ask_followup(question: InterviewQuestion, answer_text: str, scores: Dict) -> Optional[InterviewQuestion]:
+    """Select and insert a follow-up for a submitted answer, if it needs one."""
+    followup = select_followup(question, answer_text, scores)
+    if followup is None:
+        return None
+    return create_followup(question, followup)
+
+
+def schedule_followup_refinement(question_id):
+    """Ask a worker to reword a templated follow-up with the LLM."""
+    from ..tasks import refine_followup_question
+    
+    question_id = str(question_id)
+    
+    def enqueue():
+        try:
+            refine_followup_question.delay(question_id)
+        except Exception:
+            # No broker: the templated wording is kept
+            pass
+    
+    transaction.on_commit(enqueue)
+
+
+def refine_followup_with_llm(question_id) -> bool:
+    """
+    Replace a follow-up's templated wording with an LLM-written probe.
+    
+    The text is only replaced while the follow-up is unanswered, so the
+    candidate never answers a question that changes afterwards.
+    
+    Args:
+        question_id: UUID of the follow-up InterviewQuestion
+    
+    Returns:
+        True if the question was updated
+    """
+    from .llm_generator import _complete
+    
+    question = InterviewQuestion.objects.select_related(
+        'parent_question__answer'
+    ).filter(id=question_id, is_followup=True).first()
+    if question is None or question.parent_question is None:
+        return False
+    
+    parent = question.parent_question
+    answer = getattr(parent, 'answer', None)
+    if answer is None:
+        return False
+    
+    prompt = _create_refinement_prompt(parent.question_text, answer.answer_text, question.question_text)
+    try:
+        text = _parse_refinement_response(_complete(prompt, max_tokens=150))
+    except Exception:
+        return False
+    if not text:
+        return False
+    
+    with transaction.atomic():
+        updated = InterviewQuestion.objects.filter(
+            id=question.id,
+            answer__isnull=True
+        ).update(question_text=text)
+        if updated:
+            # Changes the questions endpoint's ETag so clients fetch the new wording
+            InterviewSession.objects.filter(id=question.session_id).update(updated_at=timezone.now())
+    
+    return bool(updated)
+
+
+def _create_refinement_prompt(question_text: str, answer_text: str, probe: str) -> str:
+    return f"""You are an interviewer asking one short follow-up question.
+
+Original question: {question_text}
+
+Candidate's answer: {answer_text}
+
+Draft follow-up: {probe}
+
+Rewrite the draft follow-up so it refers to what the candidate actually said.
+Keep the same intent and ask a single question. Reply with the question only."""
+
+
+def _parse_refinement_response(content: str) -> str:
+    """First non-empty line of the reply, without quotes or a 'Question:' label."""
+    for line in content.splitlines():
+        line = line.strip()
+        if line.lower().startswith('question:'):
+            line = line[len('question:'):]
+        line = line.strip().strip('"').strip()
+        if line:
+            return line
+    return ''
@@ -1,8 +1,24 @@
-import random
-from typing import List, Dict
+import time
+from typing import List, Dict, Optional, Tuple
 from django.conf import settings
+from django.db import transaction
+from django.db.models import Case, F, Value, When
+from django.utils import timezone
 from roles.models import RoleCatalog
-from ..models import InterviewSession, InterviewQuestion
+from ..models import InterviewSession, InterviewQuestion, QuestionBank
+
+
+# Gap between the orders of consecutive generated questions, so follow-up
+# questions can be inserted between them without renumbering (see followup.py)
+QUESTION_ORDER_STEP = 1000
+
+# Pool bucket of bank categories that do not have their own ('hr' entries
+# are served alongside the behavioral ones)
+BANK_CATEGORY_BUCKETS = {'hr': 'behavioral'}
+
+# In-memory candidate pools keyed by (role category, level, type).
+# Each entry is (built_at, pool); see get_question_pool.
+_question_pools: Dict[Tuple[str, str, str], Tuple[float, Dict[str, List[Dict]]]] = {}
 
 
 def select_questions(role: RoleCatalog, level: str, type: str, profile_data: Dict = None) -> List[Dict]:
@@ -18,230 +34,163 @@ def select_questions(role: RoleCatalog, level: str, type: str, profile_data: Dic
     Returns:
         List of question dictionaries
     """
-    # Import QuestionBank model (will be created as a fixture)
-    # For now, we'll use a simple approach with predefined questions
-    # In production, this would query a QuestionBank model
+    pool = get_question_pool(role.category, level, type)
     
-    # This is a placeholder - actual implementation will load from fixtures/database
-    # For MVP, we'll generate questions programmatically based on role and type
+    # Select 10-15 questions with proper distribution
+    questions = _distribute_questions(pool, type)
     
-    questions = []
+    # Copy so callers can annotate questions without touching the cached pool
+    return [
+        {**question, 'skill_tags': list(question['skill_tags'])}
+        for question in questions[:15]  # Limit to 15 questions
+    ]
+
+
+def get_question_pool(role_category: str, level: str, type: str) -> Dict[str, List[Dict]]:
+    """
+    Get the candidate question pool for a role category, level and type.
     
-    # Base questions that can be customized
-    base_questions = _get_base_questions(role, level, type)
+    Pools are built from the QuestionBank table and cached in memory for
+    QUESTION_POOL_CACHE_SECONDS. Saving or deleting a QuestionBank entry
+    clears the cache (see interviews.signals), but only in the process that
+    made the change: other workers keep their pools until the TTL expires.
     
-    # Select 10-15 questions with proper distribution
-    questions = _distribute_questions(base_questions, type)
+    Args:
+        role_category: RoleCatalog category (e.g. 'backend')
+        level: 'junior', 'mid', or 'senior'
+        type: 'hr', 'technical', 'case', or 'mixed'
+        
+    Returns:
+        Dictionary mapping bucket name to an ordered list of question dicts
+    """
+    key = (role_category, level, type)
+    ttl = getattr(settings, 'QUESTION_POOL_CACHE_SECONDS', 300)
+    now = time.monotonic()
+    
+    cached = _question_pools.get(key)
+    if cached and now - cached[0] < ttl:
+        return cached[1]
     
-    return questions[:15]  # Limit to 15 questions
+    pool = _build_question_pool(role_category, level, type)
+    _question_pools[key] = (now, pool)
+    return pool
+
+
+def clear_question_pool_cache():
+    """Drop all cached question pools."""
+    _question_pools.clear()
 
 
-def _get_base_questions(role: RoleCatalog, level: str, type: str) -> List[Dict]:
+def _build_question_pool(role_category: str, level: str, type: str) -> Dict[str, List[Dict]]:
     """
-    Get base questions based on role category and type.
-    This is a simplified version - in production, load from QuestionBank model.
+    Load active bank questions for a role category and split them into the
+    buckets used by _distribute_questions.
     """
-    questions = []
-    
-    # HR Questions
+    categories = []
     if type in ['hr', 'mixed']:
-        hr_questions = [
-            {
-                'question_text': 'Tell me about yourself.',
-                'category': 'behavioral',
-                'difficulty': 'easy',
-                'skill_tags': ['communication.star']
-            },
-            {
-                'question_text': 'Describe a time when you had to work under pressure.',
-                'category': 'behavioral',
-                'difficulty': 'medium',
-                'skill_tags': ['communication.star', 'behavioral.pressure']
-            },
-            {
-                'question_text': 'Tell me about a challenging project you worked on.',
-                'category': 'behavioral',
-                'difficulty': 'medium',
-                'skill_tags': ['communication.star', 'behavioral.challenge']
-            },
-            {
-                'question_text': 'How do you handle conflicts in a team?',
-                'category': 'behavioral',
-                'difficulty': 'medium',
-                'skill_tags': ['communication.star', 'behavioral.conflict']
-            },
-            {
-                'question_text': 'What are your strengths and weaknesses?',
-                'category': 'behavioral',
-                'difficulty': 'easy',
-                'skill_tags': ['communication.star']
-            },
-        ]
-        questions.extend(hr_questions)
-    
-    # Technical Questions (role-specific)
+        categories.extend(['behavioral', 'hr'])
     if type in ['technical', 'mixed']:
-        tech_questions = _get_technical_questions(role, level)
-        questions.extend(tech_questions)
-    
-    # Case Study Questions
+        categories.append('technical')
     if type in ['case', 'mixed']:
-        case_questions = [
-            {
-                'question_text': 'Design a URL shortening service like bit.ly.',
-                'category': 'case',
-                'difficulty': 'hard',
-                'skill_tags': ['system_design.scaling', 'system_design.architecture']
-            },
-            {
-                'question_text': 'How would you design a notification system for a social media app?',
-                'category': 'case',
-                'difficulty': 'hard',
-                'skill_tags': ['system_design.scaling', 'system_design.real_time']
-            },
-        ]
-        questions.extend(case_questions)
+        categories.append('case')
     
-    return questions
+    entries = QuestionBank.objects.filter(
+        is_active=True,
+        category__in=categories,
+        role_category__in=['', role_category]
+    ).order_by('position', 'created_at').values(
+        'question_text', 'category', 'difficulty', 'level_difficulty_json', 'skill_tags_json'
+    )
+    
+    pool = {
+        'behavioral': [],
+        'technical': [],
+        'technical_core': [],
+        'technical_hard': [],
+        'case': [],
+    }
+    
+    for entry in entries:
+        question = {
+            'question_text': entry['question_text'],
+            'category': entry['category'],
+            'difficulty': _difficulty_for_level(entry, level),
+            'skill_tags': entry['skill_tags_json'] or [],
+        }
+        pool[BANK_CATEGORY_BUCKETS.get(question['category'], question['category'])].append(question)
+        
+        if question['category'] == 'technical':
+            if question['difficulty'] == 'hard':
+                pool['technical_hard'].append(question)
+            else:
+                pool['technical_core'].append(question)
+    
+    return pool
 
 
-def _get_technical_questions(role: RoleCatalog, level: str) -> List[Dict]:
-    """Get technical questions based on role category."""
-    questions = []
-    
-    category = role.category
-    
-    if category == 'backend':
-        questions.extend([
-            {
-                'question_text': 'Explain how REST APIs work.',
-                'category': 'technical',
-                'difficulty': 'easy' if level == 'junior' else 'medium',
-                'skill_tags': ['backend.api.rest']
-            },
-            {
-                'question_text': 'What is the difference between SQL and NoSQL databases?',
-                'category': 'technical',
-                'difficulty': 'medium',
-                'skill_tags': ['backend.database']
-            },
-            {
-                'question_text': 'Explain authentication and authorization.',
-                'category': 'technical',
-                'difficulty': 'medium',
-                'skill_tags': ['backend.auth']
-            },
-            {
-                'question_text': 'How do you handle database migrations?',
-                'category': 'technical',
-                'difficulty': 'medium',
-                'skill_tags': ['backend.database.migrations']
-            },
-            {
-                'question_text': 'Explain microservices architecture.',
-                'category': 'technical',
-                'difficulty': 'hard',
-                'skill_tags': ['backend.architecture.microservices']
-            },
-        ])
-    elif category == 'frontend':
-        questions.extend([
-            {
-                'question_text': 'Explain the difference between let, const, and var in JavaScript.',
-                'category': 'technical',
-                'difficulty': 'easy',
-                'skill_tags': ['frontend.javascript']
-            },
-            {
-                'question_text': 'What is React and how does it work?',
-                'category': 'technical',
-                'difficulty': 'medium',
-                'skill_tags': ['frontend.react']
-            },
-            {
-                'question_text': 'Explain the virtual DOM concept.',
-                'category': 'technical',
-                'difficulty': 'medium',
-                'skill_tags': ['frontend.react.virtual_dom']
-            },
-            {
-                'question_text': 'How do you optimize frontend performance?',
-                'category': 'technical',
-                'difficulty': 'hard',
-                'skill_tags': ['frontend.performance']
-            },
-        ])
-    elif category == 'fullstack':
-        questions.extend([
-            {
-                'question_text': 'Explain the full-stack development workflow.',
-                'category': 'technical',
-                'difficulty': 'medium',
-                'skill_tags': ['fullstack.workflow']
-            },
-            {
-                'question_text': 'How do you handle state management in a full-stack application?',
-                'category': 'technical',
-                'difficulty': 'hard',
-                'skill_tags': ['fullstack.state_management']
-            },
-        ])
-    
-    # Adjust difficulty based on level
-    for q in questions:
-        if level == 'junior' and q['difficulty'] == 'hard':
-            q['difficulty'] = 'medium'
-        elif level == 'senior' and q['difficulty'] == 'easy':
-            q['difficulty'] = 'medium'
+def _difficulty_for_level(entry: Dict, level: str) -> str:
+    """Resolve a bank entry's difficulty for the candidate's level."""
+    overrides = entry['level_difficulty_json'] or {}
+    if level in overrides:
+        return overrides[level]
     
-    return questions
+    difficulty = entry['difficulty']
+    
+    # Adjust technical difficulty based on level
+    if entry['category'] == 'technical':
+        if level == 'junior' and difficulty == 'hard':
+            return 'medium'
+        elif level == 'senior' and difficulty == 'easy':
+            return 'medium'
+    
+    return difficulty
 
 
-def _distribute_questions(questions: List[Dict], type: str) -> List[Dict]:
+def _distribute_questions(pool: Dict[str, List[Dict]], type: str) -> List[Dict]:
     """
     Ensure proper question distribution based on interview type.
     
+    Picks from the precomputed buckets of a question pool, so the cost only
+    depends on the number of questions selected.
+    
     Args:
-        questions: List of question dicts
+        pool: Question pool from get_question_pool
         type: Interview type
         
     Returns:
         Distributed list of questions
     """
+    behavioral = pool['behavioral']
+    technical = pool['technical']
+    case = pool['case']
+    
     if type == 'hr':
         # 40% behavioral, 30% situational, 30% role-specific
-        behavioral = [q for q in questions if q['category'] == 'behavioral']
-        technical = [q for q in questions if q['category'] == 'technical']
-        
         selected = []
         selected.extend(behavioral[:4])  # 40%
         selected.extend(technical[:3])   # 30%
         # Add more behavioral if needed
         if len(selected) < 10:
-            selected.extend(behavioral[4:])
+            selected.extend(behavioral[4:4 + 10 - len(selected)])
         
         return selected[:10]
     
     elif type == 'technical':
         # 50% core, 30% advanced, 20% practical
-        technical = [q for q in questions if q['category'] == 'technical']
-        easy_medium = [q for q in technical if q['difficulty'] in ['easy', 'medium']]
-        hard = [q for q in technical if q['difficulty'] == 'hard']
+        easy_medium = pool['technical_core']
+        hard = pool['technical_hard']
         
         selected = []
         selected.extend(easy_medium[:5])  # 50%
         selected.extend(hard[:3])          # 30%
         # Fill remaining with medium
         if len(selected) < 10:
-            selected.extend(easy_medium[5:])
+            selected.extend(easy_medium[5:5 + 10 - len(selected)])
         
         return selected[:10]
     
     elif type == 'case':
         # 60% problem-solving, 40% system design
-        case = [q for q in questions if q['category'] == 'case']
-        technical = [q for q in questions if q['category'] == 'technical']
-        
         selected = []
         selected.extend(case[:6])      # 60%
         selected.extend(technical[:4]) # 40%
@@ -250,10 +199,6 @@ def _distribute_questions(questions: List[Dict], type: str) -> List[Dict]:
     
     else:  # mixed
         # Balanced distribution
-        behavioral = [q for q in questions if q['category'] == 'behavioral']
-        technical = [q for q in questions if q['category'] == 'technical']
-        case = [q for q in questions if q['category'] == 'case']
-        
         selected = []
         selected.extend(behavioral[:3])
         selected.extend(technical[:4])
@@ -291,11 +236,124 @@ def assign_skill_tags(questions: List[Dict], role: RoleCatalog) -> List[Dict]:
     return questions
 
 
+def _select_local_questions(session: InterviewSession) -> List[Dict]:
+    """Select and tag questions for a session from the local question bank."""
+    profile_data = None
+    if session.profile:
+        profile_data = session.profile.data_json
+    
+    question_dicts = select_questions(
+        session.role_selected,
+        session.level,
+        session.type,
+        profile_data
+    )
+    
+    return assign_skill_tags(question_dicts, session.role_selected)
+
+
+def generate_opening_question(session: InterviewSession) -> Optional[InterviewQuestion]:
+    """
+    Create the first question of a session from the local question bank.
+    
+    Used when the remaining questions are generated in the background, so
+    the candidate can start answering straight away.
+    
+    Args:
+        session: InterviewSession instance
+        
+    Returns:
+        The created InterviewQuestion, or None if no question is available
+    """
+    question_dicts = _select_local_questions(session)
+    if not question_dicts:
+        return None
+    
+    q_dict = question_dicts[0]
+    with transaction.atomic():
+        question = InterviewQuestion.objects.create(
+            session=session,
+            order=QUESTION_ORDER_STEP,
+            question_text=q_dict['question_text'],
+            category=q_dict['category'],
+            difficulty=q_dict['difficulty'],
+            skill_tags_json=q_dict.get('skill_tags', [])
+        )
+        InterviewSession.objects.filter(id=session.id).update(question_count=F('question_count') + 1)
+    
+    return question
+
+
+def _save_questions(
+    session: InterviewSession,
+    question_dicts: List[Dict],
+    start_order: int,
+    mark_in_progress: bool = True
+) -> List[InterviewQuestion]:
+    """
+    Write questions with a single INSERT and mark the session in progress.
+    
+    start_order is the position of the first question; its `order` is the
+    position times QUESTION_ORDER_STEP.
+    
+    Both writes share one transaction, so a session never becomes
+    'in_progress' with a partial question set. The same UPDATE bumps the
+    session's question_count. Pass mark_in_progress=False while more
+    questions are still streaming in.
+    """
+    questions = [
+        InterviewQuestion(
+            session=session,
+            order=idx * QUESTION_ORDER_STEP,
+            question_text=q_dict['question_text'],
+            category=q_dict.get('category', 'technical'),
+            difficulty=q_dict.get('difficulty', 'medium'),
+            skill_tags_json=q_dict.get('skill_tags', [])
+        )
+        for idx, q_dict in enumerate(question_dicts, start=start_order)
+    ]
+    
+    with transaction.atomic():
+        InterviewQuestion.objects.bulk_create(questions)
+        if mark_in_progress:
+            _mark_in_progress(session, added=len(questions))
+        elif questions:
+            InterviewSession.objects.filter(id=session.id).update(
+                question_count=F('question_count') + len(questions)
+            )
+    
+    return questions
+
+
+def _mark_in_progress(session: InterviewSession, added: int = 0):
+    """
+    Move a session that is still being prepared to 'in_progress', adding
+    `added` new questions to its question_count in the same UPDATE.
+    """
+    InterviewSession.objects.filter(id=session.id).update(
+        status=Case(
+            When(status__in=['created', 'generating'], then=Value('in_progress')),
+            default=F('status')
+        ),
+        question_count=F('question_count') + added,
+        updated_at=timezone.now()
+    )
+
+
 def generate_interview_questions(session_id: str) -> List[InterviewQuestion]:
     """
     Main function that generates questions for an interview session.
     Uses LLM if configured, otherwise falls back to hardcoded questions.
     
+    Questions that already exist for the session (e.g. the opening question
+    created by generate_opening_question) are kept; new questions are
+    appended after them. The session is moved to 'in_progress' in the same
+    transaction that writes the questions.
+    
+    When the LLM generates questions from scratch, each question is saved as
+    soon as it has streamed in, so clients following the session (see
+    services.question_stream) can show it before the whole set is ready.
+    
     Args:
         session_id: UUID of InterviewSession
         
@@ -303,24 +361,32 @@ def generate_interview_questions(session_id: str) -> List[InterviewQuestion]:
         List of InterviewQuestion objects
     """
     try:
-        session = InterviewSession.objects.get(id=session_id)
+        session = InterviewSession.objects.select_related(
+            'role_selected', 'profile'
+        ).get(id=session_id)
     except InterviewSession.DoesNotExist:
         return []
     
+    existing = list(session.questions.order_by().values_list('question_text', 'order'))
+    existing_texts = {text for text, order in existing}
+    next_order = max((order for text, order in existing), default=0) // QUESTION_ORDER_STEP + 1
+    streamed = []
+    
     # Try to use LLM for question generation
     use_llm = getattr(settings, 'USE_LLM_FOR_QUESTIONS', False)
     
     if use_llm:
         try:
-            from .llm_generator import generate_questions_with_llm
+            from .llm_generator import stream_questions_with_llm
+            from .question_pool import take_pooled_questions
             
             # Get CV document if available
             cv_document = None
             if session.profile and session.profile.cv_document:
                 cv_document = session.profile.cv_document
             
-            # Generate questions using LLM
-            question_dicts = generate_questions_with_llm(
+            # Take a pre-generated set when the warm pool has one
+            question_dicts = take_pooled_questions(
                 role=session.role_selected,
                 level=session.level,
                 interview_type=session.type,
@@ -328,54 +394,40 @@ def generate_interview_questions(session_id: str) -> List[InterviewQuestion]:
                 cv_document=cv_document
             )
             
-            # If LLM returned questions, use them
-            if question_dicts:
-                # Create InterviewQuestion objects
-                questions = []
-                for idx, q_dict in enumerate(question_dicts, start=1):
-                    question = InterviewQuestion.objects.create(
-                        session=session,
-                        order=idx,
-                        question_text=q_dict['question_text'],
-                        category=q_dict.get('category', 'technical'),
-                        difficulty=q_dict.get('difficulty', 'medium'),
-                        skill_tags_json=q_dict.get('skill_tags', [])
-                    )
-                    questions.append(question)
+            if question_dicts is not None:
+                question_dicts = [
+                    q for q in question_dicts if q['question_text'] not in existing_texts
+                ]
+                if question_dicts:
+                    return _save_questions(session, question_dicts, next_order)
+            else:
+                # Otherwise generate questions using LLM, saving each as it arrives
+                for q_dict in stream_questions_with_llm(
+                    role=session.role_selected,
+                    level=session.level,
+                    interview_type=session.type,
+                    profile=session.profile,
+                    cv_document=cv_document
+                ):
+                    if q_dict['question_text'] in existing_texts:
+                        continue
+                    streamed.extend(_save_questions(session, [q_dict], next_order, mark_in_progress=False))
+                    existing_texts.add(q_dict['question_text'])
+                    next_order += 1
                 
-                return questions
+                if streamed:
+                    _mark_in_progress(session)
+                    return streamed
         except Exception as e:
             # Log error but continue with fallback
             pass
     
-    # Fallback to hardcoded questions
-    profile_data = None
-    if session.profile:
-        profile_data = session.profile.data_json
+    # Fallback to hardcoded questions, topping up any that were already streamed
+    question_dicts = [
+        q for q in _select_local_questions(session)
+        if q['question_text'] not in existing_texts
+    ]
+    if streamed:
+        question_dicts = question_dicts[:max(10 - len(streamed), 0)]
     
-    # Select questions using hardcoded generator
-    question_dicts = select_questions(
-        session.role_selected,
-        session.level,
-        session.type,
-        profile_data
-    )
-    
-    # Assign skill tags
-    question_dicts = assign_skill_tags(question_dicts, session.role_selected)
-    
-    # Create InterviewQuestion objects
-    questions = []
-    for idx, q_dict in enumerate(question_dicts, start=1):
-        question = InterviewQuestion.objects.create(
-            session=session,
-            order=idx,
-            question_text=q_dict['question_text'],
-            category=q_dict['category'],
-            difficulty=q_dict['difficulty'],
-            skill_tags_json=q_dict.get('skill_tags', [])
-        )
-        questions.append(question)
-    
-    return questions
-
+    return streamed + _save_questions(session, question_dicts, next_order)
@@ -4,10 +4,20 @@ Uses OpenAI or Anthropic to generate personalized interview questions.
 """
 import os
 import json
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterable, Iterator, Optional
 from django.conf import settings
 from roles.models import RoleCatalog
 from profiles.models import Profile, CVDocument
+from .stream_parser import IncrementalJSONArrayParser
+
+
+# System prompt of the OpenAI chat completions
+INTERVIEWER_SYSTEM_PROMPT = (
+    "You are an expert technical interviewer who creates personalized, relevant interview "
+    "questions based on candidate profiles, roles, and experience levels."
+)
+# Anthropic calls put the interviewer role in front of the user prompt instead
+INTERVIEWER_PREAMBLE = "You are an expert technical interviewer."
 
 
 def generate_questions_with_llm(
@@ -44,14 +54,120 @@ def generate_questions_with_llm(
         return select_questions(role, level, interview_type, profile_data)
 
 
-def _generate_with_openai(
+def stream_questions_with_llm(
     role: RoleCatalog,
     level: str,
     interview_type: str,
     profile: Optional[Profile] = None,
     cv_document: Optional[CVDocument] = None
+) -> Iterator[Dict]:
+    """
+    Generate personalized interview questions, yielding each one as soon as
+    the LLM has finished writing it.
+    
+    Provider errors are raised to the caller; there is no hardcoded fallback.
+    
+    Args:
+        role: RoleCatalog instance
+        level: 'junior', 'mid', or 'senior'
+        interview_type: 'hr', 'technical', 'case', or 'mixed'
+        profile: Optional Profile instance with extracted data
+        cv_document: Optional CVDocument instance
+        
+    Yields:
+        Question dictionaries
+    """
+    llm_provider = getattr(settings, 'LLM_PROVIDER', 'openai').lower()
+    
+    context = _build_context(role, level, interview_type, profile, cv_document)
+    prompt = _create_question_generation_prompt(context, interview_type)
+    
+    if llm_provider == 'openai':
+        chunks = _openai_stream(_get_openai_client(), prompt, max_tokens=2000)
+    elif llm_provider == 'anthropic':
+        chunks = _anthropic_stream(_get_anthropic_client(), prompt, max_tokens=2000)
+    else:
+        raise ValueError(f"Unsupported LLM_PROVIDER: {llm_provider}")
+    
+    yield from _parse_question_stream(chunks)
+
+
+def generate_generic_questions_with_llm(
+    role: RoleCatalog,
+    level: str,
+    interview_type: str
 ) -> List[Dict]:
-    """Generate questions using OpenAI API."""
+    """
+    Generate a question set for a role, level and type without candidate data.
+    
+    Used to pre-generate question sets for the warm pool. Unlike
+    generate_questions_with_llm this does not fall back to hardcoded
+    questions: provider errors are raised to the caller.
+    
+    Args:
+        role: RoleCatalog instance
+        level: 'junior', 'mid', or 'senior'
+        interview_type: 'hr', 'technical', 'case', or 'mixed'
+        
+    Returns:
+        List of question dictionaries
+    """
+    context = _build_context(role, level, interview_type)
+    prompt = _create_question_generation_prompt(context, interview_type)
+    
+    content = _complete(prompt, max_tokens=2000)
+    return _parse_llm_response(content)
+
+
+def personalize_questions_with_llm(
+    role: RoleCatalog,
+    level: str,
+    interview_type: str,
+    profile: Optional[Profile] = None,
+    cv_document: Optional[CVDocument] = None,
+    count: int = 3
+) -> List[Dict]:
+    """
+    Generate a few questions tailored to the candidate's profile.
+    
+    Uses a much smaller prompt and token budget than full generation, so it
+    can run at session creation on top of a pre-generated question set.
+    
+    Args:
+        role: RoleCatalog instance
+        level: 'junior', 'mid', or 'senior'
+        interview_type: 'hr', 'technical', 'case', or 'mixed'
+        profile: Optional Profile instance with extracted data
+        cv_document: Optional CVDocument instance
+        count: Number of questions to generate
+        
+    Returns:
+        List of question dictionaries (empty on error)
+    """
+    context = _build_context(role, level, interview_type, profile, cv_document)
+    prompt = _create_personalization_prompt(context, count)
+    
+    try:
+        content = _complete(prompt, max_tokens=150 * count + 100)
+        return _parse_llm_response(content)[:count]
+    except Exception as e:
+        return []
+
+
+def _complete(prompt: str, max_tokens: int) -> str:
+    """Send a prompt to the configured LLM provider and return the text reply."""
+    llm_provider = getattr(settings, 'LLM_PROVIDER', 'openai').lower()
+    
+    if llm_provider == 'openai':
+        return _openai_complete(_get_openai_client(), prompt, max_tokens)
+    elif llm_provider == 'anthropic':
+        return _anthropic_complete(_get_anthropic_client(), prompt, max_tokens)
+    
+    raise ValueError(f"Unsupported LLM_PROVIDER: {llm_provider}")
+
+
+def _get_openai_client():
+    """Create an OpenAI client from settings."""
     try:
         import openai
     except ImportError:
@@ -61,7 +177,97 @@ def _generate_with_openai(
     if not api_key:
         raise ValueError("OPENAI_API_KEY not configured in settings")
     
-    client = openai.OpenAI(api_key=api_key)
+    return openai.OpenAI(api_key=api_key)
+
+
+def _get_anthropic_client():
+    """Create an Anthropic client from settings."""
+    try:
+        from anthropic import Anthropic
+    except ImportError:
+        raise ImportError("anthropic package is required. Install with: pip install anthropic")
+    
+    api_key = getattr(settings, 'ANTHROPIC_API_KEY', None)
+    if not api_key:
+        raise ValueError("ANTHROPIC_API_KEY not configured in settings")
+    
+    return Anthropic(api_key=api_key)
+
+
+def _openai_messages(prompt: str) -> List[Dict]:
+    """Chat messages for a prompt, after the interviewer system prompt."""
+    return [
+        {"role": "system", "content": INTERVIEWER_SYSTEM_PROMPT},
+        {"role": "user", "content": prompt}
+    ]
+
+
+def _anthropic_messages(prompt: str) -> List[Dict]:
+    """A single user message: the interviewer preamble followed by the prompt."""
+    return [
+        {"role": "user", "content": f"{INTERVIEWER_PREAMBLE} {prompt}"}
+    ]
+
+
+def _openai_complete(client, prompt: str, max_tokens: int) -> str:
+    """Run a chat completion with the interviewer system prompt."""
+    response = client.chat.completions.create(
+        model=getattr(settings, 'OPENAI_MODEL', 'gpt-4'),
+        messages=_openai_messages(prompt),
+        temperature=0.7,
+        max_tokens=max_tokens
+    )
+    
+    return response.choices[0].message.content
+
+
+def _anthropic_complete(client, prompt: str, max_tokens: int) -> str:
+    """Run a message completion with the interviewer preamble."""
+    message = client.messages.create(
+        model=getattr(settings, 'ANTHROPIC_MODEL', 'claude-3-sonnet-20240229'),
+        max_tokens=max_tokens,
+        temperature=0.7,
+        messages=_anthropic_messages(prompt)
+    )
+    
+    return message.content[0].text
+
+
+def _openai_stream(client, prompt: str, max_tokens: int) -> Iterator[str]:
+    """Stream a chat completion, yielding text deltas."""
+    stream = client.chat.completions.create(
+        model=getattr(settings, 'OPENAI_MODEL', 'gpt-4'),
+        messages=_openai_messages(prompt),
+        temperature=0.7,
+        max_tokens=max_tokens,
+        stream=True
+    )
+    
+    for chunk in stream:
+        if chunk.choices and chunk.choices[0].delta.content:
+            yield chunk.choices[0].delta.content
+
+
+def _anthropic_stream(client, prompt: str, max_tokens: int) -> Iterator[str]:
+    """Stream a message completion, yielding text deltas."""
+    with client.messages.stream(
+        model=getattr(settings, 'ANTHROPIC_MODEL', 'claude-3-sonnet-20240229'),
+        max_tokens=max_tokens,
+        temperature=0.7,
+        messages=_anthropic_messages(prompt)
+    ) as stream:
+        yield from stream.text_stream
+
+
+def _generate_with_openai(
+    role: RoleCatalog,
+    level: str,
+    interview_type: str,
+    profile: Optional[Profile] = None,
+    cv_document: Optional[CVDocument] = None
+) -> List[Dict]:
+    """Generate questions using OpenAI API."""
+    client = _get_openai_client()
     
     # Build context for the LLM
     context = _build_context(role, level, interview_type, profile, cv_document)
@@ -70,25 +276,9 @@ def _generate_with_openai(
     prompt = _create_question_generation_prompt(context, interview_type)
     
     try:
-        response = client.chat.completions.create(
-            model=getattr(settings, 'OPENAI_MODEL', 'gpt-4'),
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are an expert technical interviewer who creates personalized, relevant interview questions based on candidate profiles, roles, and experience levels."
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            temperature=0.7,
-            max_tokens=2000
-        )
-        
-        # Parse the response
-        content = response.choices[0].message.content
-        questions = _parse_llm_response(content)
+        # Parse questions as the response streams in
+        chunks = _openai_stream(client, prompt, max_tokens=2000)
+        questions = list(_parse_question_stream(chunks))
         
         return questions
         
@@ -107,16 +297,7 @@ def _generate_with_anthropic(
     cv_document: Optional[CVDocument] = None
 ) -> List[Dict]:
     """Generate questions using Anthropic Claude API."""
-    try:
-        from anthropic import Anthropic
-    except ImportError:
-        raise ImportError("anthropic package is required. Install with: pip install anthropic")
-    
-    api_key = getattr(settings, 'ANTHROPIC_API_KEY', None)
-    if not api_key:
-        raise ValueError("ANTHROPIC_API_KEY not configured in settings")
-    
-    client = Anthropic(api_key=api_key)
+    client = _get_anthropic_client()
     
     # Build context for the LLM
     context = _build_context(role, level, interview_type, profile, cv_document)
@@ -125,21 +306,9 @@ def _generate_with_anthropic(
     prompt = _create_question_generation_prompt(context, interview_type)
     
     try:
-        message = client.messages.create(
-            model=getattr(settings, 'ANTHROPIC_MODEL', 'claude-3-sonnet-20240229'),
-            max_tokens=2000,
-            temperature=0.7,
-            messages=[
-                {
-                    "role": "user",
-                    "content": f"You are an expert technical interviewer. {prompt}"
-                }
-            ]
-        )
-        
-        # Parse the response
-        content = message.content[0].text
-        questions = _parse_llm_response(content)
+        # Parse questions as the response streams in
+        chunks = _anthropic_stream(client, prompt, max_tokens=2000)
+        questions = list(_parse_question_stream(chunks))
         
         return questions
         
@@ -268,6 +437,26 @@ Generate {question_count} questions now:"""
     return prompt
 
 
+def _create_personalization_prompt(context: Dict, count: int) -> str:
+    """Create a short prompt for a few profile-specific questions."""
+    role_info = context['role']
+    candidate_info = context.get('candidate', {})
+    skills = candidate_info.get('skills', [])
+    projects = candidate_info.get('projects', [])
+    cv_text = context.get('cv_text', '')
+    
+    candidate_summary = f"- Skills: {', '.join(skills[:10]) if skills else 'Not specified'}"
+    if projects:
+        candidate_summary += f"\n- Projects: {len(projects)} project(s)"
+    if cv_text:
+        candidate_summary += f"\n- CV Excerpt: {cv_text[:300]}"
+    
+    return f"""Generate {count} interview questions for a {context['level']}-level {role_info['name']} ({context['interview_type']} interview) that refer to this candidate's background:
+{candidate_summary}
+
+Return ONLY a valid JSON array of objects with "question_text", "category" ("behavioral", "technical" or "case"), "difficulty" ("easy", "medium" or "hard") and "skill_tags" (array of strings)."""
+
+
 def _parse_llm_response(content: str) -> List[Dict]:
     """Parse LLM response and extract questions."""
     try:
@@ -293,12 +482,7 @@ def _parse_llm_response(content: str) -> List[Dict]:
         normalized_questions = []
         for q in questions:
             if isinstance(q, dict) and 'question_text' in q:
-                normalized_questions.append({
-                    'question_text': q['question_text'],
-                    'category': q.get('category', 'technical'),
-                    'difficulty': q.get('difficulty', 'medium'),
-                    'skill_tags': q.get('skill_tags', []),
-                })
+                normalized_questions.append(_normalize_question(q))
         
         return normalized_questions[:15]  # Limit to 15 questions
         
@@ -306,3 +490,30 @@ def _parse_llm_response(content: str) -> List[Dict]:
         # Return empty list, will fallback to hardcoded questions
         return []
 
+
+
+def _parse_question_stream(chunks: Iterable[str]) -> Iterator[Dict]:
+    """Yield normalized questions from streamed response text as each completes."""
+    parser = IncrementalJSONArrayParser()
+    count = 0
+    
+    for chunk in chunks:
+        for q in parser.feed(chunk):
+            if 'question_text' not in q:
+                continue
+            yield _normalize_question(q)
+            count += 1
+            if count >= 15:  # Limit to 15 questions
+                return
+        if parser.finished:
+            return
+
+
+def _normalize_question(q: Dict) -> Dict:
+    """Keep the fields used to create an InterviewQuestion."""
+    return {
+        'question_text': q['question_text'],
+        'category': q.get('category', 'technical'),
+        'difficulty': q.get('difficulty', 'medium'),
+        'skill_tags': q.get('skill_tags', []),
+    }
@@ -0,0 +1,187 @@
+"""
+Background LLM grading of answers.
+
+With ANSWER_GRADING_MODE = 'llm', an answer is first scored by the heuristic
+scorer so the candidate gets scores and feedback at once, and saved with
+grading_status 'pending'. A Celery task then grades the session's pending
+answers with one LLM prompt per batch and replaces scores_json and
+feedback_json in place. If grading fails the heuristic result is kept.
+"""
+import json
+import re
+from typing import Dict, List
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+from ..models import InterviewAnswer, InterviewSession
+from .rescore import DIMENSIONS, recompute_session_scores
+
+
+def is_llm_grading_enabled() -> bool:
+    return getattr(settings, 'ANSWER_GRADING_MODE', 'heuristic') == 'llm'
+
+
+def schedule_answer_grading(session_id):
+    """
+    Grade the session's pending answers after ANSWER_GRADING_BATCH_DELAY_SECONDS.
+    
+    Answers submitted while a grading run is already scheduled join that run
+    instead of starting another one.
+    """
+    from ..tasks import grade_session_answers
+    
+    delay = getattr(settings, 'ANSWER_GRADING_BATCH_DELAY_SECONDS', 30)
+    lock_key = _grading_lock_key(session_id)
+    if not cache.add(lock_key, True, timeout=delay + 300):
+        return
+    
+    session_id = str(session_id)
+    
+    def enqueue():
+        try:
+            grade_session_answers.apply_async((session_id,), countdown=delay)
+        except Exception:
+            # No broker: answers keep their heuristic scores
+            cache.delete(lock_key)
+            InterviewAnswer.objects.filter(
+                question__session_id=session_id,
+                grading_status='pending'
+            ).update(grading_status='failed')
+    
+    transaction.on_commit(enqueue)
+
+
+def grade_pending_answers(session_id) -> int:
+    """
+    Grade all pending answers of a session with the LLM.
+    
+    Args:
+        session_id: UUID of InterviewSession
+    
+    Returns:
+        Number of answers graded
+    """
+    # Release the lock first so answers arriving from now on schedule a new run
+    cache.delete(_grading_lock_key(session_id))
+    
+    answers = list(
+        InterviewAnswer.objects.filter(
+            question__session_id=session_id,
+            grading_status='pending'
+        ).select_related('question').order_by('question__order')
+    )
+    batch_size = getattr(settings, 'ANSWER_GRADING_BATCH_SIZE', 10)
+    
+    graded = 0
+    for start in range(0, len(answers), batch_size):
+        batch = answers[start:start + batch_size]
+        try:
+            grades = grade_answers_with_llm(batch)
+        except Exception:
+            grades = {}
+        
+        for answer in batch:
+            grade = grades.get(answer.id)
+            if grade:
+                answer.scores_json = grade['scores']
+                answer.feedback_json = {**answer.feedback_json, **grade['feedback']}
+                answer.grading_status = 'graded'
+                graded += 1
+            else:
+                answer.grading_status = 'failed'
+        
+        InterviewAnswer.objects.bulk_update(batch, ['scores_json', 'feedback_json', 'grading_status'])
+    
+    if graded:
+        # Sessions finished before grading completed get their overall score updated
+        recompute_session_scores([session_id])
+        # Changes the questions endpoint's ETag so clients fetch the new grades
+        InterviewSession.objects.filter(id=session_id).update(updated_at=timezone.now())
+    
+    return graded
+
+
+def grade_answers_with_llm(answers: List[InterviewAnswer]) -> Dict:
+    """
+    Grade several answers with a single LLM prompt.
+    
+    Args:
+        answers: InterviewAnswer instances with their question loaded
+    
+    Returns:
+        Dictionary mapping answer id to {'scores': {...}, 'feedback': {...}};
+        answers the LLM did not grade properly are left out
+    """
+    from .llm_generator import _complete
+    
+    prompt = _create_grading_prompt(answers)
+    content = _complete(prompt, max_tokens=min(300 * len(answers) + 200, 4000))
+    return _parse_grading_response(content, answers)
+
+
+def _create_grading_prompt(answers: List[InterviewAnswer]) -> str:
+    """Build one grading prompt covering every answer in the batch."""
+    items = []
+    for index, answer in enumerate(answers):
+        question = answer.question
+        items.append(
+            f"[{index}] Question ({question.category}, {question.difficulty}): {question.question_text}\n"
+            f"Answer: {answer.answer_text}"
+        )
+    
+    return f"""Grade each interview answer below on five dimensions, each an integer from 0 to 5:
+structure, relevance, technical_accuracy, depth, communication.
+
+{chr(10).join(items)}
+
+Return ONLY a JSON array with one object per answer:
+[
+  {{
+    "index": 0,
+    "scores": {{"structure": 3, "relevance": 4, "technical_accuracy": 3, "depth": 2, "communication": 4}},
+    "strengths": ["..."],
+    "weaknesses": ["..."],
+    "improvements": ["..."]
+  }}
+]"""
+
+
+def _parse_grading_response(content: str, answers: List[InterviewAnswer]) -> Dict:
+    """Validate the LLM's grades and key them by answer id."""
+    json_match = re.search(r'\[.*\]', content, re.DOTALL)
+    if json_match:
+        content = json_match.group(0)
+    
+    try:
+        items = json.loads(content)
+    except json.JSONDecodeError:
+        return {}
+    
+    if not isinstance(items, list):
+        return {}
+    
+    grades = {}
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        index = item.get('index')
+        scores = item.get('scores') or {}
+        if not isinstance(index, int) or not 0 <= index < len(answers):
+            continue
+        if not all(isinstance(scores.get(dimension), (int, float)) for dimension in DIMENSIONS):
+            continue
+        
+        grades[answers[index].id] = {
+            'scores': {dimension: max(0, min(5, int(scores[dimension]))) for dimension in DIMENSIONS},
+            'feedback': {
+                key: item[key] for key in ['strengths', 'weaknesses', 'improvements']
+                if isinstance(item.get(key), list)
+            },
+        }
+    
+    return grades
+
+
+def _grading_lock_key(session_id) -> str:
+    return f'answer-grading:{session_id}'
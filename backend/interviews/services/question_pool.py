@@ -0,0 +1,177 @@
+"""
+Warm pool of pre-generated LLM question sets.
+
+Most candidates for the same (role, level, type) get near-identical generic
+questions, so a background task keeps QUESTION_POOL_TARGET_SIZE generic sets
+per popular combination. Session creation takes one set and only asks the LLM
+for a few profile-specific questions with a much smaller prompt.
+"""
+from datetime import timedelta
+from typing import List, Dict, Optional
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count
+from django.utils import timezone
+from roles.models import RoleCatalog
+from profiles.models import Profile, CVDocument
+from ..models import InterviewSession, PregeneratedQuestionSet
+
+
+def take_pooled_questions(
+    role: RoleCatalog,
+    level: str,
+    interview_type: str,
+    profile: Optional[Profile] = None,
+    cv_document: Optional[CVDocument] = None
+) -> Optional[List[Dict]]:
+    """
+    Build a session's questions from a pre-generated set.
+    
+    The last few generic questions are replaced by questions personalized to
+    the candidate's profile. A refill is scheduled when the pool drops below
+    the low-water mark.
+    
+    Args:
+        role: RoleCatalog instance
+        level: 'junior', 'mid', or 'senior'
+        interview_type: 'hr', 'technical', 'case', or 'mixed'
+        profile: Optional Profile instance with extracted data
+        cv_document: Optional CVDocument instance
+    
+    Returns:
+        List of question dictionaries, or None if the pool is empty
+    """
+    questions = claim_question_set(role, level, interview_type)
+    if not questions:
+        return None
+    
+    if (profile and profile.data_json) or (cv_document and cv_document.extracted_text):
+        from .llm_generator import personalize_questions_with_llm
+        
+        count = getattr(settings, 'QUESTION_POOL_PERSONALIZED_COUNT', 3)
+        personalized = personalize_questions_with_llm(
+            role=role,
+            level=level,
+            interview_type=interview_type,
+            profile=profile,
+            cv_document=cv_document,
+            count=count
+        )
+        if personalized:
+            questions = questions[:max(len(questions) - len(personalized), 0)] + personalized
+    
+    return questions
+
+
+def claim_question_set(role: RoleCatalog, level: str, interview_type: str) -> Optional[List[Dict]]:
+    """
+    Take the oldest pre-generated set for a combination out of the pool.
+    
+    Args:
+        role: RoleCatalog instance
+        level: 'junior', 'mid', or 'senior'
+        interview_type: 'hr', 'technical', 'case', or 'mixed'
+    
+    Returns:
+        List of question dictionaries, or None if the pool is empty
+    """
+    pool = PregeneratedQuestionSet.objects.filter(role=role, level=level, type=interview_type)
+    
+    with transaction.atomic():
+        question_set = pool.select_for_update(skip_locked=True).order_by('created_at').first()
+        if question_set:
+            question_set.delete()
+    
+    low_water = getattr(settings, 'QUESTION_POOL_LOW_WATER', 2)
+    if pool.count() < low_water:
+        schedule_refill(role, level, interview_type)
+    
+    return question_set.questions_json if question_set else None
+
+
+def schedule_refill(role: RoleCatalog, level: str, interview_type: str):
+    """Ask a worker to top up the pool for a combination (at most one refill in flight)."""
+    from ..tasks import refill_question_pool
+    
+    lock_key = _refill_lock_key(role.id, level, interview_type)
+    if not cache.add(lock_key, True, timeout=600):
+        return
+    
+    role_id = str(role.id)
+    
+    def enqueue():
+        try:
+            refill_question_pool.delay(role_id, level, interview_type)
+        except Exception:
+            # No broker: the pool stays cold and sessions use full generation
+            cache.delete(lock_key)
+    
+    transaction.on_commit(enqueue)
+
+
+def refill_question_pool(role: RoleCatalog, level: str, interview_type: str) -> int:
+    """
+    Generate sets until the pool for a combination reaches its target size.
+    
+    Args:
+        role: RoleCatalog instance
+        level: 'junior', 'mid', or 'senior'
+        interview_type: 'hr', 'technical', 'case', or 'mixed'
+    
+    Returns:
+        Number of sets created
+    """
+    from .llm_generator import generate_generic_questions_with_llm
+    
+    target = getattr(settings, 'QUESTION_POOL_TARGET_SIZE', 5)
+    missing = target - PregeneratedQuestionSet.objects.filter(
+        role=role, level=level, type=interview_type
+    ).count()
+    
+    created = 0
+    try:
+        for _ in range(max(missing, 0)):
+            questions = generate_generic_questions_with_llm(role, level, interview_type)
+            if not questions:
+                break
+            PregeneratedQuestionSet.objects.create(
+                role=role,
+                level=level,
+                type=interview_type,
+                questions_json=questions
+            )
+            created += 1
+    finally:
+        cache.delete(_refill_lock_key(role.id, level, interview_type))
+    
+    return created
+
+
+def get_popular_combinations(limit: int = None, days: int = None) -> List[Dict]:
+    """
+    Most frequent (role, level, type) combinations among recent sessions.
+    
+    Args:
+        limit: Maximum number of combinations (default QUESTION_POOL_POPULAR_LIMIT)
+        days: Look-back window in days (default QUESTION_POOL_POPULAR_DAYS)
+    
+    Returns:
+        List of dicts with role_selected, level, type and session_count
+    """
+    if limit is None:
+        limit = getattr(settings, 'QUESTION_POOL_POPULAR_LIMIT', 10)
+    if days is None:
+        days = getattr(settings, 'QUESTION_POOL_POPULAR_DAYS', 30)
+    
+    since = timezone.now() - timedelta(days=days)
+    return list(
+        InterviewSession.objects.filter(created_at__gte=since)
+        .values('role_selected', 'level', 'type')
+        .annotate(session_count=Count('id'))
+        .order_by('-session_count')[:limit]
+    )
+
+
+def _refill_lock_key(role_id, level: str, interview_type: str) -> str:
+    return f'question-pool-refill:{role_id}:{level}:{interview_type}'
@@ -0,0 +1,80 @@
+"""
+Flat read model for a session's questions and their answers.
+
+Questions are read with their answers in one LEFT JOIN query through
+.values(), and shaped like InterviewQuestionSerializer's output without
+instantiating models or running a reverse lookup per question.
+"""
+from typing import Dict, List
+from ..models import InterviewQuestion
+
+
+QUESTION_FIELDS = [
+    'id', 'session_id', 'order', 'question_text', 'category', 'difficulty',
+    'skill_tags_json', 'is_followup', 'parent_question_id', 'created_at',
+]
+ANSWER_FIELDS = [
+    'answer__id', 'answer__answer_text', 'answer__scores_json', 'answer__feedback_json',
+    'answer__skill_tags_json', 'answer__grading_status', 'answer__submitted_at',
+    'answer__time_seconds',
+]
+
+
+def get_session_questions(session_id, after_order: int = 0) -> List[Dict]:
+    """
+    Questions of a session in order, each with its answer (or None).
+    
+    Args:
+        session_id: UUID of InterviewSession
+        after_order: Only return questions with a greater order
+    
+    Returns:
+        List of question dictionaries
+    """
+    rows = InterviewQuestion.objects.filter(
+        session_id=session_id,
+        order__gt=after_order
+    ).order_by('order').values(*QUESTION_FIELDS, *ANSWER_FIELDS)
+    
+    return [_question_from_row(row) for row in rows]
+
+
+def _question_from_row(row: Dict) -> Dict:
+    question = {
+        'id': row['id'],
+        'session': row['session_id'],
+        'order': row['order'],
+        'question_text': row['question_text'],
+        'category': row['category'],
+        'difficulty': row['difficulty'],
+        'skill_tags_json': row['skill_tags_json'],
+        'is_followup': row['is_followup'],
+        'parent_question': row['parent_question_id'],
+        'created_at': row['created_at'],
+        'answer': None,
+    }
+    
+    if row['answer__id'] is not None:
+        question['answer'] = {
+            'id': row['answer__id'],
+            # Same subset InterviewAnswerResponseSerializer.get_question returns
+            'question': {
+                'id': row['id'],
+                'order': row['order'],
+                'question_text': row['question_text'],
+                'category': row['category'],
+                'difficulty': row['difficulty'],
+                'skill_tags_json': row['skill_tags_json'],
+                'is_followup': row['is_followup'],
+                'created_at': row['created_at'],
+            },
+            'answer_text': row['answer__answer_text'],
+            'scores_json': row['answer__scores_json'],
+            'feedback_json': row['answer__feedback_json'],
+            'skill_tags_json': row['answer__skill_tags_json'],
+            'grading_status': row['answer__grading_status'],
+            'submitted_at': row['answer__submitted_at'],
+            'time_seconds': row['answer__time_seconds'],
+        }
+    
+    return question
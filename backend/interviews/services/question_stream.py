@@ -0,0 +1,142 @@
+"""
+Server-sent events for questions generated in the background.
+
+The generation worker saves each question as soon as the LLM has streamed it
+(see generator.generate_interview_questions). This stream follows the
+session's rows and pushes every new question to the client, then a final
+'done' event once the session has left the 'generating' status.
+
+Each open stream holds a server worker until it ends, so the number of
+concurrent streams is capped with a counter in the shared cache
+(QUESTION_STREAM_MAX_CONCURRENT). Requests over the cap are refused and
+clients fall back to polling the questions list.
+"""
+import json
+import time
+from typing import Dict, Iterator, Optional
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.utils.encoders import JSONEncoder
+from ..models import InterviewSession
+from .question_read_model import get_session_questions
+
+
+STREAM_SLOTS_KEY = 'question-stream-slots'
+
+
+class QuestionStream:
+    """SSE messages of one session, holding a stream slot until closed."""
+    
+    def __init__(self, session_id, last_order: int = 0):
+        self._events = stream_session_questions(session_id, last_order)
+        self._released = False
+    
+    def __iter__(self) -> Iterator[str]:
+        return self._events
+    
+    def close(self):
+        # Called by Django when the response is closed, even if never iterated
+        self._events.close()
+        if not self._released:
+            self._released = True
+            release_stream_slot()
+
+
+def open_question_stream(session_id, last_order: int = 0) -> Optional[QuestionStream]:
+    """
+    Take a stream slot and open the event stream of a session.
+    
+    Args:
+        session_id: UUID of InterviewSession
+        last_order: Order of the last question the client already has
+    
+    Returns:
+        QuestionStream, or None if QUESTION_STREAM_MAX_CONCURRENT streams are open
+    """
+    if not acquire_stream_slot():
+        return None
+    return QuestionStream(session_id, last_order)
+
+
+def acquire_stream_slot() -> bool:
+    """
+    Count one more open stream, unless the cap is reached.
+    
+    The counter expires after twice the stream timeout, so slots of a
+    process that died mid-stream are not held forever.
+    
+    Returns:
+        True if a slot was taken
+    """
+    limit = getattr(settings, 'QUESTION_STREAM_MAX_CONCURRENT', 20)
+    timeout = 2 * getattr(settings, 'QUESTION_STREAM_TIMEOUT_SECONDS', 120)
+    
+    cache.add(STREAM_SLOTS_KEY, 0, timeout=timeout)
+    try:
+        slots = cache.incr(STREAM_SLOTS_KEY)
+    except ValueError:
+        # The counter expired in between
+        cache.set(STREAM_SLOTS_KEY, 1, timeout=timeout)
+        return True
+    
+    if slots > limit:
+        release_stream_slot()
+        return False
+    return True
+
+
+def release_stream_slot():
+    """Count one open stream less."""
+    try:
+        cache.decr(STREAM_SLOTS_KEY)
+    except ValueError:
+        # The counter expired: nothing to release
+        pass
+
+
+def stream_session_questions(session_id, last_order: int = 0) -> Iterator[str]:
+    """
+    Yield SSE messages for questions of a session with order > last_order.
+    
+    Args:
+        session_id: UUID of InterviewSession
+        last_order: Order of the last question the client already has
+            (the Last-Event-ID when reconnecting)
+    
+    Yields:
+        Encoded 'question' events, then one 'done' event
+    """
+    poll_seconds = getattr(settings, 'QUESTION_STREAM_POLL_SECONDS', 0.5)
+    timeout = getattr(settings, 'QUESTION_STREAM_TIMEOUT_SECONDS', 120)
+    deadline = time.monotonic() + timeout
+    
+    while True:
+        # Read the status first so questions saved before it changed are not missed
+        session_status = InterviewSession.objects.filter(
+            id=session_id
+        ).values_list('status', flat=True).first()
+        
+        for question in get_session_questions(session_id, after_order=last_order):
+            yield format_event('question', question, event_id=question['order'])
+            last_order = question['order']
+        
+        if session_status != 'generating':
+            yield format_event('done', {'status': session_status})
+            return
+        
+        if time.monotonic() >= deadline:
+            # Client reconnects with Last-Event-ID and picks up where it left off
+            yield format_event('timeout', {'status': session_status})
+            return
+        
+        time.sleep(poll_seconds)
+
+
+def format_event(event: str, data: Dict, event_id=None) -> str:
+    """Encode one server-sent event."""
+    lines = []
+    if event_id is not None:
+        lines.append(f'id: {event_id}')
+    lines.append(f'event: {event}')
+    lines.append(f'data: {json.dumps(data, cls=JSONEncoder)}')
+    return '\n'.join(lines) + '\n\n'
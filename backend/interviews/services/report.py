@@ -1,49 +1,140 @@
-from typing import Dict, List
-from ..models import InterviewSession, InterviewAnswer
+from typing import Dict, Iterable, List, Optional
+from ..models import InterviewSession, InterviewAnswer, SessionReport
+from .scorer import RUBRIC_VERSION
 
 
-def aggregate_scores(session: InterviewSession) -> Dict:
-    """
-    Calculate average scores per dimension across all answers.
+RUBRIC_DIMENSIONS = ['structure', 'relevance', 'technical_accuracy', 'depth', 'communication']
+
+# Columns read by the report builder; everything else on the rows is deferred
+REPORT_ANSWER_FIELDS = [
+    'answer_text', 'time_seconds', 'scores_json', 'feedback_json', 'skill_tags_json',
+    'question__id', 'question__question_text',
+]
+
+
+class RubricAccumulator:
+    """Running totals per rubric dimension."""
     
-    Args:
-        session: InterviewSession instance
-        
-    Returns:
-        Dictionary with average scores per dimension
-    """
-    answers = InterviewAnswer.objects.filter(question__session=session)
+    def __init__(self):
+        self.totals = {dimension: 0 for dimension in RUBRIC_DIMENSIONS}
+        self.count = 0
+    
+    def add(self, scores: Dict):
+        for dimension in RUBRIC_DIMENSIONS:
+            self.totals[dimension] += scores.get(dimension, 0)
+        self.count += 1
+    
+    def result(self) -> Dict:
+        if not self.count:
+            return dict(self.totals)
+        return {dim: round(total / self.count, 2) for dim, total in self.totals.items()}
+
+
+class FrequencyAccumulator:
+    """Counts feedback items, keeping first-seen order to break ties."""
+    
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.counts: Dict[str, int] = {}
     
-    if not answers.exists():
+    def add(self, items: List[str]):
+        for item in items:
+            self.counts[item] = self.counts.get(item, 0) + 1
+    
+    def result(self) -> List[str]:
+        ranked = sorted(self.counts.items(), key=lambda x: x[1], reverse=True)
+        return [item for item, count in ranked[:self.limit]]
+
+
+class SkillAccumulator:
+    """Running average answer score per skill tag."""
+    
+    def __init__(self):
+        self.totals: Dict[str, float] = {}
+        self.counts: Dict[str, int] = {}
+    
+    def add(self, skill_tags: List[str], scores: Dict):
+        avg_score = sum(scores.values()) / len(scores) if scores else 0
+        for skill_tag in skill_tags:
+            self.totals[skill_tag] = self.totals.get(skill_tag, 0) + avg_score
+            self.counts[skill_tag] = self.counts.get(skill_tag, 0) + 1
+    
+    def result(self) -> Dict:
         return {
-            'structure': 0,
-            'relevance': 0,
-            'technical_accuracy': 0,
-            'depth': 0,
-            'communication': 0,
+            skill_tag: round(total / self.counts[skill_tag], 2)
+            for skill_tag, total in self.totals.items()
         }
+
+
+class ReportBuilder:
+    """
+    Compute every report aggregate in a single pass over a session's answers.
     
-    totals = {
-        'structure': 0,
-        'relevance': 0,
-        'technical_accuracy': 0,
-        'depth': 0,
-        'communication': 0,
-    }
+    Usage:
+        builder = ReportBuilder.from_session(session)
+        builder.rubric_breakdown(), builder.summaries, ...
+    """
     
-    count = 0
-    for answer in answers:
+    def __init__(self):
+        self.rubric = RubricAccumulator()
+        self.strengths = FrequencyAccumulator(limit=3)
+        self.weaknesses = FrequencyAccumulator(limit=5)
+        self.skills = SkillAccumulator()
+        self.summaries: List[Dict] = []
+    
+    @classmethod
+    def from_session(cls, session: InterviewSession) -> 'ReportBuilder':
+        """Feed the builder from one query over the session's answers."""
+        builder = cls()
+        for answer in report_answers(session).iterator():
+            builder.add(answer)
+        return builder
+    
+    def add(self, answer: InterviewAnswer):
         scores = answer.scores_json or {}
-        for dimension in totals.keys():
-            totals[dimension] += scores.get(dimension, 0)
-        count += 1
+        feedback = answer.feedback_json or {}
+        
+        self.rubric.add(scores)
+        self.strengths.add(feedback.get('strengths', []))
+        self.weaknesses.add(feedback.get('weaknesses', []))
+        self.skills.add(answer.skill_tags_json or [], scores)
+        self.summaries.append({
+            'question_id': str(answer.question.id),
+            'question_text': answer.question.question_text,
+            'answer_text': answer.answer_text,
+            'scores': answer.scores_json,
+            'feedback': answer.feedback_json,
+            'time_seconds': answer.time_seconds,
+        })
+    
+    def snapshot_fields(self) -> Dict:
+        """Aggregates in the shape of SessionReport's fields."""
+        return {
+            'rubric_breakdown_json': self.rubric.result(),
+            'skill_breakdown_json': self.skills.result(),
+            'strengths_json': self.strengths.result(),
+            'weaknesses_json': self.weaknesses.result(),
+        }
+
+
+def report_answers(session: InterviewSession):
+    """A session's answers with only the columns the report reads."""
+    return InterviewAnswer.objects.filter(
+        question__session=session
+    ).select_related('question').only(*REPORT_ANSWER_FIELDS)
+
+
+def aggregate_scores(session: InterviewSession) -> Dict:
+    """
+    Calculate average scores per dimension across all answers.
     
-    if count > 0:
-        averages = {dim: round(totals[dim] / count, 2) for dim in totals.keys()}
-    else:
-        averages = totals
+    Args:
+        session: InterviewSession instance
     
-    return averages
+    Returns:
+        Dictionary with average scores per dimension
+    """
+    return ReportBuilder.from_session(session).rubric.result()
 
 
 def identify_strengths(session: InterviewSession) -> List[str]:
@@ -52,28 +143,11 @@ def identify_strengths(session: InterviewSession) -> List[str]:
     
     Args:
         session: InterviewSession instance
-        
+    
     Returns:
         List of strength strings
     """
-    answers = InterviewAnswer.objects.filter(question__session=session)
-    
-    # Collect all strengths from feedback
-    all_strengths = []
-    for answer in answers:
-        feedback = answer.feedback_json or {}
-        strengths = feedback.get('strengths', [])
-        all_strengths.extend(strengths)
-    
-    # Count frequency of strengths
-    strength_counts = {}
-    for strength in all_strengths:
-        strength_counts[strength] = strength_counts.get(strength, 0) + 1
-    
-    # Sort by frequency and return top 3
-    sorted_strengths = sorted(strength_counts.items(), key=lambda x: x[1], reverse=True)
-    
-    return [strength for strength, count in sorted_strengths[:3]]
+    return ReportBuilder.from_session(session).strengths.result()
 
 
 def identify_weaknesses(session: InterviewSession) -> List[str]:
@@ -82,80 +156,145 @@ def identify_weaknesses(session: InterviewSession) -> List[str]:
     
     Args:
         session: InterviewSession instance
-        
+    
     Returns:
         List of weakness strings
     """
-    answers = InterviewAnswer.objects.filter(question__session=session)
+    return ReportBuilder.from_session(session).weaknesses.result()
+
+
+def calculate_skill_breakdown(session: InterviewSession) -> Dict:
+    """
+    Group scores by skill tags.
     
-    # Collect all weaknesses from feedback
-    all_weaknesses = []
-    for answer in answers:
-        feedback = answer.feedback_json or {}
-        weaknesses = feedback.get('weaknesses', [])
-        all_weaknesses.extend(weaknesses)
+    Args:
+        session: InterviewSession instance
+    
+    Returns:
+        Dictionary mapping skill_tags to average scores
+    """
+    return ReportBuilder.from_session(session).skills.result()
+
+
+def build_session_report(
+    session: InterviewSession,
+    save: bool = True,
+    builder: Optional[ReportBuilder] = None
+) -> SessionReport:
+    """
+    Compute a session's report aggregates from its answers.
+    
+    Args:
+        session: InterviewSession instance
+        save: Write the snapshot (completed sessions); otherwise return it unsaved
+        builder: ReportBuilder already fed with the session's answers
+    
+    Returns:
+        SessionReport instance
+    """
+    if builder is None:
+        builder = ReportBuilder.from_session(session)
     
-    # Count frequency of weaknesses
-    weakness_counts = {}
-    for weakness in all_weaknesses:
-        weakness_counts[weakness] = weakness_counts.get(weakness, 0) + 1
+    fields = {
+        **builder.snapshot_fields(),
+        'rubric_version': RUBRIC_VERSION,
+        'answered_count': session.answered_count,
+    }
     
-    # Sort by frequency and return top 5
-    sorted_weaknesses = sorted(weakness_counts.items(), key=lambda x: x[1], reverse=True)
+    if not save:
+        return SessionReport(session=session, **fields)
     
-    return [weakness for weakness, count in sorted_weaknesses[:5]]
+    report, _ = SessionReport.objects.update_or_create(session=session, defaults=fields)
+    return report
 
 
-def calculate_skill_breakdown(session: InterviewSession) -> Dict:
+def get_session_report(session: InterviewSession, builder: Optional[ReportBuilder] = None) -> SessionReport:
     """
-    Group scores by skill tags.
+    Get the report snapshot of a session, rebuilding it when outdated.
+    
+    Sessions that are not completed have no snapshot; their report is
+    computed on the fly and not saved.
     
     Args:
         session: InterviewSession instance
-        
+        builder: ReportBuilder already fed with the session's answers, used
+            instead of a new query if the report has to be computed
+    
     Returns:
-        Dictionary mapping skill_tags to average scores
+        SessionReport instance
     """
-    answers = InterviewAnswer.objects.filter(question__session=session)
+    if session.status != 'completed':
+        return build_session_report(session, save=False, builder=builder)
     
-    skill_scores = {}
-    skill_counts = {}
+    report = SessionReport.objects.filter(session=session).first()
+    if report is None or _is_stale(report, session):
+        report = build_session_report(session, builder=builder)
+    return report
+
+
+def get_session_reports(sessions: Iterable[InterviewSession]) -> Dict:
+    """
+    Get the report snapshots of several completed sessions in one query.
     
-    for answer in answers:
-        skill_tags = answer.skill_tags_json or []
-        scores = answer.scores_json or {}
-        
-        # Calculate average score for this answer
-        if scores:
-            avg_score = sum(scores.values()) / len(scores)
-        else:
-            avg_score = 0
-        
-        # Add to skill tag aggregates
-        for skill_tag in skill_tags:
-            if skill_tag not in skill_scores:
-                skill_scores[skill_tag] = 0
-                skill_counts[skill_tag] = 0
-            
-            skill_scores[skill_tag] += avg_score
-            skill_counts[skill_tag] += 1
+    Missing or outdated snapshots (e.g. sessions finished before snapshots
+    existed) are built and saved.
+    
+    Args:
+        sessions: Completed InterviewSession instances
+    
+    Returns:
+        Dictionary mapping session id to SessionReport
+    """
+    sessions = list(sessions)
+    reports = {
+        report.session_id: report
+        for report in SessionReport.objects.filter(session__in=[s.id for s in sessions])
+    }
     
-    # Calculate averages
-    skill_averages = {}
-    for skill_tag in skill_scores.keys():
-        if skill_counts[skill_tag] > 0:
-            skill_averages[skill_tag] = round(skill_scores[skill_tag] / skill_counts[skill_tag], 2)
+    for session in sessions:
+        report = reports.get(session.id)
+        if report is None or _is_stale(report, session):
+            reports[session.id] = build_session_report(session)
     
-    return skill_averages
+    return reports
+
+
+def rebuild_session_reports(session_ids: Iterable) -> int:
+    """
+    Rebuild the snapshots of completed sessions after their answers changed.
+    
+    Args:
+        session_ids: InterviewSession ids
+    
+    Returns:
+        Number of reports rebuilt
+    """
+    sessions = InterviewSession.objects.filter(id__in=list(session_ids), status='completed')
+    rebuilt = 0
+    for session in sessions:
+        build_session_report(session)
+        rebuilt += 1
+    return rebuilt
+
+
+def _is_stale(report: SessionReport, session: InterviewSession) -> bool:
+    """A snapshot is outdated after a rubric change or a late answer."""
+    return (
+        report.rubric_version != RUBRIC_VERSION
+        or report.answered_count != session.answered_count
+    )
 
 
 def generate_report(session_id: str) -> Dict:
     """
     Main function that generates full session report.
     
+    Answers are read once; the same pass produces the answer summaries and,
+    when the snapshot is missing or outdated, the aggregates.
+    
     Args:
         session_id: UUID of InterviewSession
-        
+    
     Returns:
         Dictionary with complete report data
     """
@@ -164,30 +303,10 @@ def generate_report(session_id: str) -> Dict:
     except InterviewSession.DoesNotExist:
         return {}
     
-    # Get all answers
-    answers = InterviewAnswer.objects.filter(question__session=session).select_related('question')
-    
-    # Aggregate scores
-    rubric_breakdown = aggregate_scores(session)
-    
-    # Identify strengths and weaknesses
-    strengths = identify_strengths(session)
-    weaknesses = identify_weaknesses(session)
-    
-    # Calculate skill breakdown
-    skill_breakdown = calculate_skill_breakdown(session)
+    builder = ReportBuilder.from_session(session)
     
-    # Prepare answer summaries
-    answer_summaries = []
-    for answer in answers:
-        answer_summaries.append({
-            'question_id': str(answer.question.id),
-            'question_text': answer.question.question_text,
-            'answer_text': answer.answer_text,
-            'scores': answer.scores_json,
-            'feedback': answer.feedback_json,
-            'time_seconds': answer.time_seconds,
-        })
+    # Aggregates come from the snapshot written when the session finished
+    report = get_session_report(session, builder=builder)
     
     return {
         'session': {
@@ -196,10 +315,9 @@ def generate_report(session_id: str) -> Dict:
             'started_at': session.started_at.isoformat() if session.started_at else None,
             'ended_at': session.ended_at.isoformat() if session.ended_at else None,
         },
-        'strengths': strengths,
-        'weaknesses': weaknesses,
-        'rubric_breakdown': rubric_breakdown,
-        'skill_breakdown': skill_breakdown,
-        'answers': answer_summaries,
+        'strengths': report.strengths_json,
+        'weaknesses': report.weaknesses_json,
+        'rubric_breakdown': report.rubric_breakdown_json,
+        'skill_breakdown': report.skill_breakdown_json,
+        'answers': builder.summaries,
     }
-
@@ -0,0 +1,196 @@
+"""
+Batch re-scoring of stored answers after the rubric changes.
+
+Answers record the scorer.RUBRIC_VERSION they were scored with. Rescoring
+walks the answers with an older version in keyset-ordered chunks, scores
+each chunk in a process pool, writes it back with bulk_update and
+recomputes the overall score of the affected completed sessions with one
+aggregate query. Every chunk commits on its own, so an interrupted run
+picks up where it stopped.
+
+Models are imported inside functions: worker processes only import this
+module for score_rows, which must work without a configured Django.
+"""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from types import SimpleNamespace
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from .scorer import RUBRIC_VERSION, score_answer, calculate_overall_score
+from .feedback import generate_feedback
+
+
+DIMENSIONS = ['structure', 'relevance', 'technical_accuracy', 'depth', 'communication']
+
+
+def rescore_answers(
+    chunk_size: int = 500,
+    workers: Optional[int] = None,
+    progress: Optional[Callable[[int, int, float], None]] = None
+) -> Dict:
+    """
+    Rescore every answer not yet scored with the current rubric.
+    
+    Args:
+        chunk_size: Answers read, scored and written per transaction
+        workers: Scoring processes (default: CPU count; 1 scores inline)
+        progress: Optional callback(processed, total, elapsed_seconds) after each chunk
+    
+    Returns:
+        Dictionary with processed, seconds and rows_per_second
+    """
+    from django.db.models import Q
+    from ..models import InterviewAnswer
+    
+    workers = workers or os.cpu_count() or 1
+    # LLM-graded answers keep their grades
+    pending = InterviewAnswer.objects.exclude(rubric_version=RUBRIC_VERSION).exclude(grading_status='graded')
+    total = pending.count()
+    
+    processed = 0
+    last_key = None
+    start = time.monotonic()
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 and total > chunk_size else None
+    
+    try:
+        while True:
+            # Ordered by session so a session's answers are rescored together
+            chunk = pending.order_by('question__session_id', 'id')
+            if last_key:
+                session_id, answer_id = last_key
+                chunk = chunk.filter(
+                    Q(question__session_id__gt=session_id) |
+                    Q(question__session_id=session_id, id__gt=answer_id)
+                )
+            rows = list(chunk.values_list(
+                'id', 'answer_text', 'question__question_text', 'question__category',
+                'question__difficulty', 'question__skill_tags_json', 'question__session_id'
+            )[:chunk_size])
+            if not rows:
+                break
+            
+            results = _score_chunk(executor, workers, [row[:6] for row in rows])
+            _write_chunk(results, {row[6] for row in rows})
+            
+            last_key = (rows[-1][6], rows[-1][0])
+            processed += len(rows)
+            if progress:
+                progress(processed, total, time.monotonic() - start)
+    finally:
+        if executor:
+            executor.shutdown()
+    
+    seconds = time.monotonic() - start
+    return {
+        'processed': processed,
+        'seconds': round(seconds, 2),
+        'rows_per_second': round(processed / seconds, 1) if seconds else 0,
+    }
+
+
+def score_rows(rows: Iterable[Tuple]) -> List[Tuple]:
+    """
+    Score and generate feedback for answer rows (runs in worker processes).
+    
+    Args:
+        rows: (answer_id, answer_text, question_text, category, difficulty, skill_tags) tuples
+    
+    Returns:
+        (answer_id, scores, feedback) tuples
+    """
+    results = []
+    for answer_id, answer_text, question_text, category, difficulty, skill_tags in rows:
+        # The scorer and feedback only read these question attributes
+        question = SimpleNamespace(
+            question_text=question_text,
+            category=category,
+            difficulty=difficulty,
+            skill_tags_json=skill_tags
+        )
+        scores = score_answer(answer_text, question)
+        feedback = generate_feedback(answer_text, scores, question)
+        results.append((answer_id, scores, feedback))
+    return results
+
+
+def recompute_session_scores(session_ids: Iterable) -> int:
+    """
+    Recompute overall_score, the report snapshot and the owners' skill
+    rollups of completed sessions from their answers.
+    
+    Dimension averages come from a single GROUP BY query; the weights are
+    applied by scorer.calculate_overall_score, as when a session finishes.
+    
+    Args:
+        session_ids: InterviewSession ids to recompute
+    
+    Returns:
+        Number of sessions updated
+    """
+    from django.db.models import Avg, FloatField, Value
+    from django.db.models.fields.json import KeyTextTransform
+    from django.db.models.functions import Cast, Coalesce
+    from ..models import InterviewAnswer, InterviewSession
+    
+    averages = InterviewAnswer.objects.filter(
+        question__session_id__in=list(session_ids),
+        question__session__status='completed'
+    ).values('question__session_id').annotate(**{
+        dimension: Avg(Coalesce(
+            Cast(KeyTextTransform(dimension, 'scores_json'), FloatField()),
+            Value(0.0)
+        ))
+        for dimension in DIMENSIONS
+    }).order_by()
+    
+    sessions = [
+        InterviewSession(
+            id=row['question__session_id'],
+            overall_score=calculate_overall_score({
+                dimension: round(row[dimension], 2) for dimension in DIMENSIONS
+            })
+        )
+        for row in averages
+    ]
+    InterviewSession.objects.bulk_update(sessions, ['overall_score'])
+    
+    # Keep the report snapshots and skill rollups in line with the new scores
+    from analytics.services.skill_stats import rebuild_skill_stats_for_sessions
+    from .report import rebuild_session_reports
+    rebuild_session_reports(session.id for session in sessions)
+    rebuild_skill_stats_for_sessions(session.id for session in sessions)
+    
+    return len(sessions)
+
+
+def _score_chunk(executor: Optional[ProcessPoolExecutor], workers: int, rows: List[Tuple]) -> List[Tuple]:
+    if executor is None:
+        return score_rows(rows)
+    
+    batches = [rows[i::workers] for i in range(workers)]
+    results = []
+    for batch_results in executor.map(score_rows, [batch for batch in batches if batch]):
+        results.extend(batch_results)
+    return results
+
+
+def _write_chunk(results: List[Tuple], session_ids: set):
+    from django.db import transaction
+    from django.utils import timezone
+    from ..models import InterviewAnswer, InterviewSession
+    
+    answers = [
+        InterviewAnswer(
+            id=answer_id,
+            scores_json=scores,
+            feedback_json=feedback,
+            rubric_version=RUBRIC_VERSION
+        )
+        for answer_id, scores, feedback in results
+    ]
+    
+    with transaction.atomic():
+        InterviewAnswer.objects.bulk_update(answers, ['scores_json', 'feedback_json', 'rubric_version'])
+        # updated_at is part of the questions ETag: clients must see the new grades
+        InterviewSession.objects.filter(id__in=session_ids).update(updated_at=timezone.now())
+        recompute_session_scores(session_ids)
@@ -1,8 +1,43 @@
-import re
-from typing import Dict
+import time
+from typing import Dict, Optional
+from .answer_features import AnswerFeatures, question_words
+from .scoring_registry import COST_CHEAP, ScoringResult, register_scorer, run_scorers
 
 
-def score_structure(answer_text: str, question) -> int:
+# Bump whenever weights or keywords change, then run `manage.py rescore_answers`
+# to recompute answers scored with an older rubric.
+RUBRIC_VERSION = 1
+
+STAR_KEYWORDS = ['situation', 'task', 'action', 'result', 'outcome', 'challenge', 'problem']
+FLOW_INDICATORS = ['first', 'then', 'next', 'finally', 'because', 'therefore', 'however']
+
+STOP_WORDS = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'should', 'could', 'may', 'might', 'can', 'this', 'that', 'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they', 'me', 'him', 'her', 'us', 'them'}
+
+# Map skill tags to expected keywords
+EXPECTED_KEYWORDS = {
+    'backend.api.rest': ['rest', 'http', 'endpoint', 'request', 'response'],
+    'backend.database': ['database', 'sql', 'query', 'table', 'index'],
+    'backend.auth': ['authentication', 'authorization', 'token', 'session', 'jwt'],
+    'frontend.react': ['react', 'component', 'props', 'state', 'hook'],
+    'frontend.javascript': ['javascript', 'function', 'variable', 'closure', 'promise'],
+}
+ERROR_INDICATORS = ['i think', 'maybe', 'not sure', 'i guess']
+
+EXAMPLE_INDICATORS = ['for example', 'for instance', 'such as', 'like', 'example']
+TRADEOFF_INDICATORS = ['however', 'but', 'tradeoff', 'consideration', 'pros and cons', 'advantage', 'disadvantage']
+EXPLANATION_INDICATORS = ['because', 'why', 'how', 'reason', 'due to']
+
+TRANSITIONS = ['first', 'second', 'then', 'next', 'finally', 'additionally', 'furthermore', 'moreover']
+CLARITY_INDICATORS = ['clearly', 'specifically', 'in other words', 'to clarify']
+
+
+def extract_features(answer_text: str) -> AnswerFeatures:
+    """Tokenize an answer once for all scoring dimensions."""
+    return AnswerFeatures(answer_text)
+
+
+@register_scorer('structure', cost=COST_CHEAP)
+def score_structure(answer_text: str, question, features: Optional[AnswerFeatures] = None) -> int:
     """
     Score structure dimension (0-5).
     
@@ -11,13 +46,12 @@ def score_structure(answer_text: str, question) -> int:
     - Logical flow indicators
     - Answer length appropriateness
     """
+    features = features or extract_features(answer_text)
     score = 0
-    answer_lower = answer_text.lower()
-    word_count = len(answer_text.split())
+    word_count = features.word_count
     
     # Check for STAR keywords
-    star_keywords = ['situation', 'task', 'action', 'result', 'outcome', 'challenge', 'problem']
-    star_found = sum(1 for keyword in star_keywords if keyword in answer_lower)
+    star_found = features.count(STAR_KEYWORDS)
     if star_found >= 3:
         score += 3
     elif star_found >= 2:
@@ -26,8 +60,7 @@ def score_structure(answer_text: str, question) -> int:
         score += 1
     
     # Check for logical flow indicators
-    flow_indicators = ['first', 'then', 'next', 'finally', 'because', 'therefore', 'however']
-    flow_count = sum(1 for indicator in flow_indicators if indicator in answer_lower)
+    flow_count = features.count(FLOW_INDICATORS)
     if flow_count >= 3:
         score += 1
     elif flow_count >= 1:
@@ -44,25 +77,20 @@ def score_structure(answer_text: str, question) -> int:
     return score
 
 
-def score_relevance(answer_text: str, question) -> int:
+@register_scorer('relevance', cost=COST_CHEAP)
+def score_relevance(answer_text: str, question, features: Optional[AnswerFeatures] = None) -> int:
     """
     Score relevance dimension (0-5).
     
     Checks if answer addresses the question.
     """
+    features = features or extract_features(answer_text)
     score = 3  # Start with neutral score
-    answer_lower = answer_text.lower()
-    question_lower = question.question_text.lower()
-    
-    # Extract key terms from question
-    question_words = set(re.findall(r'\b\w+\b', question_lower))
-    answer_words = set(re.findall(r'\b\w+\b', answer_lower))
     
     # Check for question keywords in answer
-    common_words = question_words.intersection(answer_words)
+    common_words = question_words(question.question_text).intersection(features.words)
     # Remove common stop words
-    stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'should', 'could', 'may', 'might', 'can', 'this', 'that', 'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they', 'me', 'him', 'her', 'us', 'them'}
-    common_words = common_words - stop_words
+    common_words = common_words - STOP_WORDS
     
     if len(common_words) >= 3:
         score += 2
@@ -70,7 +98,7 @@ def score_relevance(answer_text: str, question) -> int:
         score += 1
     
     # Check answer length (too short might be off-topic)
-    word_count = len(answer_text.split())
+    word_count = features.word_count
     if word_count < 20:
         score -= 2
     elif word_count < 30:
@@ -81,7 +109,8 @@ def score_relevance(answer_text: str, question) -> int:
     return score
 
 
-def score_technical_accuracy(answer_text: str, question) -> int:
+@register_scorer('technical_accuracy', cost=COST_CHEAP)
+def score_technical_accuracy(answer_text: str, question, features: Optional[AnswerFeatures] = None) -> int:
     """
     Score technical accuracy dimension (0-5).
     
@@ -90,28 +119,16 @@ def score_technical_accuracy(answer_text: str, question) -> int:
     if question.category != 'technical':
         return 3  # Neutral for non-technical questions
     
+    features = features or extract_features(answer_text)
     score = 2  # Start with low score
-    answer_lower = answer_text.lower()
     
     # Check for technical terms based on skill tags
     skill_tags = question.skill_tags_json or []
     
-    # Map skill tags to expected keywords
-    expected_keywords = {
-        'backend.api.rest': ['rest', 'http', 'endpoint', 'request', 'response'],
-        'backend.database': ['database', 'sql', 'query', 'table', 'index'],
-        'backend.auth': ['authentication', 'authorization', 'token', 'session', 'jwt'],
-        'frontend.react': ['react', 'component', 'props', 'state', 'hook'],
-        'frontend.javascript': ['javascript', 'function', 'variable', 'closure', 'promise'],
-    }
-    
     # Check for expected keywords
     found_keywords = 0
     for tag in skill_tags:
-        keywords = expected_keywords.get(tag, [])
-        for keyword in keywords:
-            if keyword in answer_lower:
-                found_keywords += 1
+        found_keywords += features.count(EXPECTED_KEYWORDS.get(tag, []))
     
     if found_keywords >= 5:
         score = 5
@@ -121,8 +138,7 @@ def score_technical_accuracy(answer_text: str, question) -> int:
         score = 3
     
     # Check for common technical errors (negative indicators)
-    error_indicators = ['i think', 'maybe', 'not sure', 'i guess']
-    error_count = sum(1 for indicator in error_indicators if indicator in answer_lower)
+    error_count = features.count(ERROR_INDICATORS)
     if error_count >= 2:
         score -= 1
     
@@ -131,15 +147,16 @@ def score_technical_accuracy(answer_text: str, question) -> int:
     return score
 
 
-def score_depth(answer_text: str, question) -> int:
+@register_scorer('depth', cost=COST_CHEAP)
+def score_depth(answer_text: str, question, features: Optional[AnswerFeatures] = None) -> int:
     """
     Score depth dimension (0-5).
     
     Checks for detail level, examples, and tradeoffs.
     """
+    features = features or extract_features(answer_text)
     score = 2  # Start with low score
-    answer_lower = answer_text.lower()
-    word_count = len(answer_text.split())
+    word_count = features.word_count
     
     # Check answer length (longer answers tend to be more detailed)
     if word_count >= 200:
@@ -150,18 +167,15 @@ def score_depth(answer_text: str, question) -> int:
         score -= 1
     
     # Check for examples
-    example_indicators = ['for example', 'for instance', 'such as', 'like', 'example']
-    if any(indicator in answer_lower for indicator in example_indicators):
+    if features.has_any(EXAMPLE_INDICATORS):
         score += 1
     
     # Check for tradeoffs/considerations
-    tradeoff_indicators = ['however', 'but', 'tradeoff', 'consideration', 'pros and cons', 'advantage', 'disadvantage']
-    if any(indicator in answer_lower for indicator in tradeoff_indicators):
+    if features.has_any(TRADEOFF_INDICATORS):
         score += 1
     
     # Check for explanations (why/how)
-    explanation_indicators = ['because', 'why', 'how', 'reason', 'due to']
-    if any(indicator in answer_lower for indicator in explanation_indicators):
+    if features.has_any(EXPLANATION_INDICATORS):
         score += 0.5
     
     # Normalize to 0-5
@@ -169,17 +183,19 @@ def score_depth(answer_text: str, question) -> int:
     return score
 
 
-def score_communication(answer_text: str, question) -> int:
+@register_scorer('communication', cost=COST_CHEAP)
+def score_communication(answer_text: str, question, features: Optional[AnswerFeatures] = None) -> int:
     """
     Score communication dimension (0-5).
     
     Checks for clarity, structure, and readability.
     """
+    features = features or extract_features(answer_text)
     score = 3  # Start with neutral score
-    word_count = len(answer_text.split())
+    word_count = features.word_count
     
     # Check for proper sentence structure (periods indicate sentences)
-    sentence_count = answer_text.count('.') + answer_text.count('!') + answer_text.count('?')
+    sentence_count = features.sentence_count
     if sentence_count >= 3:
         score += 1
     elif sentence_count < 1:
@@ -194,14 +210,12 @@ def score_communication(answer_text: str, question) -> int:
         score -= 0.5  # Too verbose
     
     # Check for transitions (indicates good flow)
-    transitions = ['first', 'second', 'then', 'next', 'finally', 'additionally', 'furthermore', 'moreover']
-    transition_count = sum(1 for trans in transitions if trans in answer_text.lower())
+    transition_count = features.count(TRANSITIONS)
     if transition_count >= 2:
         score += 1
     
     # Check for clarity indicators
-    clarity_indicators = ['clearly', 'specifically', 'in other words', 'to clarify']
-    if any(indicator in answer_text.lower() for indicator in clarity_indicators):
+    if features.has_any(CLARITY_INDICATORS):
         score += 0.5
     
     # Normalize to 0-5
@@ -213,6 +227,9 @@ def score_answer(answer_text: str, question) -> Dict:
     """
     Main scoring function that scores all dimensions.
     
+    The answer is tokenized and scanned once (see extract_features); every
+    dimension reads from the same AnswerFeatures.
+    
     Args:
         answer_text: User's answer text
         question: InterviewQuestion instance
@@ -220,15 +237,29 @@ def score_answer(answer_text: str, question) -> Dict:
     Returns:
         Dictionary with all dimension scores
     """
-    scores = {
-        'structure': score_structure(answer_text, question),
-        'relevance': score_relevance(answer_text, question),
-        'technical_accuracy': score_technical_accuracy(answer_text, question),
-        'depth': score_depth(answer_text, question),
-        'communication': score_communication(answer_text, question),
-    }
+    return score_answer_with_budget(answer_text, question).scores
+
+
+def score_answer_with_budget(answer_text: str, question, budget_ms: Optional[float] = None) -> ScoringResult:
+    """
+    Score an answer with the registered dimension scorers.
+    
+    Model-based scorers that do not fit in the latency budget are skipped
+    and listed in ScoringResult.skipped.
+    
+    Args:
+        answer_text: User's answer text
+        question: InterviewQuestion instance
+        budget_ms: Latency budget in milliseconds (None for unlimited)
+        
+    Returns:
+        ScoringResult with scores and per-plugin timings
+    """
+    start = time.perf_counter()
+    features = extract_features(answer_text)
+    features_ms = (time.perf_counter() - start) * 1000
     
-    return scores
+    return run_scorers(answer_text, question, features, budget_ms, features_ms)
 
 
 def calculate_overall_score(scores: Dict) -> int:
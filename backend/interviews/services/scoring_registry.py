@@ -0,0 +1,198 @@
+"""
+Registry of rubric dimension scorers.
+
+Each dimension is a plugin with a cost class: 'cheap' heuristics always run,
+'model' plugins (e.g. LLM-based graders) run only while the request's latency
+budget allows and are skipped otherwise: they are listed in the result and
+nothing runs them later, so their dimensions stay unscored for that answer.
+Every run is timed into a per-plugin wall-time histogram. The histograms
+live in process memory and are not exported anywhere: they feed the
+budget check and `manage.py benchmark_scorer`.
+"""
+import threading
+from bisect import bisect_left
+import time
+from typing import Callable, Dict, List, Optional
+
+
+COST_CHEAP = 'cheap'
+COST_MODEL = 'model'
+COST_CLASSES = [COST_CHEAP, COST_MODEL]
+
+# Upper bounds (ms) of the histogram buckets; the last bucket is unbounded
+HISTOGRAM_BUCKETS_MS = [0.1, 0.5, 1, 5, 10, 50, 100, 500, 1000, 5000]
+
+
+class LatencyHistogram:
+    """Thread-safe wall-time histogram with fixed millisecond buckets."""
+    
+    def __init__(self, buckets_ms: List[float] = None):
+        self.buckets_ms = buckets_ms or HISTOGRAM_BUCKETS_MS
+        self._lock = threading.Lock()
+        self.reset()
+    
+    def observe(self, ms: float):
+        """Record one run."""
+        # First bucket whose upper bound is >= ms, or the overflow bucket
+        i = bisect_left(self.buckets_ms, ms)
+        with self._lock:
+            self.count += 1
+            self.total_ms += ms
+            self.counts[i] += 1
+    
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.count if self.count else 0.0
+    
+    def snapshot(self) -> Dict:
+        """Counts per bucket ('le' upper bound in ms, None for the overflow bucket)."""
+        with self._lock:
+            return {
+                'count': self.count,
+                'total_ms': round(self.total_ms, 3),
+                'mean_ms': round(self.mean_ms, 3),
+                'buckets': [
+                    {'le': bound, 'count': count}
+                    for bound, count in zip(self.buckets_ms + [None], self.counts)
+                ],
+            }
+    
+    def reset(self):
+        with self._lock:
+            self.count = 0
+            self.total_ms = 0.0
+            self.counts = [0] * (len(self.buckets_ms) + 1)
+
+
+class ScorerPlugin:
+    """A rubric dimension scorer: func(answer_text, question, features) -> 0-5."""
+    
+    def __init__(self, name: str, func: Callable, cost: str = COST_CHEAP):
+        if cost not in COST_CLASSES:
+            raise ValueError(f"Unknown cost class: {cost}")
+        self.name = name
+        self.func = func
+        self.cost = cost
+        self.histogram = LatencyHistogram()
+
+
+class ScoringResult:
+    """
+    Scores of one answer plus what ran to produce them.
+    
+    Attributes:
+        scores: Dimension name -> score for the plugins that ran
+        timings: [{'name', 'cost', 'ms'}] in run order
+        skipped: Names of plugins not run because the budget ran out
+        budget_ms: Latency budget the run was given (None for unlimited)
+        features_ms: Time spent extracting the shared AnswerFeatures
+    """
+    
+    def __init__(self, budget_ms: Optional[float] = None, features_ms: float = 0.0):
+        self.scores: Dict[str, int] = {}
+        self.timings: List[Dict] = []
+        self.skipped: List[str] = []
+        self.budget_ms = budget_ms
+        self.features_ms = features_ms
+    
+    @property
+    def elapsed_ms(self) -> float:
+        return self.features_ms + sum(timing['ms'] for timing in self.timings)
+    
+    def metadata(self) -> Dict:
+        """Summary for API responses."""
+        return {
+            'plugins': [{**timing, 'ms': round(timing['ms'], 3)} for timing in self.timings],
+            'skipped': self.skipped,
+            'features_ms': round(self.features_ms, 3),
+            'elapsed_ms': round(self.elapsed_ms, 3),
+            'budget_ms': self.budget_ms,
+        }
+
+
+_scorers: Dict[str, ScorerPlugin] = {}
+# Run order, computed on first use and cleared by register_scorer
+_ordered: Optional[List[ScorerPlugin]] = None
+
+
+def register_scorer(name: str, cost: str = COST_CHEAP):
+    """
+    Decorator registering a dimension scorer.
+    
+    Args:
+        name: Dimension name used as the key in scores_json
+        cost: 'cheap' (heuristic) or 'model' (model-based, may be skipped)
+    """
+    def decorator(func: Callable) -> Callable:
+        global _ordered
+        _scorers[name] = ScorerPlugin(name, func, cost)
+        _ordered = None
+        return func
+    return decorator
+
+
+def get_scorers() -> List[ScorerPlugin]:
+    """Registered scorers, cheap ones first, otherwise in registration order."""
+    global _ordered
+    if _ordered is None:
+        _ordered = sorted(_scorers.values(), key=lambda plugin: COST_CLASSES.index(plugin.cost))
+    return _ordered
+
+
+def run_scorers(
+    answer_text: str,
+    question,
+    features,
+    budget_ms: Optional[float] = None,
+    features_ms: float = 0.0
+) -> ScoringResult:
+    """
+    Run registered scorers within a latency budget.
+    
+    Cheap scorers always run. A model scorer runs only if the time left in
+    the budget covers its mean observed run time; otherwise it is skipped.
+    
+    Args:
+        answer_text: User's answer text
+        question: InterviewQuestion instance
+        features: AnswerFeatures for the answer
+        budget_ms: Latency budget in milliseconds (None for unlimited)
+        features_ms: Time already spent extracting features, counted against the budget
+    
+    Returns:
+        ScoringResult
+    """
+    result = ScoringResult(budget_ms, features_ms)
+    scores = result.scores
+    timings = result.timings
+    start = time.perf_counter()
+    
+    for plugin in get_scorers():
+        if plugin.cost != COST_CHEAP and budget_ms is not None:
+            remaining = budget_ms - features_ms - (time.perf_counter() - start) * 1000
+            if remaining <= 0 or plugin.histogram.mean_ms > remaining:
+                result.skipped.append(plugin.name)
+                continue
+        
+        plugin_start = time.perf_counter()
+        scores[plugin.name] = plugin.func(answer_text, question, features)
+        ms = (time.perf_counter() - plugin_start) * 1000
+        
+        plugin.histogram.observe(ms)
+        timings.append({'name': plugin.name, 'cost': plugin.cost, 'ms': ms})
+    
+    return result
+
+
+def get_scorer_timings() -> Dict[str, Dict]:
+    """Histogram snapshot per registered scorer (for this process)."""
+    return {
+        plugin.name: {'cost': plugin.cost, **plugin.histogram.snapshot()}
+        for plugin in get_scorers()
+    }
+
+
+def reset_scorer_timings():
+    """Clear all scorer histograms."""
+    for plugin in _scorers.values():
+        plugin.histogram.reset()
@@ -0,0 +1,98 @@
+"""
+Incremental parser for a JSON array of objects arriving in chunks.
+
+LLM providers stream the question array a few tokens at a time. The parser
+yields each top-level object as soon as its closing brace arrives, instead of
+waiting for the whole completion and calling json.loads once.
+"""
+import json
+from typing import Dict, List
+
+
+class IncrementalJSONArrayParser:
+    """
+    Extract complete objects from a streamed JSON array.
+    
+    Text before the opening bracket (e.g. a markdown code fence) is ignored.
+    Objects that fail to decode are skipped.
+    
+    Usage:
+        parser = IncrementalJSONArrayParser()
+        for chunk in chunks:
+            for obj in parser.feed(chunk):
+                ...
+    """
+    
+    def __init__(self):
+        self._in_array = False
+        self._finished = False
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._buffer: List[str] = []
+    
+    def feed(self, chunk: str) -> List[Dict]:
+        """
+        Consume the next chunk of text.
+        
+        Args:
+            chunk: Next piece of the streamed response
+        
+        Returns:
+            Objects completed by this chunk, in order
+        """
+        completed = []
+        
+        for char in chunk:
+            if self._finished:
+                break
+            
+            if not self._in_array:
+                if char == '[':
+                    self._in_array = True
+                continue
+            
+            if self._depth == 0:
+                # Between array elements: only an object start or the end matter
+                if char == '{':
+                    self._depth = 1
+                    self._buffer = [char]
+                elif char == ']':
+                    self._finished = True
+                continue
+            
+            self._buffer.append(char)
+            
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == '\\':
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in '{[':
+                self._depth += 1
+            elif char in '}]':
+                self._depth -= 1
+                if self._depth == 0:
+                    obj = self._decode(''.join(self._buffer))
+                    self._buffer = []
+                    if obj is not None:
+                        completed.append(obj)
+        
+        return completed
+    
+    @property
+    def finished(self) -> bool:
+        """True once the closing bracket of the array has been seen."""
+        return self._finished
+    
+    @staticmethod
+    def _decode(text: str):
+        try:
+            obj = json.loads(text)
+        except json.JSONDecodeError:
+            return None
+        return obj if isinstance(obj, dict) else None
@@ -0,0 +1,74 @@
+"""
+Sweeper for sessions that were started but never finished.
+
+A session still 'created', 'generating' or 'in_progress' whose latest answer
+(or, without answers, its creation) is older than STALE_SESSION_IDLE_HOURS is
+marked 'abandoned'. Stale ids are selected in keyset-ordered chunks and each
+chunk is closed with one bulk UPDATE.
+"""
+from datetime import timedelta
+from typing import Optional
+from django.conf import settings
+from django.db.models import Max
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from ..models import InterviewSession
+
+
+def abandon_stale_sessions(
+    idle_hours: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    dry_run: bool = False
+) -> int:
+    """
+    Mark idle active sessions as 'abandoned'.
+    
+    Args:
+        idle_hours: Idle time after which a session is stale (default STALE_SESSION_IDLE_HOURS)
+        chunk_size: Sessions per UPDATE (default STALE_SESSION_SWEEP_CHUNK_SIZE)
+        dry_run: Only count the stale sessions
+    
+    Returns:
+        Number of sessions abandoned (or that would be, with dry_run)
+    """
+    if idle_hours is None:
+        idle_hours = getattr(settings, 'STALE_SESSION_IDLE_HOURS', 24)
+    if chunk_size is None:
+        chunk_size = getattr(settings, 'STALE_SESSION_SWEEP_CHUNK_SIZE', 500)
+    
+    now = timezone.now()
+    cutoff = now - timedelta(hours=idle_hours)
+    
+    # Sessions created after the cutoff cannot be stale yet
+    stale = InterviewSession.objects.filter(
+        status__in=InterviewSession.ACTIVE_STATUSES,
+        created_at__lt=cutoff
+    ).annotate(
+        last_activity=Coalesce(Max('questions__answer__submitted_at'), 'created_at')
+    ).filter(last_activity__lt=cutoff)
+    
+    abandoned = 0
+    last_id = None
+    while True:
+        chunk = stale.order_by('id')
+        if last_id is not None:
+            chunk = chunk.filter(id__gt=last_id)
+        ids = list(chunk.values_list('id', flat=True)[:chunk_size])
+        if not ids:
+            break
+        last_id = ids[-1]
+        
+        if dry_run:
+            abandoned += len(ids)
+            continue
+        
+        # Status and activity are checked again, in case the candidate
+        # answered or finished since the SELECT
+        abandoned += InterviewSession.objects.filter(
+            id__in=ids,
+            status__in=InterviewSession.ACTIVE_STATUSES
+        ).exclude(
+            questions__answer__submitted_at__gte=cutoff
+        ).update(status='abandoned', updated_at=now)
+    
+    return abandoned
@@ -0,0 +1,11 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .models import QuestionBank
+from .services.generator import clear_question_pool_cache
+
+
+@receiver(post_save, sender=QuestionBank)
+@receiver(post_delete, sender=QuestionBank)
+def invalidate_question_pools(sender, **kwargs):
+    """Rebuild question pools after the bank changes."""
+    clear_question_pool_cache()
@@ -0,0 +1,106 @@
+from celery import shared_task
+from django.utils import timezone
+from roles.models import RoleCatalog
+from .models import InterviewSession
+from .services.generator import generate_interview_questions
+from .services import question_pool
+from .services.llm_grader import grade_pending_answers
+
+
+@shared_task
+def generate_session_questions(session_id: str) -> int:
+    """
+    Generate the remaining questions for a session in the background.
+    
+    generate_interview_questions moves the session to 'in_progress' when the
+    questions are written. If generation fails the session is still released,
+    so the candidate is never stuck on a session that cannot progress.
+    
+    Args:
+        session_id: UUID of InterviewSession
+    
+    Returns:
+        Number of questions created
+    """
+    try:
+        questions = generate_interview_questions(session_id)
+    except Exception:
+        InterviewSession.objects.filter(id=session_id, status='generating').update(
+            status='in_progress',
+            updated_at=timezone.now()
+        )
+        raise
+    
+    return len(questions)
+
+
+@shared_task
+def refill_question_pool(role_id: str, level: str, interview_type: str) -> int:
+    """
+    Top up the pre-generated question sets for one (role, level, type).
+    
+    Returns:
+        Number of sets created
+    """
+    try:
+        role = RoleCatalog.objects.get(id=role_id)
+    except RoleCatalog.DoesNotExist:
+        return 0
+    
+    return question_pool.refill_question_pool(role, level, interview_type)
+
+
+@shared_task
+def refill_popular_question_pools() -> int:
+    """
+    Periodic task: schedule refills for the most popular combinations.
+    
+    Returns:
+        Number of combinations checked
+    """
+    combinations = question_pool.get_popular_combinations()
+    roles = RoleCatalog.objects.in_bulk([c['role_selected'] for c in combinations])
+    
+    for combination in combinations:
+        role = roles.get(combination['role_selected'])
+        if role:
+            question_pool.schedule_refill(role, combination['level'], combination['type'])
+    
+    return len(combinations)
+
+
+@shared_task
+def grade_session_answers(session_id: str) -> int:
+    """
+    Regrade a session's pending answers with the LLM in one batch.
+    
+    Returns:
+        Number of answers graded
+    """
+    return grade_pending_answers(session_id)
+
+
+@shared_task
+def refine_followup_question(question_id: str) -> bool:
+    """
+    Reword a templated follow-up question with the LLM.
+    
+    Returns:
+        True if the question was updated
+    """
+    from .services.followup import refine_followup_with_llm
+    
+    return refine_followup_with_llm(question_id)
+
+
+@shared_task
+def abandon_stale_sessions() -> int:
+    """
+    Periodic task: mark sessions idle for STALE_SESSION_IDLE_HOURS as abandoned.
+    
+    Returns:
+        Number of sessions abandoned
+    """
+    from .services.sweeper import abandon_stale_sessions as sweep
+    
+    return sweep()
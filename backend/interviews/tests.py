@@ -1,8 +1,11 @@
-from django.test import TestCase
+import json
+from unittest.mock import patch
+from django.test import TestCase, TransactionTestCase, override_settings
 from django.contrib.auth import get_user_model
 from rest_framework.test import APIClient
 from rest_framework import status
 from .models import InterviewSession, InterviewQuestion, InterviewAnswer
+from .services.generator import QUESTION_ORDER_STEP
 from roles.models import RoleCatalog
 from profiles.models import Profile
 
@@ -59,6 +62,85 @@ class InterviewSessionTests(TestCase):
         questions = InterviewQuestion.objects.filter(session=session)
         self.assertGreater(questions.count(), 0)
     
+    @override_settings(USE_LLM_FOR_QUESTIONS=True)
+    @patch('interviews.views.session.generate_session_questions.delay')
+    def test_create_interview_session_generates_in_background(self, mock_delay):
+        """Test LLM-backed sessions are returned at once with an opening question."""
+        data = {
+            'role_id': str(self.role.id),
+            'level': 'mid',
+            'type': 'technical',
+        }
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post('/api/interviews', data, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['status'], 'generating')
+        mock_delay.assert_called_once_with(response.data['id'])
+        
+        # Only the opening question is written synchronously
+        questions = InterviewQuestion.objects.filter(session_id=response.data['id'])
+        self.assertEqual(questions.count(), 1)
+        self.assertEqual(questions.first().order, QUESTION_ORDER_STEP)
+    
+    @override_settings(USE_LLM_FOR_QUESTIONS=True)
+    def test_background_generation_appends_after_opening_question(self):
+        """Test generated questions keep their order after the opening question."""
+        from .services.generator import generate_opening_question
+        from .tasks import generate_session_questions
+        
+        session = InterviewSession.objects.create(
+            user=self.user,
+            role_selected=self.role,
+            level='mid',
+            type='technical',
+            status='generating'
+        )
+        generate_opening_question(session)
+        
+        llm_questions = [
+            {'question_text': f'Personalized question {i}', 'category': 'technical',
+             'difficulty': 'medium', 'skill_tags': ['python']}
+            for i in range(1, 4)
+        ]
+        with patch('interviews.services.llm_generator.stream_questions_with_llm', return_value=iter(llm_questions)):
+            generate_session_questions(str(session.id))
+        
+        session.refresh_from_db()
+        self.assertEqual(session.status, 'in_progress')
+        questions = list(session.questions.order_by('order'))
+        self.assertEqual([q.order for q in questions], [1000, 2000, 3000, 4000])
+        self.assertEqual(
+            [q.question_text for q in questions[1:]],
+            [q['question_text'] for q in llm_questions]
+        )
+    
+    def test_generate_questions_query_count(self):
+        """Test questions are written with one INSERT alongside the status update."""
+        from .services.generator import generate_interview_questions, get_question_pool
+        
+        session = InterviewSession.objects.create(
+            user=self.user,
+            profile=self.profile,
+            role_selected=self.role,
+            level='mid',
+            type='mixed',
+            status='created'
+        )
+        get_question_pool(self.role.category, 'mid', 'mixed')  # warm the pool cache
+        
+        # session + existing questions, then SAVEPOINT, INSERT, UPDATE, RELEASE
+        with self.assertNumQueries(6):
+            questions = generate_interview_questions(str(session.id))
+        
+        session.refresh_from_db()
+        self.assertEqual(session.status, 'in_progress')
+        self.assertEqual(session.questions.count(), len(questions))
+        self.assertEqual(
+            list(session.questions.values_list('order', flat=True)),
+            [i * QUESTION_ORDER_STEP for i in range(1, len(questions) + 1)]
+        )
+    
     def test_get_interview_session(self):
         """Test retrieving an interview session."""
         session = InterviewSession.objects.create(
@@ -110,6 +192,60 @@ class InterviewSessionTests(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertIn('questions', response.data)
         self.assertEqual(len(response.data['questions']), 2)
+    
+    def test_get_interview_questions_with_answers(self):
+        """Test questions and answers load in one query and support ETags."""
+        from rest_framework.renderers import JSONRenderer
+        from .serializers import InterviewQuestionSerializer
+        
+        session = InterviewSession.objects.create(
+            user=self.user,
+            role_selected=self.role,
+            level='mid',
+            type='technical',
+            status='in_progress',
+            question_count=2
+        )
+        questions = [
+            InterviewQuestion.objects.create(
+                session=session,
+                order=order,
+                question_text=f'Question {order}',
+                category='technical',
+                difficulty='medium',
+                skill_tags_json=['backend.api.rest']
+            )
+            for order in range(1, 3)
+        ]
+        InterviewAnswer.objects.create(
+            question=questions[0],
+            answer_text='An answer',
+            time_seconds=30,
+            scores_json={'structure': 3},
+            feedback_json={'strengths': []},
+        )
+        url = f'/api/interviews/{session.id}/questions'
+        
+        # Session check + questions with answers
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
+        
+        # Same JSON as the model serializer
+        expected = InterviewQuestionSerializer(
+            InterviewQuestion.objects.filter(session=session).order_by('order'), many=True
+        ).data
+        self.assertEqual(response.json()['questions'], json.loads(JSONRenderer().render(expected)))
+        self.assertIsNone(response.json()['questions'][1]['answer'])
+        
+        etag = response['ETag']
+        with self.assertNumQueries(1):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        
+        InterviewSession.objects.filter(id=session.id).update(answered_count=1)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
 
 
 class InterviewAnswerTests(TestCase):
@@ -171,6 +307,111 @@ class InterviewAnswerTests(TestCase):
         self.assertEqual(answer.question, self.question)
         self.assertIn('structure', answer.scores_json)
         self.assertIn('strengths', answer.feedback_json)
+        
+        # Scoring metadata lists the plugins that ran
+        plugins = [plugin['name'] for plugin in response.data['scoring']['plugins']]
+        self.assertEqual(plugins, list(answer.scores_json))
+        self.assertEqual(response.data['scoring']['skipped'], [])
+    
+    @override_settings(FOLLOWUP_QUESTIONS_ENABLED=False)
+    def test_submit_answer_query_count(self):
+        """Test submission is one SELECT and one INSERT in a transaction."""
+        data = {
+            'question_id': str(self.question.id),
+            'answer_text': 'Django is a high-level Python web framework.',
+            'time_seconds': 120,
+        }
+        url = f'/api/interviews/{self.session.id}/answers'
+        
+        # SELECT question + session, then SAVEPOINT, INSERT, answered_count UPDATE, RELEASE
+        with self.assertNumQueries(5):
+            response = self.client.post(url, data, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.answered_count, 1)
+    
+    def test_submit_duplicate_answer(self):
+        """Test a second answer to the same question is rejected."""
+        data = {
+            'question_id': str(self.question.id),
+            'answer_text': 'Django is a high-level Python web framework.',
+            'time_seconds': 120,
+        }
+        url = f'/api/interviews/{self.session.id}/answers'
+        
+        self.client.post(url, data, format='json')
+        response = self.client.post(url, data, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(InterviewAnswer.objects.filter(question=self.question).count(), 1)
+    
+    def test_submit_answer_retry_with_idempotency_key(self):
+        """Test a retried submission with the same Idempotency-Key returns the original answer."""
+        data = {
+            'question_id': str(self.question.id),
+            'answer_text': 'Django is a high-level Python web framework.',
+            'time_seconds': 120,
+        }
+        url = f'/api/interviews/{self.session.id}/answers'
+        
+        first = self.client.post(url, data, format='json', HTTP_IDEMPOTENCY_KEY='submit-1')
+        retry = self.client.post(url, data, format='json', HTTP_IDEMPOTENCY_KEY='submit-1')
+        other = self.client.post(url, data, format='json', HTTP_IDEMPOTENCY_KEY='submit-2')
+        
+        self.assertEqual(first.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(retry.status_code, status.HTTP_200_OK)
+        self.assertEqual(retry.data['id'], first.data['id'])
+        # Same response shape as the original, including the follow-up it asked
+        self.assertEqual(set(retry.data), set(first.data))
+        self.assertIsNotNone(first.data['followup_question'])
+        self.assertEqual(retry.data['followup_question'], first.data['followup_question'])
+        self.assertEqual(retry.data['scores_json'], first.data['scores_json'])
+        self.assertEqual(other.status_code, status.HTTP_400_BAD_REQUEST)
+    
+    def test_submit_answer_other_users_session(self):
+        """Test users cannot answer questions in another user's session."""
+        other = User.objects.create_user(email='other@example.com', password='testpass123')
+        self.client.force_authenticate(user=other)
+        
+        data = {
+            'question_id': str(self.question.id),
+            'answer_text': 'Django is a high-level Python web framework.',
+            'time_seconds': 120,
+        }
+        response = self.client.post(f'/api/interviews/{self.session.id}/answers', data, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(InterviewAnswer.objects.exists())
+    
+    @override_settings(FOLLOWUP_QUESTIONS_ENABLED=False)
+    def test_progress_counters(self):
+        """Test progress is served from the session counters."""
+        from io import StringIO
+        from django.core.management import call_command
+        from django.core.management.base import CommandError
+        from .serializers import InterviewSessionSerializer
+        
+        InterviewSession.objects.filter(id=self.session.id).update(question_count=1)
+        self.client.post(
+            f'/api/interviews/{self.session.id}/answers',
+            {'question_id': str(self.question.id), 'answer_text': 'Django is a framework.', 'time_seconds': 10},
+            format='json'
+        )
+        
+        session = InterviewSession.objects.select_related('role_selected').get(id=self.session.id)
+        with self.assertNumQueries(0):
+            progress = InterviewSessionSerializer(session).data['progress']
+        self.assertEqual(progress, {'current_question': 1, 'total_questions': 1, 'answered': 1})
+        
+        # Drift (e.g. rows deleted in the admin) is reported and fixed by the check command
+        InterviewAnswer.objects.all().delete()
+        with self.assertRaises(CommandError):
+            call_command('check_session_counters', stdout=StringIO())
+        call_command('check_session_counters', fix=True, stdout=StringIO())
+        
+        session.refresh_from_db()
+        self.assertEqual((session.question_count, session.answered_count), (1, 0))
     
     def test_finish_session(self):
         """Test finishing an interview session."""
@@ -248,6 +489,77 @@ class InterviewAnswerTests(TestCase):
         self.assertIn('weaknesses', response.data)
         self.assertIn('rubric_breakdown', response.data)
         self.assertIn('skill_breakdown', response.data)
+    
+    def test_report_is_built_in_one_pass(self):
+        """Test the report reads answers once and aggregates them as before."""
+        from .services.report import generate_report
+        
+        question2 = InterviewQuestion.objects.create(
+            session=self.session,
+            order=2,
+            question_text='Explain REST API',
+            category='technical',
+            difficulty='medium',
+            skill_tags_json=['backend.api.rest']
+        )
+        InterviewAnswer.objects.create(
+            question=self.question,
+            answer_text='Django is a web framework.',
+            time_seconds=120,
+            scores_json={'structure': 4, 'relevance': 5, 'technical_accuracy': 4, 'depth': 3, 'communication': 4},
+            feedback_json={'strengths': ['Clear explanation'], 'weaknesses': ['Too short']},
+            skill_tags_json=['backend.django.auth', 'backend.api.rest']
+        )
+        InterviewAnswer.objects.create(
+            question=question2,
+            answer_text='REST is an architectural style.',
+            time_seconds=90,
+            scores_json={'structure': 2, 'relevance': 3},
+            feedback_json={'strengths': ['Good example', 'Clear explanation'], 'weaknesses': []},
+            skill_tags_json=['backend.api.rest']
+        )
+        
+        # Session + answers; an unfinished session has no snapshot to read
+        with self.assertNumQueries(2):
+            report = generate_report(str(self.session.id))
+        
+        self.assertEqual(report['rubric_breakdown'], {
+            'structure': 3.0, 'relevance': 4.0, 'technical_accuracy': 2.0, 'depth': 1.5, 'communication': 2.0,
+        })
+        self.assertEqual(report['skill_breakdown'], {'backend.django.auth': 4.0, 'backend.api.rest': 3.25})
+        self.assertEqual(report['strengths'], ['Clear explanation', 'Good example'])
+        self.assertEqual(report['weaknesses'], ['Too short'])
+        self.assertEqual(
+            [a['question_text'] for a in report['answers']],
+            ['What is Django?', 'Explain REST API']
+        )
+    
+    def test_report_is_read_from_snapshot(self):
+        """Test finishing writes a SessionReport that the report endpoint reads."""
+        from .models import SessionReport
+        from .services.scorer import RUBRIC_VERSION
+        
+        self.client.post(f'/api/interviews/{self.session.id}/answers', {
+            'question_id': str(self.question.id),
+            'answer_text': 'Django is a web framework.',
+            'time_seconds': 120,
+        }, format='json')
+        self.client.patch(f'/api/interviews/{self.session.id}/finish')
+        
+        report = SessionReport.objects.get(session=self.session)
+        self.assertEqual((report.rubric_version, report.answered_count), (RUBRIC_VERSION, 1))
+        self.assertEqual(list(report.skill_breakdown_json), ['backend.django.auth'])
+        
+        # Raw answer rows are not re-aggregated on read
+        InterviewAnswer.objects.update(scores_json={})
+        response = self.client.get(f'/api/interviews/{self.session.id}/report')
+        self.assertEqual(response.data['rubric_breakdown'], report.rubric_breakdown_json)
+        
+        # An outdated rubric version triggers a rebuild
+        SessionReport.objects.update(rubric_version=RUBRIC_VERSION - 1)
+        response = self.client.get(f'/api/interviews/{self.session.id}/report')
+        self.assertEqual(response.data['skill_breakdown'], {'backend.django.auth': 0})
+        self.assertEqual(SessionReport.objects.get().rubric_version, RUBRIC_VERSION)
 
 
 class ScoringServiceTests(TestCase):
@@ -280,6 +592,1102 @@ class ScoringServiceTests(TestCase):
         for dimension, score in scores.items():
             self.assertGreaterEqual(score, 0)
             self.assertLessEqual(score, 5)
+    
+    def test_scores_match_golden_fixture(self):
+        """Test scores still match the checked-in golden answers."""
+        from .services.scorer import RUBRIC_VERSION, score_answer
+        from .management.commands.benchmark_scorer import load_golden
+        
+        rubric_version, cases = load_golden()
+        self.assertEqual(rubric_version, RUBRIC_VERSION)
+        
+        for answer_text, question, expected in cases:
+            self.assertEqual(score_answer(answer_text, question), expected, answer_text[:40])
+    
+    def test_model_scorers_skipped_when_budget_runs_out(self):
+        """Test expensive scorers are skipped once the latency budget is spent."""
+        from .services import scoring_registry
+        from .services.scorer import score_answer_with_budget
+        
+        question = InterviewQuestion(
+            question_text='What is Django?',
+            category='technical',
+            difficulty='medium',
+            skill_tags_json=[]
+        )
+        
+        with patch.dict(scoring_registry._scorers), patch.object(scoring_registry, '_ordered', None):
+            scoring_registry.register_scorer('llm_grade', cost=scoring_registry.COST_MODEL)(
+                lambda answer_text, question, features: 4
+            )
+            plugin = scoring_registry._scorers['llm_grade']
+            plugin.histogram.observe(500)  # previously took 500ms
+            
+            result = score_answer_with_budget('Django is a web framework.', question, budget_ms=50)
+            self.assertEqual(result.skipped, ['llm_grade'])
+            self.assertNotIn('llm_grade', result.scores)
+            
+            result = score_answer_with_budget('Django is a web framework.', question)
+            self.assertEqual(result.scores['llm_grade'], 4)
+            # Cheap scorers run before model-based ones
+            self.assertEqual(result.timings[-1]['name'], 'llm_grade')
+            self.assertEqual(plugin.histogram.count, 2)
+        
+        # Registration order is cached per process; the patched scorer is gone again
+        self.assertNotIn('llm_grade', [plugin.name for plugin in scoring_registry.get_scorers()])
+    
+    def test_benchmark_scorer_command(self):
+        """Test the scorer benchmark checks the golden fixture and runs."""
+        from io import StringIO
+        from django.core.management import call_command
+        
+        from django.core.management.base import CommandError
+        
+        out = StringIO()
+        call_command('benchmark_scorer', sizes=[50, 200], answers=2, repeat=1, stdout=out)
+        
+        self.assertIn('Scores match the golden fixture', out.getvalue())
+        
+        # A rubric change without an updated fixture fails the check
+        with patch('interviews.services.scorer.score_answer', return_value={}):
+            with self.assertRaises(CommandError):
+                call_command('benchmark_scorer', sizes=[50], answers=1, repeat=1, stdout=StringIO())
+
+
+class QuestionBankTests(TestCase):
+    """Test question selection from the database-backed question bank."""
+    
+    def setUp(self):
+        from .services.generator import clear_question_pool_cache
+        clear_question_pool_cache()
+        
+        self.role = RoleCatalog.objects.create(
+            name='Backend Engineer',
+            category='backend',
+            description='Backend development role',
+            keywords_json=['python', 'django'],
+        )
+    
+    def test_select_questions_from_seeded_bank(self):
+        """Test seeded bank questions are distributed and adjusted by level."""
+        from .services.generator import select_questions
+        
+        junior = select_questions(self.role, 'junior', 'technical')
+        mid = select_questions(self.role, 'mid', 'technical')
+        
+        self.assertEqual(len(mid), 5)
+        self.assertTrue(all(q['category'] == 'technical' for q in mid))
+        self.assertEqual(mid[0]['question_text'], 'Explain how REST APIs work.')
+        self.assertEqual(mid[0]['difficulty'], 'medium')
+        self.assertEqual(junior[0]['difficulty'], 'easy')
+        # Junior candidates get no hard questions
+        self.assertNotIn('hard', [q['difficulty'] for q in junior])
+    
+    def test_hr_bank_entries_are_served(self):
+        """Test 'hr' bank entries join the behavioral questions of HR and mixed interviews."""
+        from .models import QuestionBank
+        from .services.generator import select_questions
+        
+        QuestionBank.objects.create(
+            question_text='Why do you want to join us?',
+            category='hr',
+            role_category='backend',
+            difficulty='easy',
+            skill_tag='communication.motivation',
+            skill_tags_json=['communication.motivation'],
+            position=0,
+        )
+        
+        for interview_type in ['hr', 'mixed']:
+            questions = select_questions(self.role, 'mid', interview_type)
+            self.assertIn('Why do you want to join us?', [q['question_text'] for q in questions])
+    
+    def test_question_pool_is_cached_and_invalidated(self):
+        """Test pools are served from memory until the bank changes."""
+        from .models import QuestionBank
+        from .services.generator import select_questions
+        
+        select_questions(self.role, 'mid', 'technical')
+        with self.assertNumQueries(0):
+            select_questions(self.role, 'mid', 'technical')
+        
+        QuestionBank.objects.create(
+            question_text='How would you rate-limit an API?',
+            category='technical',
+            role_category='backend',
+            difficulty='medium',
+            skill_tag='backend.api.rate_limiting',
+            skill_tags_json=['backend.api.rate_limiting'],
+            position=0,
+        )
+        
+        questions = select_questions(self.role, 'mid', 'technical')
+        self.assertEqual(questions[0]['question_text'], 'How would you rate-limit an API?')
+
+
+@override_settings(USE_LLM_FOR_QUESTIONS=True)
+class QuestionPoolTests(TestCase):
+    """Test session creation from pre-generated LLM question sets."""
+    
+    def setUp(self):
+        from django.core.cache import cache
+        cache.clear()
+        
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            password='testpass123',
+        )
+        self.role = RoleCatalog.objects.create(
+            name='Backend Engineer',
+            category='backend',
+            description='Backend development role',
+            keywords_json=['python', 'django'],
+        )
+        self.profile = Profile.objects.create(
+            user=self.user,
+            data_json={'skills': ['Python', 'Django']}
+        )
+        self.session = InterviewSession.objects.create(
+            user=self.user,
+            profile=self.profile,
+            role_selected=self.role,
+            level='mid',
+            type='technical',
+            status='generating'
+        )
+        self.generic = [
+            {'question_text': f'Generic question {i}', 'category': 'technical',
+             'difficulty': 'medium', 'skill_tags': ['backend.general']}
+            for i in range(1, 6)
+        ]
+    
+    @patch('interviews.tasks.refill_question_pool.delay')
+    @patch('interviews.services.llm_generator.stream_questions_with_llm')
+    @patch('interviews.services.llm_generator.personalize_questions_with_llm')
+    def test_session_uses_pooled_set(self, mock_personalize, mock_generate, mock_refill):
+        """Test a pooled set is claimed and topped with personalized questions."""
+        from .models import PregeneratedQuestionSet
+        from .services.generator import generate_interview_questions
+        
+        PregeneratedQuestionSet.objects.create(
+            role=self.role, level='mid', type='technical', questions_json=self.generic
+        )
+        personalized = [
+            {'question_text': 'How did you use Django in your last project?', 'category': 'technical',
+             'difficulty': 'medium', 'skill_tags': ['django']},
+        ]
+        mock_personalize.return_value = personalized
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            generate_interview_questions(str(self.session.id))
+        
+        texts = list(self.session.questions.values_list('question_text', flat=True))
+        self.assertEqual(texts, [q['question_text'] for q in self.generic[:4] + personalized])
+        mock_generate.assert_not_called()
+        self.assertFalse(PregeneratedQuestionSet.objects.exists())
+        # Pool dropped below the low-water mark
+        mock_refill.assert_called_once_with(str(self.role.id), 'mid', 'technical')
+    
+    @patch('interviews.tasks.refill_question_pool.delay')
+    @patch('interviews.services.llm_generator.stream_questions_with_llm')
+    def test_empty_pool_falls_back_to_full_generation(self, mock_generate, mock_refill):
+        """Test sessions use full LLM generation when the pool is empty."""
+        from .services.generator import generate_interview_questions
+        
+        mock_generate.return_value = iter(self.generic)
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            questions = generate_interview_questions(str(self.session.id))
+        
+        self.assertEqual(len(questions), len(self.generic))
+        mock_generate.assert_called_once()
+        mock_refill.assert_called_once()
+    
+    @patch('interviews.services.llm_generator.generate_generic_questions_with_llm')
+    def test_refill_question_pool(self, mock_generate):
+        """Test refills top the pool up to its target size."""
+        from .models import PregeneratedQuestionSet
+        from .tasks import refill_question_pool
+        
+        mock_generate.return_value = self.generic
+        
+        with self.settings(QUESTION_POOL_TARGET_SIZE=3):
+            created = refill_question_pool(str(self.role.id), 'mid', 'technical')
+        
+        self.assertEqual(created, 3)
+        self.assertEqual(
+            PregeneratedQuestionSet.objects.filter(role=self.role, level='mid', type='technical').count(),
+            3
+        )
+
+
+class QuestionStreamTests(TestCase):
+    """Test streaming questions as they are generated."""
+    
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            password='testpass123',
+        )
+        self.client.force_authenticate(user=self.user)
+        
+        self.role = RoleCatalog.objects.create(
+            name='Backend Engineer',
+            category='backend',
+            description='Backend development role',
+            keywords_json=['python', 'django'],
+        )
+        self.session = InterviewSession.objects.create(
+            user=self.user,
+            role_selected=self.role,
+            level='mid',
+            type='technical',
+            status='in_progress'
+        )
+        for order in range(1, 4):
+            InterviewQuestion.objects.create(
+                session=self.session,
+                order=order,
+                question_text=f'Question {order}',
+                category='technical',
+                difficulty='medium',
+            )
+    
+    def test_parser_yields_objects_across_chunks(self):
+        """Test objects are returned as soon as their closing brace arrives."""
+        from .services.stream_parser import IncrementalJSONArrayParser
+        
+        text = '```json\n[{"question_text": "Use {braces} and \\"quotes\\"?", "skill_tags": ["a"]}, {"question_text": "Second"}]\n```'
+        parser = IncrementalJSONArrayParser()
+        
+        completed = []
+        for i in range(0, len(text), 7):
+            completed.extend(parser.feed(text[i:i + 7]))
+        
+        self.assertEqual(
+            [q['question_text'] for q in completed],
+            ['Use {braces} and "quotes"?', 'Second']
+        )
+        self.assertTrue(parser.finished)
+    
+    def test_stream_questions_with_llm_normalizes_each_question(self):
+        """Test streamed LLM output is parsed into question dicts incrementally."""
+        from .services import llm_generator
+        
+        chunks = ['[{"question_text": "Explain ', 'ORM caching"}, {"question_text": "Q2", "difficulty": "hard"}]']
+        with patch.object(llm_generator, '_openai_stream', return_value=iter(chunks)), \
+                patch.object(llm_generator, '_get_openai_client'), \
+                self.settings(LLM_PROVIDER='openai'):
+            questions = list(llm_generator.stream_questions_with_llm(self.role, 'mid', 'technical'))
+        
+        self.assertEqual(questions, [
+            {'question_text': 'Explain ORM caching', 'category': 'technical', 'difficulty': 'medium', 'skill_tags': []},
+            {'question_text': 'Q2', 'category': 'technical', 'difficulty': 'hard', 'skill_tags': []},
+        ])
+    
+    def test_stream_sends_questions_after_last_event_id(self):
+        """Test the event stream resumes after Last-Event-ID and ends with done."""
+        url = f'/api/interviews/{self.session.id}/questions/stream'
+        response = self.client.get(url, HTTP_ACCEPT='text/event-stream', HTTP_LAST_EVENT_ID='1')
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        body = b''.join(response.streaming_content).decode()
+        
+        self.assertNotIn('Question 1', body)
+        self.assertIn('id: 2\nevent: question', body)
+        self.assertIn('id: 3\nevent: question', body)
+        self.assertTrue(body.endswith('event: done\ndata: {"status": "in_progress"}\n\n'))
+    
+    @override_settings(QUESTION_STREAM_MAX_CONCURRENT=1)
+    def test_stream_cap_sends_clients_to_polling(self):
+        """Test streams over the cap get 503 and a closed stream frees its slot."""
+        from django.core.cache import cache
+        from .services.question_stream import STREAM_SLOTS_KEY
+        
+        cache.delete(STREAM_SLOTS_KEY)
+        url = f'/api/interviews/{self.session.id}/questions/stream'
+        
+        first = self.client.get(url, HTTP_ACCEPT='text/event-stream')
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        
+        second = self.client.get(url, HTTP_ACCEPT='text/event-stream')
+        self.assertEqual(second.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertEqual(second['Retry-After'], '3')
+        
+        first.close()
+        self.assertEqual(cache.get(STREAM_SLOTS_KEY), 0)
+        third = self.client.get(url, HTTP_ACCEPT='text/event-stream')
+        self.assertEqual(third.status_code, status.HTTP_200_OK)
+        b''.join(third.streaming_content)
+        self.assertEqual(cache.get(STREAM_SLOTS_KEY), 0)
+    
+    def test_stream_other_users_session(self):
+        """Test users cannot stream another user's questions."""
+        other = User.objects.create_user(email='other@example.com', password='testpass123')
+        self.client.force_authenticate(user=other)
+        
+        response = self.client.get(f'/api/interviews/{self.session.id}/questions/stream')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class RescoreAnswersTests(TestCase):
+    """Test batch re-scoring after a rubric change."""
+    
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            password='testpass123',
+        )
+        self.role = RoleCatalog.objects.create(
+            name='Backend Engineer',
+            category='backend',
+            description='Backend development role',
+            keywords_json=['python', 'django'],
+        )
+        self.session = InterviewSession.objects.create(
+            user=self.user,
+            role_selected=self.role,
+            level='mid',
+            type='technical',
+            status='completed',
+            overall_score=0
+        )
+        answers = [
+            'A REST endpoint receives an HTTP request and returns a response.',
+            'First, we index the database table because the query was slow. However, writes got slower.',
+            'I think maybe JWT tokens.',
+        ]
+        for order, answer_text in enumerate(answers, start=1):
+            question = InterviewQuestion.objects.create(
+                session=self.session,
+                order=order,
+                question_text=f'Technical question {order} about REST APIs',
+                category='technical',
+                difficulty='medium',
+                skill_tags_json=['backend.api.rest', 'backend.database'],
+            )
+            InterviewAnswer.objects.create(
+                question=question,
+                answer_text=answer_text,
+                time_seconds=60,
+                scores_json={'structure': 0},
+                rubric_version=0,
+            )
+    
+    def _rescore(self, **options):
+        from io import StringIO
+        from django.core.management import call_command
+        
+        out = StringIO()
+        call_command('rescore_answers', stdout=out, **options)
+        return out.getvalue()
+    
+    def test_rescore_answers(self):
+        """Test stale answers and their session's overall score are recomputed."""
+        from .services.scorer import RUBRIC_VERSION, score_answer, calculate_overall_score
+        from .services.report import aggregate_scores
+        
+        output = self._rescore(chunk_size=2, workers=1)
+        
+        self.assertIn('Rescored 3 answers', output)
+        self.assertIn('rows/s', output)
+        for answer in InterviewAnswer.objects.select_related('question'):
+            self.assertEqual(answer.rubric_version, RUBRIC_VERSION)
+            self.assertEqual(answer.scores_json, score_answer(answer.answer_text, answer.question))
+            self.assertIn('strengths', answer.feedback_json)
+        
+        self.session.refresh_from_db()
+        self.assertEqual(
+            self.session.overall_score,
+            calculate_overall_score(aggregate_scores(self.session))
+        )
+        self.assertEqual(self.session.report.rubric_breakdown_json, aggregate_scores(self.session))
+    
+    def test_rescore_changes_questions_etag(self):
+        """Test clients polling the questions get the new grades, not a 304."""
+        client = APIClient()
+        client.force_authenticate(user=self.user)
+        url = f'/api/interviews/{self.session.id}/questions'
+        before = client.get(url)
+        
+        self._rescore(workers=1)
+        
+        after = client.get(url, HTTP_IF_NONE_MATCH=before['ETag'])
+        self.assertEqual(after.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(after['ETag'], before['ETag'])
+    
+    def test_rescore_is_resumable(self):
+        """Test answers already on the current rubric are skipped."""
+        from .services.scorer import RUBRIC_VERSION
+        
+        InterviewAnswer.objects.filter(question__order=1).update(rubric_version=RUBRIC_VERSION)
+        
+        self.assertIn('Rescored 2 answers', self._rescore(workers=1))
+        self.assertIn('Rescored 0 answers', self._rescore(workers=1))
+    
+    def test_rescore_with_process_pool(self):
+        """Test scoring in worker processes gives the same result as inline."""
+        from .services.scorer import score_answer
+        
+        self._rescore(chunk_size=1, workers=2)
+        
+        for answer in InterviewAnswer.objects.select_related('question'):
+            self.assertEqual(answer.scores_json, score_answer(answer.answer_text, answer.question))
+
+
+@override_settings(ANSWER_GRADING_MODE='llm')
+class LLMAnswerGradingTests(TestCase):
+    """Test background LLM grading of answers."""
+    
+    def setUp(self):
+        from django.core.cache import cache
+        cache.clear()
+        
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            password='testpass123',
+        )
+        self.client.force_authenticate(user=self.user)
+        
+        self.role = RoleCatalog.objects.create(
+            name='Backend Engineer',
+            category='backend',
+            description='Backend development role',
+            keywords_json=['python', 'django'],
+        )
+        self.session = InterviewSession.objects.create(
+            user=self.user,
+            role_selected=self.role,
+            level='mid',
+            type='technical',
+            status='in_progress'
+        )
+        self.questions = [
+            InterviewQuestion.objects.create(
+                session=self.session,
+                order=order,
+                question_text=f'Question {order}',
+                category='technical',
+                difficulty='medium',
+            )
+            for order in range(1, 3)
+        ]
+    
+    def _submit(self, question):
+        return self.client.post(
+            f'/api/interviews/{self.session.id}/answers',
+            {'question_id': str(question.id), 'answer_text': 'Django is a web framework.', 'time_seconds': 30},
+            format='json'
+        )
+    
+    @patch('interviews.tasks.grade_session_answers.apply_async')
+    def test_answers_return_heuristic_scores_and_share_one_grading_run(self, mock_apply_async):
+        """Test answers are scored at once and batched into one grading task."""
+        with self.captureOnCommitCallbacks(execute=True):
+            first = self._submit(self.questions[0])
+            second = self._submit(self.questions[1])
+        
+        self.assertEqual(first.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(first.data['grading_status'], 'pending')
+        self.assertIn('structure', first.data['scores_json'])
+        self.assertEqual(second.data['grading_status'], 'pending')
+        mock_apply_async.assert_called_once_with((str(self.session.id),), countdown=30)
+    
+    @patch('interviews.services.llm_generator._complete')
+    def test_grading_updates_answers_in_place(self, mock_complete):
+        """Test one LLM call grades all pending answers of the session."""
+        from .tasks import grade_session_answers
+        
+        with patch('interviews.tasks.grade_session_answers.apply_async'):
+            for question in self.questions:
+                self._submit(question)
+        
+        mock_complete.return_value = json.dumps([
+            {'index': i, 'scores': {'structure': 5, 'relevance': 4, 'technical_accuracy': 4,
+                                    'depth': 3, 'communication': 5},
+             'strengths': ['Clear definition'], 'weaknesses': [], 'improvements': ['Add an example']}
+            for i in range(2)
+        ])
+        
+        self.assertEqual(grade_session_answers(str(self.session.id)), 2)
+        mock_complete.assert_called_once()
+        
+        for answer in InterviewAnswer.objects.all():
+            self.assertEqual(answer.grading_status, 'graded')
+            self.assertEqual(answer.scores_json['structure'], 5)
+            self.assertEqual(answer.feedback_json['strengths'], ['Clear definition'])
+            self.assertIn('model_answer', answer.feedback_json)
+    
+    @patch('interviews.services.llm_generator._complete', side_effect=Exception('timeout'))
+    def test_grading_failure_keeps_heuristic_scores(self, mock_complete):
+        """Test answers keep their heuristic scores when the LLM fails."""
+        from .tasks import grade_session_answers
+        
+        with patch('interviews.tasks.grade_session_answers.apply_async'):
+            response = self._submit(self.questions[0])
+        
+        self.assertEqual(grade_session_answers(str(self.session.id)), 0)
+        
+        answer = InterviewAnswer.objects.get(id=response.data['id'])
+        self.assertEqual(answer.grading_status, 'failed')
+        self.assertEqual(answer.scores_json, response.data['scores_json'])
+
+
+class FollowupQuestionTests(TestCase):
+    """Test follow-up questions inserted after weak answers."""
+    
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            password='testpass123',
+        )
+        self.client.force_authenticate(user=self.user)
+        self.role = RoleCatalog.objects.create(
+            name='Backend Engineer',
+            category='backend',
+            description='Backend development role',
+            keywords_json=['python', 'django'],
+        )
+        self.session = InterviewSession.objects.create(
+            user=self.user,
+            role_selected=self.role,
+            level='mid',
+            type='technical',
+            status='in_progress',
+            question_count=2
+        )
+        self.question, self.next_question = [
+            InterviewQuestion.objects.create(
+                session=self.session,
+                order=order * QUESTION_ORDER_STEP,
+                question_text=f'Question {order} about Django authentication',
+                category='technical',
+                difficulty='medium',
+                skill_tags_json=['backend.django.auth']
+            )
+            for order in range(1, 3)
+        ]
+    
+    def test_select_followup(self):
+        """Test the weakest dimension and missing keywords pick the probe."""
+        from .services.followup import select_followup
+        
+        strong = {'structure': 4, 'relevance': 4, 'technical_accuracy': 4, 'depth': 4, 'communication': 4}
+        weak_depth = {**strong, 'depth': 1}
+        
+        followup = select_followup(self.question, 'Django uses sessions.', weak_depth)
+        self.assertEqual(followup['reason'], 'depth')
+        self.assertIn('auth', followup['question_text'])
+        self.assertEqual(followup['skill_tags'], ['backend.django.auth'])
+        
+        followup = select_followup(self.question, 'Django uses sessions.', strong)
+        self.assertEqual(followup['reason'], 'missing_keywords')
+        
+        self.assertIsNone(select_followup(self.question, 'Django auth uses sessions.', strong))
+        
+        self.question.is_followup = True
+        self.assertIsNone(select_followup(self.question, 'Django uses sessions.', weak_depth))
+    
+    @override_settings(USE_LLM_FOR_QUESTIONS=True)
+    def test_no_followup_while_questions_are_generated(self):
+        """Test a follow-up asked during background generation cannot take the generator's order."""
+        from .services.followup import create_followup
+        from .services.generator import generate_opening_question
+        from .tasks import generate_session_questions
+        
+        session = InterviewSession.objects.create(
+            user=self.user,
+            role_selected=self.role,
+            level='mid',
+            type='technical',
+            status='generating'
+        )
+        opening = generate_opening_question(session)
+        followup = {
+            'question_text': 'Can you go deeper?',
+            'category': 'technical',
+            'difficulty': 'medium',
+            'skill_tags': [],
+        }
+        
+        def stream(**kwargs):
+            # The candidate answers the opening question while generation runs
+            self.assertIsNone(create_followup(opening, followup))
+            for i in range(1, 4):
+                yield {'question_text': f'Personalized question {i}', 'category': 'technical',
+                       'difficulty': 'medium', 'skill_tags': ['python']}
+        
+        with patch('interviews.services.llm_generator.stream_questions_with_llm', side_effect=stream):
+            generate_session_questions(str(session.id))
+        
+        session.refresh_from_db()
+        self.assertEqual(session.status, 'in_progress')
+        self.assertEqual(
+            list(session.questions.order_by('order').values_list('order', flat=True)),
+            [1000, 2000, 3000, 4000]
+        )
+        
+        # Once generation is done, follow-ups are inserted again
+        created = create_followup(opening, followup)
+        self.assertEqual(created.order, 1500)
+        session.refresh_from_db()
+        self.assertEqual(session.question_count, 5)
+    
+    def test_weak_answer_inserts_followup_after_question(self):
+        """Test the follow-up takes the midpoint order without renumbering."""
+        response = self.client.post(f'/api/interviews/{self.session.id}/answers', {
+            'question_id': str(self.question.id),
+            'answer_text': 'I think maybe sessions.',
+            'time_seconds': 30,
+        }, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        followup = response.data['followup_question']
+        self.assertEqual(followup['order'], 1500)
+        self.assertTrue(followup['is_followup'])
+        self.assertEqual(followup['parent_question'], self.question.id)
+        self.assertIsNone(followup['answer'])
+        
+        self.assertEqual(
+            list(self.session.questions.values_list('order', flat=True)),
+            [1000, 1500, 2000]
+        )
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.question_count, 3)
+        
+        # Follow-ups are not followed up again
+        response = self.client.post(f'/api/interviews/{self.session.id}/answers', {
+            'question_id': followup['id'],
+            'answer_text': 'Still not sure.',
+            'time_seconds': 30,
+        }, format='json')
+        self.assertIsNone(response.data['followup_question'])
+    
+    def test_no_followup_without_free_order(self):
+        """Test consecutive orders and the per-session cap stop follow-ups."""
+        from .services.followup import create_followup, select_followup
+        
+        followup = select_followup(self.question, 'Sessions.', {})
+        
+        InterviewQuestion.objects.filter(id=self.next_question.id).update(order=self.question.order + 1)
+        self.assertIsNone(create_followup(self.question, followup))
+        
+        with override_settings(FOLLOWUP_MAX_PER_SESSION=0):
+            self.assertIsNone(create_followup(self.next_question, followup))
+        self.assertIsNotNone(create_followup(self.next_question, followup))
+    
+    @patch('interviews.services.llm_generator._complete')
+    def test_llm_refinement_rewords_unanswered_followup(self, mock_complete):
+        """Test the LLM stage replaces the templated wording."""
+        from .services.followup import ask_followup, refine_followup_with_llm
+        
+        InterviewAnswer.objects.create(
+            question=self.question,
+            answer_text='I think maybe sessions.',
+            time_seconds=30,
+        )
+        followup = ask_followup(self.question, 'I think maybe sessions.', {})
+        mock_complete.return_value = 'Question: "How do Django sessions authenticate a user?"'
+        
+        self.assertTrue(refine_followup_with_llm(followup.id))
+        followup.refresh_from_db()
+        self.assertEqual(followup.question_text, 'How do Django sessions authenticate a user?')
+        
+        # Answered follow-ups keep their wording
+        InterviewAnswer.objects.create(question=followup, answer_text='Cookies.', time_seconds=10)
+        mock_complete.return_value = 'Something else?'
+        self.assertFalse(refine_followup_with_llm(followup.id))
+
+
+class LiveInterviewSocketTests(TransactionTestCase):
+    """Test the live interview WebSocket channel (committed data, as the socket closes old connections)."""
+    
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            password='testpass123',
+        )
+        self.role = RoleCatalog.objects.create(
+            name='Backend Engineer',
+            category='backend',
+            description='Backend development role',
+            keywords_json=['python', 'django'],
+        )
+        self.session = InterviewSession.objects.create(
+            user=self.user,
+            role_selected=self.role,
+            level='mid',
+            type='technical',
+            status='in_progress',
+            question_count=2
+        )
+        self.questions = [
+            InterviewQuestion.objects.create(
+                session=self.session,
+                order=order * QUESTION_ORDER_STEP,
+                question_text=f'Question {order} about Django',
+                category='technical',
+                difficulty='medium',
+                skill_tags_json=['backend.django']
+            )
+            for order in range(1, 3)
+        ]
+    
+    def _token(self, user):
+        from rest_framework_simplejwt.tokens import AccessToken
+        return str(AccessToken.for_user(user))
+    
+    async def _connect(self, token, path=None):
+        from asgiref.testing import ApplicationCommunicator
+        from .websocket import live_interview_application
+        
+        communicator = ApplicationCommunicator(live_interview_application, {
+            'type': 'websocket',
+            'path': path or f'/ws/interviews/{self.session.id}',
+        })
+        await communicator.send_input({'type': 'websocket.connect'})
+        self.assertEqual((await communicator.receive_output())['type'], 'websocket.accept')
+        await communicator.send_input({'type': 'websocket.receive', 'text': json.dumps({'type': 'auth', 'token': token})})
+        return communicator
+    
+    async def _receive(self, communicator):
+        return json.loads((await communicator.receive_output(timeout=5))['text'])
+    
+    async def test_answer_over_socket(self):
+        """Test answers get scores, follow-ups and progress back on the socket."""
+        from asgiref.sync import sync_to_async
+        
+        communicator = await self._connect(await sync_to_async(self._token)(self.user))
+        
+        snapshot = await self._receive(communicator)
+        self.assertEqual(snapshot['type'], 'session')
+        self.assertEqual(len(snapshot['questions']), 2)
+        self.assertEqual(snapshot['session']['progress']['total_questions'], 2)
+        
+        await communicator.send_input({'type': 'websocket.receive', 'text': json.dumps({
+            'type': 'answer',
+            'question_id': str(self.questions[0].id),
+            'answer_text': 'I think maybe Django.',
+            'time_seconds': 30,
+        })})
+        reply = await self._receive(communicator)
+        
+        self.assertEqual(reply['type'], 'answer')
+        self.assertEqual(reply['answer']['answer_text'], 'I think maybe Django.')
+        self.assertIn('structure', reply['answer']['scores_json'])
+        self.assertEqual(reply['followup_question']['order'], 1500)
+        self.assertEqual(reply['progress'], {'current_question': 2, 'total_questions': 3, 'answered': 1})
+        
+        session = await sync_to_async(InterviewSession.objects.get)(id=self.session.id)
+        self.assertEqual((session.question_count, session.answered_count), (3, 1))
+        
+        # Duplicates are rejected from the in-memory state
+        await communicator.send_input({'type': 'websocket.receive', 'text': json.dumps({
+            'type': 'answer',
+            'question_id': str(self.questions[0].id),
+            'answer_text': 'Again.',
+        })})
+        self.assertEqual((await self._receive(communicator))['type'], 'error')
+        
+        await communicator.send_input({'type': 'websocket.disconnect', 'code': 1000})
+        await communicator.wait(timeout=5)
+    
+    async def test_invalid_messages_get_an_error_reply(self):
+        """Test bad input gets an error message and the connection stays usable."""
+        from asgiref.sync import sync_to_async
+        
+        communicator = await self._connect(await sync_to_async(self._token)(self.user))
+        await self._receive(communicator)
+        
+        for time_seconds in ['abc', -5, None]:
+            await communicator.send_input({'type': 'websocket.receive', 'text': json.dumps({
+                'type': 'answer',
+                'question_id': str(self.questions[0].id),
+                'answer_text': 'Django is a web framework.',
+                'time_seconds': time_seconds,
+            })})
+            self.assertEqual(
+                await self._receive(communicator),
+                {'type': 'error', 'error': 'time_seconds must be a non-negative integer'}
+            )
+        
+        await communicator.send_input({'type': 'websocket.receive', 'text': json.dumps({'type': 'ping'})})
+        self.assertEqual(await self._receive(communicator), {'type': 'pong'})
+        
+        await communicator.send_input({'type': 'websocket.disconnect', 'code': 1000})
+        await communicator.wait(timeout=5)
+    
+    async def test_first_message_must_be_auth(self):
+        """Test a first message of another type is not taken as authentication."""
+        from asgiref.sync import sync_to_async
+        from asgiref.testing import ApplicationCommunicator
+        from .websocket import live_interview_application
+        
+        communicator = ApplicationCommunicator(live_interview_application, {
+            'type': 'websocket',
+            'path': f'/ws/interviews/{self.session.id}',
+        })
+        await communicator.send_input({'type': 'websocket.connect'})
+        await communicator.receive_output()
+        token = await sync_to_async(self._token)(self.user)
+        await communicator.send_input({'type': 'websocket.receive', 'text': json.dumps({'type': 'ping', 'token': token})})
+        
+        self.assertEqual((await self._receive(communicator))['type'], 'error')
+        self.assertEqual(await communicator.receive_output(timeout=5), {'type': 'websocket.close', 'code': 4401})
+    
+    @patch('interviews.websocket.close_old_connections')
+    async def test_database_calls_close_old_connections(self, mock_close):
+        """Test every database call is wrapped in close_old_connections."""
+        from asgiref.sync import sync_to_async
+        
+        communicator = await self._connect(await sync_to_async(self._token)(self.user))
+        await self._receive(communicator)
+        # Before and after open() and snapshot()
+        self.assertEqual(mock_close.call_count, 4)
+        
+        await communicator.send_input({'type': 'websocket.disconnect', 'code': 1000})
+        await communicator.wait(timeout=5)
+    
+    async def test_rejects_other_users_and_bad_tokens(self):
+        """Test connections are closed without a valid token for the session owner."""
+        from asgiref.sync import sync_to_async
+        
+        other_user = await sync_to_async(User.objects.create_user)(
+            email='other@example.com',
+            password='testpass123',
+        )
+        cases = [('not-a-token', 4401), (await sync_to_async(self._token)(other_user), 4403)]
+        for token, code in cases:
+            communicator = await self._connect(token)
+            self.assertEqual((await self._receive(communicator))['type'], 'error')
+            self.assertEqual(await communicator.receive_output(timeout=5), {'type': 'websocket.close', 'code': code})
+
+
+class StaleSessionSweeperTests(TestCase):
+    """Test idle unfinished sessions are marked abandoned."""
+    
+    def setUp(self):
+        from datetime import timedelta
+        from django.utils import timezone
+        
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            password='testpass123',
+        )
+        self.role = RoleCatalog.objects.create(
+            name='Backend Engineer',
+            category='backend',
+            description='Backend development role',
+            keywords_json=['python', 'django'],
+        )
+        two_days_ago = timezone.now() - timedelta(days=2)
+        
+        def session(status, last_answer_at=None):
+            created = InterviewSession.objects.create(
+                user=self.user,
+                role_selected=self.role,
+                level='mid',
+                type='technical',
+                status=status
+            )
+            InterviewSession.objects.filter(id=created.id).update(created_at=two_days_ago)
+            if last_answer_at:
+                question = InterviewQuestion.objects.create(
+                    session=created,
+                    order=QUESTION_ORDER_STEP,
+                    question_text='What is Django?',
+                    category='technical',
+                    difficulty='medium',
+                )
+                answer = InterviewAnswer.objects.create(question=question, answer_text='A framework.', time_seconds=10)
+                InterviewAnswer.objects.filter(id=answer.id).update(submitted_at=last_answer_at)
+            return created.id
+        
+        self.never_answered = session('created')
+        self.idle = session('in_progress', last_answer_at=two_days_ago)
+        self.recently_answered = session('in_progress', last_answer_at=timezone.now())
+        self.completed = session('completed', last_answer_at=two_days_ago)
+        # Created within the threshold
+        self.new = InterviewSession.objects.create(
+            user=self.user, role_selected=self.role, level='mid', type='hr', status='created'
+        ).id
+    
+    def _statuses(self):
+        return dict(InterviewSession.objects.values_list('id', 'status'))
+    
+    def test_sweep_stale_sessions(self):
+        """Test only sessions idle past the threshold are abandoned, in chunks."""
+        from io import StringIO
+        from django.core.management import call_command
+        
+        out = StringIO()
+        call_command('sweep_stale_sessions', dry_run=True, stdout=out)
+        self.assertIn('2 stale sessions would be abandoned', out.getvalue())
+        self.assertNotIn('abandoned', self._statuses().values())
+        
+        out = StringIO()
+        call_command('sweep_stale_sessions', chunk_size=1, stdout=out)
+        self.assertIn('Abandoned 2 stale sessions', out.getvalue())
+        
+        statuses = self._statuses()
+        self.assertEqual(statuses[self.never_answered], 'abandoned')
+        self.assertEqual(statuses[self.idle], 'abandoned')
+        self.assertEqual(statuses[self.recently_answered], 'in_progress')
+        self.assertEqual(statuses[self.completed], 'completed')
+        self.assertEqual(statuses[self.new], 'created')
+    
+    def test_sweeper_task(self):
+        """Test the periodic task uses the configured threshold."""
+        from .tasks import abandon_stale_sessions
+        
+        with override_settings(STALE_SESSION_IDLE_HOURS=72):
+            self.assertEqual(abandon_stale_sessions(), 0)
+        self.assertEqual(abandon_stale_sessions(), 2)
+
+
+class InterviewExportTests(TestCase):
+    """Test the streaming export of a user's interview history."""
+    
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            password='testpass123',
+        )
+        self.client.force_authenticate(user=self.user)
+        self.role = RoleCatalog.objects.create(
+            name='Backend Engineer',
+            category='backend',
+            description='Backend development role',
+            keywords_json=['python', 'django'],
+        )
+        
+        session = InterviewSession.objects.create(
+            user=self.user,
+            role_selected=self.role,
+            level='mid',
+            type='technical',
+            status='completed',
+            overall_score=70
+        )
+        question = InterviewQuestion.objects.create(
+            session=session,
+            order=1,
+            question_text='What is Django?',
+            category='technical',
+            difficulty='medium',
+            skill_tags_json=['backend.django']
+        )
+        InterviewQuestion.objects.create(
+            session=session,
+            order=2,
+            question_text='Explain REST API',
+            category='technical',
+            difficulty='medium',
+        )
+        InterviewAnswer.objects.create(
+            question=question,
+            answer_text='Django is a web framework, "batteries included".',
+            time_seconds=60,
+            scores_json={'structure': 4, 'depth': 3},
+            feedback_json={'strengths': ['Clear']},
+        )
+        # A session without questions still gets a row
+        InterviewSession.objects.create(
+            user=self.user,
+            role_selected=self.role,
+            level='mid',
+            type='hr',
+            status='created'
+        )
+        # Other users' history is not exported
+        other_user = User.objects.create_user(email='other@example.com', password='testpass123')
+        InterviewSession.objects.create(
+            user=other_user,
+            role_selected=self.role,
+            level='mid',
+            type='hr'
+        )
+    
+    def _body(self, response):
+        return b''.join(response.streaming_content)
+    
+    def test_export_csv(self):
+        """Test CSV export has one row per question plus empty sessions."""
+        import csv
+        import io
+        
+        response = self.client.get('/api/interviews/export?format=csv&chunk_size=1')
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response['Content-Type'].startswith('text/csv'))
+        self.assertIn('interview-history.csv', response['Content-Disposition'])
+        
+        rows = list(csv.DictReader(io.StringIO(self._body(response).decode('utf-8'))))
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(rows[0]['answer_text'], 'Django is a web framework, "batteries included".')
+        self.assertEqual(rows[0]['score_structure'], '4')
+        self.assertEqual(rows[0]['score_relevance'], '')
+        self.assertEqual(json.loads(rows[0]['skill_tags']), ['backend.django'])
+        self.assertEqual((rows[1]['question_order'], rows[1]['answer_text']), ('2', ''))
+        self.assertEqual((rows[2]['type'], rows[2]['question_text']), ('hr', ''))
+    
+    def test_export_ndjson_gzip(self):
+        """Test NDJSON export compressed on the fly."""
+        import gzip
+        
+        response = self.client.get('/api/interviews/export?format=ndjson&gzip=1')
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'application/gzip')
+        self.assertIn('interview-history.ndjson.gz', response['Content-Disposition'])
+        
+        lines = gzip.decompress(self._body(response)).decode('utf-8').splitlines()
+        rows = [json.loads(line) for line in lines]
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(rows[0]['question_text'], 'What is Django?')
+        self.assertEqual(rows[0]['feedback'], {'strengths': ['Clear']})
+        self.assertEqual(rows[0]['overall_score'], 70)
+    
+    def test_export_unknown_format(self):
+        """Test unsupported formats are rejected with a JSON 400."""
+        response = self.client.get('/api/interviews/export?format=xml')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(response.json(), {'error': 'format must be one of: csv, ndjson'})
+    
+    def test_export_chunk_size_range(self):
+        """Test chunk sizes outside 1..MAX_EXPORT_CHUNK are rejected before streaming."""
+        from .services.export import MAX_EXPORT_CHUNK
+        
+        for chunk_size in [-1, 0, MAX_EXPORT_CHUNK + 1]:
+            response = self.client.get(f'/api/interviews/export?format=csv&chunk_size={chunk_size}')
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertFalse(response.streaming)
+            self.assertEqual(
+                response.json(),
+                {'error': f'chunk_size must be an integer from 1 to {MAX_EXPORT_CHUNK}'}
+            )
+        
+        response = self.client.get(f'/api/interviews/export?format=csv&chunk_size={MAX_EXPORT_CHUNK}')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(self._body(response).decode('utf-8').splitlines()), 4)
+    
+    def test_export_errors_are_json(self):
+        """Test error responses are sent as JSON, not under the export content type."""
+        response = self.client.get('/api/interviews/export?format=csv&chunk_size=abc')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertIn('chunk_size', response.json()['error'])
+        
+        self.client.force_authenticate(user=None)
+        response = self.client.get('/api/interviews/export?format=ndjson')
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(response['Content-Type'], 'application/json')
 
 
 class FeedbackServiceTests(TestCase):
@@ -3,17 +3,21 @@ from .views import (
     InterviewSessionCreateView,
     InterviewSessionDetailView,
     InterviewQuestionsView,
+    InterviewQuestionStreamView,
     InterviewAnswerView,
     InterviewFinishView,
     InterviewReportView,
+    InterviewExportView,
 )
 
 app_name = 'interviews'
 
 urlpatterns = [
     path('interviews', InterviewSessionCreateView.as_view(), name='interview-create'),
+    path('interviews/export', InterviewExportView.as_view(), name='interview-export'),
     path('interviews/<uuid:id>', InterviewSessionDetailView.as_view(), name='interview-detail'),
     path('interviews/<uuid:id>/questions', InterviewQuestionsView.as_view(), name='interview-questions'),
+    path('interviews/<uuid:id>/questions/stream', InterviewQuestionStreamView.as_view(), name='interview-question-stream'),
     path('interviews/<uuid:id>/answers', InterviewAnswerView.as_view(), name='interview-answer'),
     path('interviews/<uuid:id>/finish', InterviewFinishView.as_view(), name='interview-finish'),
     path('interviews/<uuid:id>/report', InterviewReportView.as_view(), name='interview-report'),
@@ -1,14 +1,18 @@
 from .session import InterviewSessionCreateView, InterviewSessionDetailView, InterviewFinishView
 from .questions import InterviewQuestionsView
+from .stream import InterviewQuestionStreamView
 from .answers import InterviewAnswerView
 from .report import InterviewReportView
+from .export import InterviewExportView
 
 __all__ = [
     'InterviewSessionCreateView',
     'InterviewSessionDetailView',
     'InterviewFinishView',
     'InterviewQuestionsView',
+    'InterviewQuestionStreamView',
     'InterviewAnswerView',
     'InterviewReportView',
+    'InterviewExportView',
 ]
 
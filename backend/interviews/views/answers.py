@@ -1,11 +1,9 @@
 from rest_framework import generics, status
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from users.permissions import IsAuthenticatedOwner
-from ..models import InterviewSession, InterviewQuestion, InterviewAnswer
-from ..serializers import InterviewAnswerSerializer, InterviewAnswerResponseSerializer
-from ..services.scorer import score_answer, calculate_overall_score
-from ..services.feedback import generate_feedback
+from ..models import InterviewSession, InterviewQuestion
+from ..serializers import InterviewAnswerSerializer, InterviewAnswerResponseSerializer, InterviewQuestionSerializer
+from ..services.answer_submission import DuplicateAnswerError, submit_answer
 
 
 class InterviewAnswerView(generics.CreateAPIView):
@@ -26,57 +24,51 @@ class InterviewAnswerView(generics.CreateAPIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # Get session and verify ownership
+        # One query: question + session, scoped to the session in the URL
         try:
-            session = InterviewSession.objects.get(id=session_id)
-        except InterviewSession.DoesNotExist:
+            question = InterviewQuestion.objects.select_related('session').get(
+                id=question_id,
+                session_id=session_id
+            )
+        except InterviewQuestion.DoesNotExist:
+            if not InterviewSession.objects.filter(id=session_id).exists():
+                return Response(
+                    {'error': 'Session not found'},
+                    status=status.HTTP_404_NOT_FOUND
+                )
             return Response(
-                {'error': 'Session not found'},
+                {'error': 'Question not found'},
                 status=status.HTTP_404_NOT_FOUND
             )
         
-        if session.user != request.user:
+        session = question.session
+        if session.user_id != request.user.id:
             return Response(
                 {'error': 'Permission denied'},
                 status=status.HTTP_403_FORBIDDEN
             )
         
-        # Get question
         try:
-            question = InterviewQuestion.objects.get(id=question_id, session=session)
-        except InterviewQuestion.DoesNotExist:
-            return Response(
-                {'error': 'Question not found'},
-                status=status.HTTP_404_NOT_FOUND
+            submission = submit_answer(
+                question,
+                answer_text,
+                time_seconds=time_seconds,
+                idempotency_key=request.headers.get('Idempotency-Key')
             )
-        
-        # Check if answer already exists
-        if hasattr(question, 'answer'):
+        except DuplicateAnswerError:
             return Response(
                 {'error': 'Answer already submitted for this question'},
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # Score the answer
-        scores = score_answer(answer_text, question)
-        
-        # Generate feedback
-        feedback = generate_feedback(answer_text, scores, question)
-        
-        # Get skill tags from question
-        skill_tags = question.skill_tags_json or []
-        
-        # Create answer
-        answer = InterviewAnswer.objects.create(
-            question=question,
-            answer_text=answer_text,
-            time_seconds=time_seconds,
-            scores_json=scores,
-            feedback_json=feedback,
-            skill_tags_json=skill_tags
+        # Serialize and return; a replayed retry differs only in the status
+        response_serializer = InterviewAnswerResponseSerializer(submission.answer)
+        response_data = response_serializer.data
+        response_data['scoring'] = submission.scoring.metadata()
+        response_data['followup_question'] = (
+            InterviewQuestionSerializer(submission.followup).data if submission.followup else None
+        )
+        return Response(
+            response_data,
+            status=status.HTTP_200_OK if submission.replayed else status.HTTP_201_CREATED
         )
-        
-        # Serialize and return
-        response_serializer = InterviewAnswerResponseSerializer(answer)
-        return Response(response_serializer.data, status=status.HTTP_201_CREATED)
-
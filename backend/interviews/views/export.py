@@ -0,0 +1,84 @@
+from django.http import Http404, StreamingHttpResponse
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.views import APIView
+from ..services.export import MAX_EXPORT_CHUNK, iter_export_rows, export_csv, export_ndjson, gzip_stream
+
+
+class CSVExportRenderer(JSONRenderer):
+    """Select the CSV export (?format=csv); error responses are still JSON."""
+    media_type = 'text/csv'
+    format = 'csv'
+
+
+class NDJSONExportRenderer(JSONRenderer):
+    """Select the NDJSON export (?format=ndjson); error responses are still JSON."""
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+
+
+EXPORT_FORMATS = [CSVExportRenderer.format, NDJSONExportRenderer.format]
+
+
+class InterviewExportView(APIView):
+    """Stream the user's whole interview history as CSV or NDJSON, optionally gzipped."""
+    permission_classes = [IsAuthenticated]
+    renderer_classes = [CSVExportRenderer, NDJSONExportRenderer]
+    
+    def perform_content_negotiation(self, request, force=False):
+        try:
+            return super().perform_content_negotiation(request, force)
+        except Http404:
+            # Unknown ?format=: negotiate JSON so get() can answer 400
+            return (JSONRenderer(), JSONRenderer.media_type)
+    
+    def finalize_response(self, request, response, *args, **kwargs):
+        # Errors are JSON, whichever export format was asked for
+        if isinstance(response, Response) and response.status_code >= 400:
+            request.accepted_renderer = JSONRenderer()
+            request.accepted_media_type = JSONRenderer.media_type
+        return super().finalize_response(request, response, *args, **kwargs)
+    
+    def get(self, request, *args, **kwargs):
+        export_format = request.accepted_renderer.format
+        if export_format not in EXPORT_FORMATS:
+            return Response(
+                {'error': f"format must be one of: {', '.join(EXPORT_FORMATS)}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        compress = request.query_params.get('gzip', '').lower() in ('1', 'true', 'yes')
+        
+        # Validate before streaming: errors after the headers would cut the body short
+        chunk_size = request.query_params.get('chunk_size')
+        if chunk_size is not None:
+            try:
+                chunk_size = int(chunk_size)
+            except ValueError:
+                chunk_size = 0
+            if not 1 <= chunk_size <= MAX_EXPORT_CHUNK:
+                return Response(
+                    {'error': f'chunk_size must be an integer from 1 to {MAX_EXPORT_CHUNK}'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+        
+        rows = iter_export_rows(request.user, chunk_size=chunk_size)
+        if export_format == 'ndjson':
+            body = export_ndjson(rows)
+        else:
+            body = export_csv(rows)
+        
+        filename = f'interview-history.{export_format}'
+        content_type = f'{request.accepted_renderer.media_type}; charset=utf-8'
+        if compress:
+            body = gzip_stream(body)
+            filename += '.gz'
+            content_type = 'application/gzip'
+        
+        response = StreamingHttpResponse(body, content_type=content_type)
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        response['Cache-Control'] = 'private, no-store'
+        response['X-Accel-Buffering'] = 'no'
+        return response
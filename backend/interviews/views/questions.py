@@ -1,43 +1,51 @@
-from rest_framework import generics, status
+from django.utils.http import parse_etags
+from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from users.permissions import IsAuthenticatedOwner
+from rest_framework.views import APIView
 from ..models import InterviewSession
-from ..serializers import InterviewQuestionSerializer
+from ..services.question_read_model import get_session_questions
 
 
-class InterviewQuestionsView(generics.ListAPIView):
+class InterviewQuestionsView(APIView):
     """Get all questions for an interview session."""
     permission_classes = [IsAuthenticated]
-    serializer_class = InterviewQuestionSerializer
     
-    def get_queryset(self):
-        session_id = self.kwargs['id']
-        return InterviewSession.objects.get(id=session_id).questions.all()
-    
-    def list(self, request, *args, **kwargs):
+    def get(self, request, *args, **kwargs):
         session_id = self.kwargs['id']
         
         # Check session exists and user owns it
-        try:
-            session = InterviewSession.objects.get(id=session_id)
-        except InterviewSession.DoesNotExist:
+        session = InterviewSession.objects.filter(id=session_id).values(
+            'user_id', 'question_count', 'answered_count', 'updated_at'
+        ).first()
+        if session is None:
             return Response(
                 {'error': 'Session not found'},
                 status=status.HTTP_404_NOT_FOUND
             )
         
-        if session.user != request.user:
+        if session['user_id'] != request.user.id:
             return Response(
                 {'error': 'Permission denied'},
                 status=status.HTTP_403_FORBIDDEN
             )
         
-        questions = session.questions.all()
-        serializer = self.get_serializer(questions, many=True)
+        # Changes whenever a question or answer is added, or grades are updated
+        etag = '"{}-{}-{}"'.format(
+            session['question_count'],
+            session['answered_count'],
+            int(session['updated_at'].timestamp() * 1000)
+        )
+        if etag in parse_etags(request.headers.get('If-None-Match', '')):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            questions = get_session_questions(session_id)
+            response = Response({
+                'questions': questions,
+                'count': len(questions)
+            })
         
-        return Response({
-            'questions': serializer.data,
-            'count': len(serializer.data)
-        })
-
+        response['ETag'] = etag
+        # Let browsers revalidate with If-None-Match on every poll
+        response['Cache-Control'] = 'private, no-cache'
+        return response
@@ -1,13 +1,25 @@
 from rest_framework import generics, status
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
+from django.conf import settings
+from django.db import transaction
 from django.utils import timezone
+from analytics.services.cache import schedule_analytics_bump
 from users.permissions import IsAuthenticatedOwner
 from roles.models import RoleCatalog
 from profiles.models import Profile
 from ..models import InterviewSession
 from ..serializers import InterviewSessionSerializer
-from ..services.generator import generate_interview_questions
+from ..services.generator import generate_interview_questions, generate_opening_question
+from ..tasks import generate_session_questions
+
+
+def _enqueue_question_generation(session_id: str):
+    """Hand question generation to a worker, generating inline if the broker is unavailable."""
+    try:
+        generate_session_questions.delay(session_id)
+    except Exception:
+        generate_session_questions(session_id)
 
 
 class InterviewSessionCreateView(generics.CreateAPIView):
@@ -72,12 +84,24 @@ class InterviewSessionCreateView(generics.CreateAPIView):
             type=interview_type,
             status='created'
         )
+        # total_sessions on the analytics overview counts every session
+        schedule_analytics_bump(request.user.id)
         
         # Generate questions
         try:
-            generate_interview_questions(str(session.id))
-            session.status = 'in_progress'
-            session.save()
+            if getattr(settings, 'USE_LLM_FOR_QUESTIONS', False):
+                # LLM generation takes 10-30s: serve the first question from the
+                # local bank now and let a worker write the personalized ones.
+                generate_opening_question(session)
+                session.status = 'generating'
+                session.save(update_fields=['status', 'updated_at'])
+                session.refresh_from_db(fields=['question_count'])
+                session_id = str(session.id)
+                transaction.on_commit(lambda: _enqueue_question_generation(session_id))
+            else:
+                # Writes the questions and sets 'in_progress' in one transaction
+                generate_interview_questions(str(session.id))
+                session.refresh_from_db(fields=['status', 'updated_at', 'question_count'])
         except Exception as e:
             return Response(
                 {'error': f'Error generating questions: {str(e)}'},
@@ -112,18 +136,20 @@ class InterviewFinishView(generics.UpdateAPIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # Calculate overall score from all answers
-        from ..services.report import aggregate_scores
+        # Snapshot the report aggregates; the overall score comes from them
+        from analytics.services.skill_stats import record_session_skills
+        from ..services.report import build_session_report
         from ..services.scorer import calculate_overall_score
         
-        rubric_scores = aggregate_scores(session)
-        overall_score = calculate_overall_score(rubric_scores)
-        
-        # Update session
-        session.overall_score = overall_score
-        session.status = 'completed'
-        session.ended_at = timezone.now()
-        session.save()
+        with transaction.atomic():
+            session.status = 'completed'
+            session.ended_at = timezone.now()
+            report = build_session_report(session)
+            session.overall_score = calculate_overall_score(report.rubric_breakdown_json)
+            # Only these fields: the progress counters are maintained with F() updates
+            session.save(update_fields=['overall_score', 'status', 'ended_at', 'updated_at'])
+            record_session_skills(session, report.skill_breakdown_json)
+            schedule_analytics_bump(session.user_id)
         
         serializer = self.get_serializer(session)
         return Response(serializer.data)
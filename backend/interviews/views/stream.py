@@ -0,0 +1,63 @@
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.views import APIView
+from ..models import InterviewSession
+from ..services.question_stream import open_question_stream
+
+
+class EventStreamRenderer(JSONRenderer):
+    """Accept text/event-stream requests; error responses are still JSON."""
+    media_type = 'text/event-stream'
+    format = 'sse'
+
+
+class InterviewQuestionStreamView(APIView):
+    """Stream questions of an interview session as server-sent events while they are generated."""
+    permission_classes = [IsAuthenticated]
+    renderer_classes = [JSONRenderer, EventStreamRenderer]
+    
+    def get(self, request, *args, **kwargs):
+        session_id = self.kwargs['id']
+        
+        # Check session exists and user owns it
+        session = InterviewSession.objects.filter(id=session_id).only('user_id').first()
+        if session is None:
+            return Response(
+                {'error': 'Session not found'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        
+        if session.user_id != request.user.id:
+            return Response(
+                {'error': 'Permission denied'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        
+        # Resume after the last question the client received
+        last_event_id = request.headers.get('Last-Event-ID') or request.query_params.get('last_order', 0)
+        try:
+            last_order = int(last_event_id)
+        except (TypeError, ValueError):
+            return Response(
+                {'error': 'Last-Event-ID must be a question order'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        stream = open_question_stream(session_id, last_order)
+        if stream is None:
+            # Too many open streams: the client polls the questions list instead
+            response = Response(
+                {'error': 'Too many open question streams, poll the questions instead'},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE
+            )
+            response['Retry-After'] = str(getattr(settings, 'QUESTION_STREAM_RETRY_SECONDS', 3))
+            return response
+        
+        response = StreamingHttpResponse(stream, content_type='text/event-stream')
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'
+        return response
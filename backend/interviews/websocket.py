@@ -0,0 +1,291 @@
+"""
+Live interview channel over a WebSocket, served from app/asgi.py.
+
+One connection follows one interview session:
+
+    ws://<host>/ws/interviews/<session id>
+
+The client authenticates once with its first message (which must be of
+type "auth"), then the session row
+and its questions are loaded and kept in memory for the connection. Answers
+are submitted over the socket and the scores, feedback, follow-up question
+and progress come back on it, so an answer costs no extra GET round trips,
+JWT checks or session reloads.
+
+Client messages:
+    {"type": "auth", "token": "<access token>"}
+    {"type": "answer", "question_id": "...", "answer_text": "...",
+     "time_seconds": 120, "idempotency_key": "..."}
+    {"type": "sync"}   reload questions (e.g. background generation, LLM grades)
+    {"type": "ping"}
+
+Server messages:
+    {"type": "session", "session": {...}, "questions": [...]}
+    {"type": "answer", "answer": {...}, "scoring": {...},
+     "followup_question": {...} | null, "progress": {...}}
+    {"type": "error", "error": "..."}
+    {"type": "pong"}
+
+Invalid messages get an error message and the connection stays open; an
+unexpected failure closes it with 1011. Every ORM call goes through
+database_sync_to_async, which drops stale or broken database connections
+before and after the call, since a socket can outlive many of them.
+"""
+import asyncio
+import json
+import re
+from typing import Dict, Optional
+from asgiref.sync import SyncToAsync
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import close_old_connections
+from rest_framework.utils.encoders import JSONEncoder
+from .models import InterviewSession, InterviewQuestion
+from .services.answer_submission import DuplicateAnswerError, submit_answer
+from .services.question_read_model import get_session_questions
+
+
+LIVE_INTERVIEW_PATH = re.compile(r'^/ws/interviews/(?P<id>[0-9a-fA-F-]{36})/?$')
+
+# Application close codes (4000-4999), mirroring the HTTP statuses
+CLOSE_UNAUTHORIZED = 4401
+CLOSE_FORBIDDEN = 4403
+CLOSE_NOT_FOUND = 4404
+CLOSE_INTERNAL_ERROR = 1011
+
+# Fields of a question row copied onto the in-memory InterviewQuestion
+QUESTION_MODEL_FIELDS = [
+    'id', 'order', 'question_text', 'category', 'difficulty',
+    'skill_tags_json', 'is_followup', 'created_at',
+]
+
+_encoder = JSONEncoder()
+
+
+class DatabaseSyncToAsync(SyncToAsync):
+    """SyncToAsync that closes unusable or expired DB connections around each call."""
+    
+    def thread_handler(self, loop, *args, **kwargs):
+        close_old_connections()
+        try:
+            return super().thread_handler(loop, *args, **kwargs)
+        finally:
+            close_old_connections()
+
+
+database_sync_to_async = DatabaseSyncToAsync
+
+
+async def live_interview_application(scope, receive, send):
+    """ASGI application for WebSocket connections."""
+    match = LIVE_INTERVIEW_PATH.match(scope.get('path', ''))
+    
+    message = await receive()
+    if message['type'] != 'websocket.connect':
+        return
+    
+    if match is None:
+        # Closing before accepting rejects the handshake
+        await send({'type': 'websocket.close', 'code': CLOSE_NOT_FOUND})
+        return
+    
+    await send({'type': 'websocket.accept'})
+    await LiveInterviewConnection(match.group('id'), send).run(receive)
+
+
+class LiveInterviewConnection:
+    """State of one live interview connection."""
+    
+    def __init__(self, session_id: str, send):
+        self.session_id = session_id
+        self.send = send
+        self.user = None
+        self.session: Optional[InterviewSession] = None
+        self.questions: Dict[str, InterviewQuestion] = {}
+        self.answered = set()
+    
+    async def run(self, receive):
+        timeout = getattr(settings, 'LIVE_INTERVIEW_AUTH_TIMEOUT_SECONDS', 10)
+        try:
+            message = await asyncio.wait_for(receive(), timeout=timeout)
+        except asyncio.TimeoutError:
+            await self.close(CLOSE_UNAUTHORIZED, 'Authentication timed out')
+            return
+        
+        if message['type'] == 'websocket.disconnect':
+            return
+        
+        data = self.decode(message)
+        if data.get('type') != 'auth':
+            await self.close(CLOSE_UNAUTHORIZED, 'The first message must be of type auth')
+            return
+        
+        try:
+            error, code = await database_sync_to_async(self.open)(data.get('token'))
+            if error:
+                await self.close(code, error)
+                return
+            
+            await self.send_json(await database_sync_to_async(self.snapshot)())
+            
+            while True:
+                message = await receive()
+                if message['type'] == 'websocket.disconnect':
+                    return
+                await self.handle(self.decode(message))
+        except Exception:
+            # Tell the client, then let the server log the traceback
+            await self.close(CLOSE_INTERNAL_ERROR, 'Internal error')
+            raise
+    
+    async def handle(self, data: Dict):
+        message_type = data.get('type')
+        
+        try:
+            if message_type == 'answer':
+                reply = await database_sync_to_async(self.answer)(data)
+            elif message_type == 'sync':
+                reply = await database_sync_to_async(self.snapshot)(reload=True)
+            elif message_type == 'ping':
+                reply = {'type': 'pong'}
+            else:
+                reply = {'type': 'error', 'error': f'Unknown message type: {message_type}'}
+        except ValidationError as exc:
+            reply = {'type': 'error', 'error': '; '.join(exc.messages)}
+        
+        await self.send_json(reply)
+    
+    def open(self, token: Optional[str]):
+        """
+        Authenticate the connection and load the session.
+        
+        Returns:
+            (error, close code), or (None, None) on success
+        """
+        from rest_framework_simplejwt.authentication import JWTAuthentication
+        from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+        
+        if not token:
+            return 'Authentication required', CLOSE_UNAUTHORIZED
+        
+        authentication = JWTAuthentication()
+        try:
+            self.user = authentication.get_user(authentication.get_validated_token(token))
+        except (InvalidToken, AuthenticationFailed):
+            return 'Invalid token', CLOSE_UNAUTHORIZED
+        
+        self.session = InterviewSession.objects.filter(id=self.session_id).first()
+        if self.session is None:
+            return 'Session not found', CLOSE_NOT_FOUND
+        if self.session.user_id != self.user.id:
+            return 'Permission denied', CLOSE_FORBIDDEN
+        
+        return None, None
+    
+    def snapshot(self, reload: bool = False) -> Dict:
+        """Load the session's questions into memory and describe them to the client."""
+        if reload:
+            self.session.refresh_from_db(fields=['status', 'question_count', 'answered_count'])
+        
+        questions = get_session_questions(self.session.id)
+        self.questions = {str(q['id']): self._question_model(q) for q in questions}
+        self.answered = {str(q['id']) for q in questions if q['answer'] is not None}
+        
+        return {
+            'type': 'session',
+            'session': {
+                'id': self.session.id,
+                'status': self.session.status,
+                'progress': self.progress(),
+            },
+            'questions': questions,
+        }
+    
+    def answer(self, data: Dict) -> Dict:
+        """Submit an answer from the in-memory question, without reloading the session."""
+        from .serializers import InterviewAnswerResponseSerializer, InterviewQuestionSerializer
+        
+        question_id = str(data.get('question_id') or '')
+        answer_text = data.get('answer_text')
+        if not question_id or not answer_text or not isinstance(answer_text, str):
+            return {'type': 'error', 'error': 'question_id and answer_text are required'}
+        
+        time_seconds = data.get('time_seconds', 0)
+        if isinstance(time_seconds, bool) or not isinstance(time_seconds, int) or time_seconds < 0:
+            return {'type': 'error', 'error': 'time_seconds must be a non-negative integer'}
+        
+        if question_id not in self.questions:
+            # Written by background generation after the snapshot
+            self.snapshot(reload=True)
+        question = self.questions.get(question_id)
+        if question is None:
+            return {'type': 'error', 'error': 'Question not found'}
+        if question_id in self.answered and not data.get('idempotency_key'):
+            return {'type': 'error', 'error': 'Answer already submitted for this question'}
+        
+        try:
+            submission = submit_answer(
+                question,
+                answer_text,
+                time_seconds=time_seconds,
+                idempotency_key=data.get('idempotency_key')
+            )
+        except DuplicateAnswerError:
+            self.answered.add(question_id)
+            return {'type': 'error', 'error': 'Answer already submitted for this question'}
+        
+        if not submission.replayed:
+            self.answered.add(question_id)
+            self.session.answered_count += 1
+        
+        followup = None
+        if submission.followup:
+            self.questions[str(submission.followup.id)] = submission.followup
+            if not submission.replayed:
+                self.session.question_count += 1
+            followup = InterviewQuestionSerializer(submission.followup).data
+        
+        return {
+            'type': 'answer',
+            'answer': InterviewAnswerResponseSerializer(submission.answer).data,
+            'scoring': submission.scoring.metadata() if submission.scoring else None,
+            'followup_question': followup,
+            'progress': self.progress(),
+        }
+    
+    def progress(self) -> Dict:
+        """Same shape as InterviewSessionSerializer's progress, from the in-memory counters."""
+        total_questions = self.session.question_count
+        answered_questions = self.session.answered_count
+        
+        return {
+            'current_question': answered_questions + 1 if answered_questions < total_questions else total_questions,
+            'total_questions': total_questions,
+            'answered': answered_questions,
+        }
+    
+    def _question_model(self, row: Dict) -> InterviewQuestion:
+        """InterviewQuestion built from a read model row, bound to the in-memory session."""
+        question = InterviewQuestion(
+            session=self.session,
+            parent_question_id=row['parent_question'],
+            **{field: row[field] for field in QUESTION_MODEL_FIELDS}
+        )
+        question._state.adding = False
+        question._state.db = 'default'
+        return question
+    
+    async def send_json(self, data: Dict):
+        await self.send({'type': 'websocket.send', 'text': _encoder.encode(data)})
+    
+    async def close(self, code: int, error: str):
+        await self.send_json({'type': 'error', 'error': error})
+        await self.send({'type': 'websocket.close', 'code': code})
+    
+    @staticmethod
+    def decode(message: Dict) -> Dict:
+        try:
+            data = json.loads(message.get('text') or message.get('bytes') or '{}')
+        except ValueError:
+            return {}
+        return data if isinstance(data, dict) else {}
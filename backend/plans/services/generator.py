@@ -1,6 +1,6 @@
 from typing import List, Dict, Set
 from interviews.models import InterviewSession, InterviewAnswer
-from interviews.services.report import generate_report
+from interviews.services.report import get_session_report
 from profiles.models import Profile
 from roles.models import RoleCatalog
 from ..models import PlanTemplate, UpgradePlan
@@ -62,35 +62,33 @@ def get_interview_history_skills(user) -> Dict[str, float]:
     Returns:
         Dictionary mapping skill_tags to average scores across all interviews
     """
-    completed_sessions = InterviewSession.objects.filter(
-        user=user,
-        status='completed'
-    )
+    # One query over the answers of all completed sessions
+    answers = InterviewAnswer.objects.filter(
+        question__session__user=user,
+        question__session__status='completed'
+    ).values_list('skill_tags_json', 'scores_json')
     
     skill_scores = {}
     skill_counts = {}
     
-    for session in completed_sessions:
-        answers = InterviewAnswer.objects.filter(question__session=session)
+    for skill_tags, scores in answers:
+        skill_tags = skill_tags or []
+        scores = scores or {}
         
-        for answer in answers:
-            skill_tags = answer.skill_tags_json or []
-            scores = answer.scores_json or {}
-            
-            # Calculate average score for this answer
-            if scores:
-                avg_score = sum(scores.values()) / len(scores)
-            else:
-                avg_score = 0
+        # Calculate average score for this answer
+        if scores:
+            avg_score = sum(scores.values()) / len(scores)
+        else:
+            avg_score = 0
+        
+        # Aggregate by skill tag
+        for skill_tag in skill_tags:
+            if skill_tag not in skill_scores:
+                skill_scores[skill_tag] = 0
+                skill_counts[skill_tag] = 0
             
-            # Aggregate by skill tag
-            for skill_tag in skill_tags:
-                if skill_tag not in skill_scores:
-                    skill_scores[skill_tag] = 0
-                    skill_counts[skill_tag] = 0
-                
-                skill_scores[skill_tag] += avg_score
-                skill_counts[skill_tag] += 1
+            skill_scores[skill_tag] += avg_score
+            skill_counts[skill_tag] += 1
     
     # Calculate averages
     skill_averages = {}
@@ -129,8 +127,7 @@ def identify_skill_gaps(user, role: RoleCatalog, current_session: InterviewSessi
     history_skills = get_interview_history_skills(user)
     
     # Get current session weak skills
-    report = generate_report(str(current_session.id))
-    current_skill_breakdown = report.get('skill_breakdown', {}) if report else {}
+    current_skill_breakdown = get_session_report(current_session).skill_breakdown_json
     
     # Identify gaps:
     # 1. Skills needed for role but weak in current interview
@@ -185,12 +182,7 @@ def identify_weak_skills(session: InterviewSession) -> List[str]:
     Returns:
         List of skill tags with score < 3.0 (top 5, sorted by score ascending)
     """
-    report = generate_report(str(session.id))
-    
-    if not report:
-        return []
-    
-    skill_breakdown = report.get('skill_breakdown', {})
+    skill_breakdown = get_session_report(session).skill_breakdown_json
     
     # Filter skills with score < 3.0 (weak skills)
     weak_skills = [
@@ -540,16 +532,13 @@ def generate_upgrade_plan(session_id: str, duration_days: int = 7) -> UpgradePla
     if session.status != 'completed':
         raise ValueError("Interview session must be completed to generate upgrade plan")
     
-    # Generate report
-    report = generate_report(session_id)
-    
-    if not report:
-        raise ValueError("Could not generate interview report")
+    # Report snapshot written when the session finished
+    report = get_session_report(session)
     
     # Get strengths and weaknesses
-    strengths = report.get('strengths', [])
-    weaknesses = report.get('weaknesses', [])
-    skill_breakdown = report.get('skill_breakdown', {})
+    strengths = report.strengths_json
+    weaknesses = report.weaknesses_json
+    skill_breakdown = report.skill_breakdown_json
     
     # Identify weak skills from current interview
     weak_skills = identify_weak_skills(session)
@@ -5,6 +5,7 @@ from rest_framework import status
 from interviews.models import InterviewSession, InterviewQuestion, InterviewAnswer
 from roles.models import RoleCatalog
 from profiles.models import Profile
+from analytics.services.skill_stats import rebuild_user_skill_stats
 from django.utils import timezone
 from datetime import timedelta
 
@@ -144,6 +145,10 @@ class AnalyticsFlowIntegrationTest(TestCase):
             },
             skill_tags_json=['backend.django.auth']
         )
+        
+        # The sessions are created completed, so build the skill rollup the
+        # finish endpoint would have built
+        rebuild_user_skill_stats(self.user.id)
     
     def test_complete_analytics_flow(self):
         """Test complete flow: Complete multiple interviews → Check analytics overview → Check skill trends."""
@@ -180,7 +185,7 @@ class AnalyticsFlowIntegrationTest(TestCase):
         self.assertIn('communication.star', skill_tags)
         
         # Step 3: Get session history
-        sessions_response = self.client.get('/api/analytics/sessions')
+        sessions_response = self.client.get('/api/analytics/sessions', {'include_count': 1})
         self.assertEqual(sessions_response.status_code, status.HTTP_200_OK)
         self.assertIn('results', sessions_response.data)
         self.assertIn('count', sessions_response.data)
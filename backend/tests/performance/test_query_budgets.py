@@ -0,0 +1,253 @@
+"""
+Query-count and latency budgets for every API endpoint.
+
+Each endpoint is called for a user with a small history and for a user with
+a large one (dozens of completed sessions, 12 answered questions each). The
+number of SQL queries must stay within the endpoint's budget and must not
+grow with the size of the history, which catches N+1 regressions in views
+and serializers.
+
+Wall time per endpoint is written as JSON to QUERY_BUDGET_REPORT (default:
+query_budget_report.json in the system temp directory) so runs before and
+after a change can be compared.
+"""
+import json
+import os
+import tempfile
+import time
+from datetime import timedelta
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, URLResolver, get_resolver
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+from analytics.services.skill_stats import rebuild_user_skill_stats
+from interviews.models import InterviewSession, InterviewQuestion, InterviewAnswer
+from interviews.services.generator import QUESTION_ORDER_STEP
+from interviews.services.report import build_session_report
+from profiles.models import Profile, CVDocument
+from roles.models import RoleCatalog, RoleSuggestion
+
+User = get_user_model()
+
+SMALL_HISTORY = 2
+LARGE_HISTORY = 24
+QUESTIONS_PER_SESSION = 12
+
+SCORES = {'structure': 3, 'relevance': 4, 'technical_accuracy': 3, 'depth': 2, 'communication': 4}
+FEEDBACK = {'strengths': ['Clear structure'], 'weaknesses': ['Needs more depth'], 'improvements': []}
+
+# (url name, method, path, request data, query budget). Paths are formatted
+# with the user's fixture: session (in progress), completed, cv.
+ENDPOINTS = [
+    ('register', 'post', '/api/auth/register', 'register', 2),
+    ('login', 'post', '/api/auth/login', 'login', 2),
+    ('token_refresh', 'post', '/api/auth/refresh', 'refresh', 1),
+    ('logout', 'post', '/api/auth/logout', None, 0),
+    ('cv-detail', 'get', '/api/cv/{cv}', None, 2),
+    ('profile-me', 'get', '/api/profile/me', None, 3),
+    ('role-list', 'get', '/api/roles', None, 2),
+    ('role-suggestions', 'get', '/api/cv/{cv}/role-suggestions', None, 5),
+    ('interview-create', 'post', '/api/interviews', 'create_session', 9),
+    ('interview-export', 'get', '/api/interviews/export', None, 1),
+    ('interview-detail', 'get', '/api/interviews/{session}', None, 3),
+    ('interview-questions', 'get', '/api/interviews/{session}/questions', None, 2),
+    ('interview-question-stream', 'get', '/api/interviews/{session}/questions/stream', None, 3),
+    ('interview-answer', 'post', '/api/interviews/{session}/answers', 'answer', 11),
+    ('interview-finish', 'patch', '/api/interviews/{session}/finish', None, 15),
+    ('interview-report', 'get', '/api/interviews/{completed}/report', None, 5),
+    ('upgrade-plan', 'get', '/api/interviews/{completed}/upgrade-plan', None, 19),
+    ('analytics-overview', 'get', '/api/analytics/overview', None, 5),
+    ('analytics-skills', 'get', '/api/analytics/skills', None, 1),
+    ('analytics-sessions', 'get', '/api/analytics/sessions', None, 1),
+]
+
+# Endpoints not measured here, with the reason
+EXCLUDED = {
+    'cv-upload': 'dominated by file parsing and LLM extraction; covered by tests/integration/test_cv_flow.py',
+    'job-posting-parse': 'a single LLM call without database access',
+}
+
+
+def _url_names(patterns, prefix=''):
+    """Names of all URL patterns under /api/."""
+    names = set()
+    for pattern in patterns:
+        route = prefix + str(pattern.pattern)
+        if isinstance(pattern, URLResolver):
+            names |= _url_names(pattern.url_patterns, route)
+        elif isinstance(pattern, URLPattern) and route.startswith('api/') and pattern.name:
+            names.add(pattern.name)
+    return names
+
+
+@override_settings(USE_LLM_FOR_QUESTIONS=False, ANSWER_GRADING_MODE='heuristic')
+class QueryBudgetTests(TestCase):
+    """Per-endpoint SQL query budgets that do not grow with data size."""
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.role = RoleCatalog.objects.create(
+            name='Backend Engineer',
+            category='backend',
+            description='Backend development role',
+            keywords_json=['python', 'django', 'postgresql'],
+            level_keywords_json={'junior': ['python'], 'mid': ['django'], 'senior': ['architecture']}
+        )
+        cls.fixtures = {
+            'small': cls._seed_user('small@example.com', SMALL_HISTORY),
+            'large': cls._seed_user('large@example.com', LARGE_HISTORY),
+        }
+    
+    @classmethod
+    def _seed_user(cls, email, history):
+        user = User.objects.create_user(email=email, password='testpass123')
+        cv = CVDocument.objects.create(
+            user=user,
+            file='cv_documents/cv.pdf',
+            status='completed',
+            extracted_text='Python Django PostgreSQL developer',
+            file_size=1024,
+            mime_type='application/pdf'
+        )
+        Profile.objects.create(user=user, cv_document=cv, data_json={'skills': ['Python', 'Django']})
+        RoleSuggestion.objects.create(cv_document=cv, role=cls.role, score='0.90', reasons_json=['Python'])
+        
+        completed = [
+            cls._seed_session(user, 'completed', days_ago=history - i, answered=QUESTIONS_PER_SESSION)
+            for i in range(history)
+        ]
+        session = cls._seed_session(user, 'in_progress', days_ago=0, answered=QUESTIONS_PER_SESSION - 1)
+        rebuild_user_skill_stats(user.id)
+        
+        return {
+            'user': user,
+            'session': session.id,
+            'completed': completed[-1].id,
+            'cv': cv.id,
+        }
+    
+    @classmethod
+    def _seed_session(cls, user, status, days_ago, answered):
+        ended_at = timezone.now() - timedelta(days=days_ago)
+        session = InterviewSession.objects.create(
+            user=user,
+            role_selected=cls.role,
+            level='mid',
+            type='technical',
+            status=status,
+            overall_score=70 if status == 'completed' else None,
+            ended_at=ended_at if status == 'completed' else None,
+            question_count=QUESTIONS_PER_SESSION,
+            answered_count=answered
+        )
+        questions = InterviewQuestion.objects.bulk_create([
+            InterviewQuestion(
+                session=session,
+                order=order * QUESTION_ORDER_STEP,
+                question_text=f'Question {order} about Django and PostgreSQL',
+                category='technical',
+                difficulty='hard' if order % 4 == 0 else 'medium',
+                skill_tags_json=['backend.django', f'backend.skill{order % 5}']
+            )
+            for order in range(1, QUESTIONS_PER_SESSION + 1)
+        ])
+        InterviewAnswer.objects.bulk_create([
+            InterviewAnswer(
+                question=question,
+                answer_text='First, I would index the table because the query was slow.',
+                time_seconds=90,
+                scores_json=SCORES,
+                feedback_json=FEEDBACK,
+                skill_tags_json=question.skill_tags_json
+            )
+            for question in questions[:answered]
+        ])
+        if status == 'completed':
+            build_session_report(session)
+        return session
+    
+    def _request_data(self, kind, fixture):
+        user = fixture['user']
+        if kind == 'register':
+            return {'email': f'new-{user.email}', 'password': 'Newpass123!', 'password2': 'Newpass123!'}
+        if kind == 'login':
+            return {'email': user.email, 'password': 'testpass123'}
+        if kind == 'refresh':
+            return {'refresh': str(RefreshToken.for_user(user))}
+        if kind == 'create_session':
+            return {'role_id': str(self.role.id), 'level': 'mid', 'type': 'technical'}
+        if kind == 'answer':
+            question = InterviewQuestion.objects.filter(
+                session_id=fixture['session'], answer__isnull=True
+            ).first()
+            return {'question_id': str(question.id), 'answer_text': 'I would add an index.', 'time_seconds': 60}
+        return None
+    
+    def _call(self, method, path, data, fixture):
+        client = APIClient()
+        client.force_authenticate(user=fixture['user'])
+        
+        # Measure the uncached path of the analytics response cache
+        cache.clear()
+        
+        # Every call is rolled back, so both users see the same starting data
+        with transaction.atomic():
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                response = getattr(client, method)(path, data, format='json')
+                if response.streaming:
+                    b''.join(response.streaming_content)
+                elapsed_ms = (time.perf_counter() - started) * 1000
+            transaction.set_rollback(True)
+        
+        self.assertLess(response.status_code, 400, f'{method.upper()} {path}: {response.status_code}')
+        return len(queries), elapsed_ms
+    
+    def test_every_api_url_has_a_budget(self):
+        """Test new endpoints cannot be added without a query budget."""
+        budgeted = {name for name, *_ in ENDPOINTS}
+        self.assertEqual(_url_names(get_resolver().url_patterns) - budgeted - set(EXCLUDED), set())
+    
+    def test_query_budgets(self):
+        """Test each endpoint stays within its budget regardless of history size."""
+        report = {}
+        
+        for name, method, path_template, data_kind, budget in ENDPOINTS:
+            results = {}
+            for size, fixture in self.fixtures.items():
+                path = path_template.format(**fixture)
+                data = self._request_data(data_kind, fixture)
+                # Warm per-process caches (question pools, content types) first
+                self._call(method, path, data, fixture)
+                queries, elapsed_ms = self._call(method, path, self._request_data(data_kind, fixture), fixture)
+                results[size] = {'queries': queries, 'ms': round(elapsed_ms, 2)}
+            
+            report[name] = {'method': method.upper(), 'path': path_template, 'budget': budget, **results}
+        
+        self._write_report(report)
+        
+        for name, result in report.items():
+            with self.subTest(endpoint=name):
+                self.assertLessEqual(result['large']['queries'], result['budget'])
+                self.assertEqual(
+                    result['large']['queries'],
+                    result['small']['queries'],
+                    f'{name}: query count grows with history size'
+                )
+    
+    def _write_report(self, report):
+        path = os.environ.get(
+            'QUERY_BUDGET_REPORT',
+            os.path.join(tempfile.gettempdir(), 'query_budget_report.json')
+        )
+        with open(path, 'w') as f:
+            json.dump({
+                'history_sizes': {'small': SMALL_HISTORY, 'large': LARGE_HISTORY},
+                'questions_per_session': QUESTIONS_PER_SESSION,
+                'endpoints': report,
+            }, f, indent=2)
@@ -1,4 +1,5 @@
-import apiClient from './api'
+import apiClient, { API_BASE_URL } from './api'
+import { useAuthStore } from '../stores/auth'
 
 export const interviewService = {
   async createSession(data) {
@@ -16,8 +17,46 @@ export const interviewService = {
     return response.data
   },
 
+  async streamQuestions(id, { lastOrder = 0, onQuestion, signal } = {}) {
+    // EventSource cannot send the Authorization header, so read the SSE body with fetch
+    const authStore = useAuthStore()
+    const response = await fetch(`${API_BASE_URL}/interviews/${id}/questions/stream`, {
+      headers: {
+        Accept: 'text/event-stream',
+        Authorization: `Bearer ${authStore.accessToken}`,
+        'Last-Event-ID': String(lastOrder),
+      },
+      signal,
+    })
+    if (!response.ok) {
+      throw new Error(`Question stream failed with status ${response.status}`)
+    }
+
+    const reader = response.body.getReader()
+    const decoder = new TextDecoder()
+    let buffer = ''
+    let lastEvent = null
+    while (true) {
+      const { done, value } = await reader.read()
+      if (done) break
+      buffer += decoder.decode(value, { stream: true })
+      const messages = buffer.split('\n\n')
+      buffer = messages.pop()
+      for (const message of messages) {
+        const event = message.match(/^event: (.*)$/m)?.[1]
+        const data = JSON.parse(message.match(/^data: (.*)$/m)?.[1] || 'null')
+        lastEvent = { event, data }
+        if (event === 'question' && onQuestion) onQuestion(data)
+      }
+    }
+    return lastEvent
+  },
+
   async submitAnswer(id, answerData) {
-    const response = await apiClient.post(`/interviews/${id}/answers`, answerData)
+    // Retries of this request (e.g. after a token refresh) reuse the key
+    const response = await apiClient.post(`/interviews/${id}/answers`, answerData, {
+      headers: { 'Idempotency-Key': crypto.randomUUID() },
+    })
     return response.data
   },
 
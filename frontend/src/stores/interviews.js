@@ -57,6 +57,20 @@ export const useInterviewStore = defineStore('interviews', () => {
     }
   }
 
+  async function refreshQuestions(sessionId) {
+    // Pick up questions written in the background without moving the candidate
+    const data = await interviewService.getQuestions(sessionId)
+    const answers = new Map(questions.value.map(q => [q.id, q.answer]))
+    questions.value = (data.questions || []).map(q => ({ ...q, answer: q.answer || answers.get(q.id) || null }))
+    return data.questions
+  }
+
+  function addQuestion(question) {
+    // Questions streamed in while the rest of the set is still being generated
+    if (questions.value.some(q => q.id === question.id)) return
+    questions.value = [...questions.value, question].sort((a, b) => a.order - b.order)
+  }
+
   async function submitAnswer(sessionId, answerData) {
     isLoading.value = true
     error.value = null
@@ -66,6 +80,10 @@ export const useInterviewStore = defineStore('interviews', () => {
       if (questionToUpdate) {
         questionToUpdate.answer = data
       }
+      // Follow-ups are inserted right after the answered question
+      if (data.followup_question) {
+        addQuestion(data.followup_question)
+      }
       await fetchSession(sessionId)
       return data
     } catch (err) {
@@ -106,6 +124,8 @@ export const useInterviewStore = defineStore('interviews', () => {
     createSession,
     fetchSession,
     fetchQuestions,
+    refreshQuestions,
+    addQuestion,
     submitAnswer,
     finishSession,
     setCurrentQuestionIndex,